@@ -1,26 +1,313 @@
+import io
+import json
+import mmap
 import os
+import queue
+import struct
+import threading
+import wave
+from collections import OrderedDict
+
 import pygame
 
+# Asset pack layout: header, JSON index, then aligned raw blobs
+PACK_MAGIC = b"PNPK"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sHII")  # magic, version, index length, data start
+PACK_ALIGNMENT = 16
+
+# Sounds worth decoding ahead of the moment they are needed
+PREFETCH_HINTS = {
+    "night_start": ["electrical_hum.wav", "air_conditioning.wav", "door_close.wav", "light_switch.wav"],
+    "camera_opened": ["camera_static.wav"],
+    "animatronic_near": ["generated_jumpscare.wav", "jumpscare.wav"],
+}
+
+
+class SoundCache:
+    """Decoded sounds keyed by filename, decoded on first use.
+
+    Decoded audio is kept under memory_budget bytes. When over budget the
+    least recently used sounds that are not currently playing are dropped;
+    they are decoded again the next time they are asked for.
+    """
+
+    def __init__(self, manifest, decode, memory_budget=32 * 1024 * 1024):
+        self.manifest = manifest
+        self.decode = decode
+        self.memory_budget = memory_budget
+        self.used_bytes = 0
+        self.decoded = OrderedDict()  # filename -> (sound, bytes)
+        self.lock = threading.RLock()
+
+    def get(self, filename, default=None):
+        with self.lock:
+            entry = self.decoded.get(filename)
+            if entry is not None:
+                self.decoded.move_to_end(filename)
+                return entry[0]
+
+        if filename not in self.manifest:
+            return default
+        sound = self.decode(filename)
+
+        with self.lock:
+            # Another thread may have decoded it meanwhile
+            entry = self.decoded.get(filename)
+            if entry is not None:
+                return entry[0]
+            self.add(filename, sound)
+        return sound
+
+    def __getitem__(self, filename):
+        sound = self.get(filename)
+        if sound is None:
+            raise KeyError(filename)
+        return sound
+
+    def __contains__(self, filename):
+        return filename in self.manifest
+
+    def __setitem__(self, filename, sound):
+        with self.lock:
+            self.discard(filename)
+            self.add(filename, sound)
+
+    def __len__(self):
+        return len(self.manifest)
+
+    def __iter__(self):
+        return iter(self.manifest)
+
+    def is_decoded(self, filename):
+        return filename in self.decoded
+
+    def add(self, filename, sound):
+        size = sound_size(sound)
+        self.decoded[filename] = (sound, size)
+        self.used_bytes += size
+        self.evict()
+
+    def discard(self, filename):
+        entry = self.decoded.pop(filename, None)
+        if entry is not None:
+            self.used_bytes -= entry[1]
+
+    def evict(self):
+        """Drop idle sounds, oldest first, until back under budget"""
+        if self.used_bytes <= self.memory_budget:
+            return
+        for filename in list(self.decoded)[:-1]:
+            if self.used_bytes <= self.memory_budget:
+                break
+            sound, size = self.decoded[filename]
+            if sound.get_num_channels() == 0:
+                del self.decoded[filename]
+                self.used_bytes -= size
+
+
+def sound_size(sound):
+    """Bytes of decoded sample data held by a Sound"""
+    frequency, size, channels = pygame.mixer.get_init() or (44100, -16, 2)
+    return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+
+class AssetPack:
+    """Read-only view of an archive written by assets/build_pack.py.
+
+    The file is memory-mapped once; sounds and images are created straight
+    from slices of the mapping without opening or parsing other files. The
+    mapping is copy-on-write, so drawing on an image only copies the pages
+    it touches and never writes back to the file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.view = memoryview(self.data)
+
+        magic, version, index_length, self.data_start = PACK_HEADER.unpack_from(self.data)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{path} is not a version {PACK_VERSION} asset pack")
+        index = json.loads(bytes(self.view[PACK_HEADER.size:PACK_HEADER.size + index_length]))
+        self.sounds = index["sounds"]
+        self.images = index["images"]
+
+    def slice(self, entry):
+        start = self.data_start + entry["offset"]
+        return self.view[start:start + entry["length"]]
+
+    def sound(self, name):
+        entry = self.sounds[name]
+        frequency, size, channels = pygame.mixer.get_init()
+        if (entry["frequency"], abs(size), entry["channels"]) == (frequency, entry["bits"], channels):
+            return pygame.mixer.Sound(buffer=self.slice(entry))
+
+        # Mixer opened with another format; let SDL convert a WAV wrapper
+        return pygame.mixer.Sound(file=self._as_wav(entry))
+
+    def _as_wav(self, entry):
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as f:
+            f.setnchannels(entry["channels"])
+            f.setsampwidth(entry["bits"] // 8)
+            f.setframerate(entry["frequency"])
+            f.writeframes(self.slice(entry))
+        buffer.seek(0)
+        return buffer
+
+    def image(self, name):
+        """Surface sharing memory with the mapping"""
+        entry = self.images[name]
+        return pygame.image.frombuffer(self.slice(entry), (entry["width"], entry["height"]),
+                                       entry["format"])
+
+    def close(self):
+        """Release the mapping; images made from it must be dropped first"""
+        self.view.release()
+        self.data.close()
+
+
 class AssetLoader:
-    def __init__(self):
-        self.sounds = {}
+    def __init__(self, memory_budget=32 * 1024 * 1024):
+        self.manifest = {}
+        self.sounds = SoundCache(self.manifest, self._decode_sound, memory_budget)
+        self.images = {}
+        self.pack = None
         self.base_sound_path = "assets/sounds"
         self.generated_path = "assets/generated"
+        self.image_path = "assets/images"
+        self.manifest_path = "assets/data/asset_manifest.json"
+        self.pack_path = "assets/assets.pack"
 
-    def load_all_assets(self):
+        self.prefetch_queue = queue.Queue()
+        self.prefetch_thread = None
+
+    def load_all_assets(self, eager=False):
+        """Index every sound; decode them all up front only if eager"""
         pygame.mixer.init()
-        self._load_sounds_from_folder(self.base_sound_path)
-        self._load_sounds_from_folder(self.generated_path)
+        if os.path.exists(self.pack_path):
+            self.load_pack(self.pack_path)
+
+        if os.path.exists(self.manifest_path):
+            self.load_manifest(self.manifest_path)
+        else:
+            self.index_sound_folders()
+
+        if eager:
+            for filename in list(self.manifest):
+                self.sounds.get(filename)
+
+    def load_pack(self, path):
+        """Memory-map an asset pack; its sounds win over loose files"""
+        self.pack = AssetPack(path)
+        for name in self.pack.sounds:
+            self.manifest[name] = path
+
+    def close(self):
+        """Drop pack images and release the pack's mapping"""
+        if self.pack is not None:
+            for name in self.pack.images:
+                self.images.pop(name, None)
+            self.pack.close()
+            self.pack = None
+
+    def load_manifest(self, path):
+        """Read filename -> path entries written by save_manifest"""
+        with open(path) as f:
+            for filename, sound_path in json.load(f)["sounds"].items():
+                self.manifest.setdefault(filename, sound_path)
 
-    def _load_sounds_from_folder(self, folder):
+    def save_manifest(self, path=None):
+        """Write the current loose-file index so later runs skip the folder walk"""
+        loose = {name: sound_path for name, sound_path in self.manifest.items()
+                 if not self._in_pack(name)}
+        with open(path or self.manifest_path, "w") as f:
+            json.dump({"sounds": loose}, f, indent=4, sort_keys=True)
+
+    def _in_pack(self, filename):
+        return self.pack is not None and filename in self.pack.sounds \
+            and self.manifest.get(filename) == self.pack.path
+
+    def _decode_sound(self, filename):
+        if self._in_pack(filename):
+            return self.pack.sound(filename)
+        return pygame.mixer.Sound(self.manifest[filename])
+
+    def get_image(self, filename):
+        """Image from the asset pack, or loaded from disk.
+
+        Images are keyed by file name, as in the pack, whichever source they
+        come from; a bare name is looked for in assets/images and a path is
+        loaded as given.
+        """
+        name = os.path.basename(filename)
+        image = self.images.get(name)
+        if image is None:
+            if self.pack is not None and name in self.pack.images:
+                image = self.pack.image(name)
+            else:
+                path = filename if os.path.dirname(filename) else os.path.join(self.image_path, name)
+                image = pygame.image.load(path)
+            self.images[name] = image
+        return image
+
+    def index_sound_folders(self):
+        """Index loose WAVs; generated sounds override same-named ones in assets/sounds"""
+        loose = {}
+        for folder in (self.base_sound_path, self.generated_path):
+            self._index_sounds_in_folder(folder, loose)
+        for filename, sound_path in loose.items():
+            # Sounds from the pack still win
+            self.manifest.setdefault(filename, sound_path)
+
+    def _index_sounds_in_folder(self, folder, found):
         if not os.path.exists(folder):
             return
 
-        for file in os.listdir(folder):
-            if file.endswith(".wav"):
-                path = os.path.join(folder, file)
-                self.sounds[file] = pygame.mixer.Sound(path)
+        for root, _, files in os.walk(folder):
+            for file in sorted(files):
+                if file.endswith(".wav"):
+                    found[file] = os.path.join(root, file)
 
     def load_generated_sound(self, path):
         filename = os.path.basename(path)
+        self.manifest[filename] = path
         self.sounds[filename] = pygame.mixer.Sound(path)
+
+    def prefetch(self, filenames):
+        """Decode sounds on a background thread before they are played"""
+        for filename in filenames:
+            if filename in self.manifest and not self.sounds.is_decoded(filename):
+                self.prefetch_queue.put(filename)
+
+        if self.prefetch_thread is None:
+            self.prefetch_thread = threading.Thread(target=self._prefetch_worker, daemon=True)
+            self.prefetch_thread.start()
+
+    def prefetch_hint(self, hint):
+        """Warm up the sounds associated with a game event, see PREFETCH_HINTS"""
+        self.prefetch(PREFETCH_HINTS.get(hint, []))
+
+    def _prefetch_worker(self):
+        while True:
+            filename = self.prefetch_queue.get()
+            try:
+                self.sounds.get(filename)
+            except pygame.error as e:
+                print(f"⚠️ Could not prefetch {filename}: {e}")
+
+
+def build_manifest():
+    """Walk the sound folders once and save the index AssetLoader reads at startup.
+
+    Paths are relative to the repository root, so run this from there like
+    the game itself.
+    """
+    loader = AssetLoader()
+    loader.index_sound_folders()
+    os.makedirs(os.path.dirname(loader.manifest_path), exist_ok=True)
+    loader.save_manifest()
+    print(f"🗂️ Indexed {len(loader.manifest)} sounds in {loader.manifest_path}")
+    return loader.manifest
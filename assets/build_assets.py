@@ -0,0 +1,172 @@
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from assets.asset_loader import build_manifest
+
+ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(ASSETS_DIR)
+CACHE_PATH = os.path.join(ASSETS_DIR, ".build_cache.json")
+
+# Generator modules and the classes whose create_* methods are build jobs
+GENERATORS = [
+    ("assets.generate_audio", "AudioGenerator"),
+    ("assets.generate_images", "ImageGenerator"),
+]
+
+
+def discover_jobs():
+    """Every create_* method of every generator, as (job name, module, class, method)"""
+    jobs = []
+    for module_name, class_name in GENERATORS:
+        cls = getattr(importlib.import_module(module_name), class_name)
+        for method in sorted(name for name in vars(cls) if name.startswith("create_")):
+            jobs.append((f"{class_name}.{method}", module_name, class_name, method))
+    return jobs
+
+
+def shared_source(module_name):
+    """Module source with every generator's create_* methods cut out.
+
+    This is everything a job can depend on besides its own method: imports,
+    constants, module-level helpers and the non-create_* class members.
+    """
+    module = importlib.import_module(module_name)
+    source = inspect.getsource(module)
+    for job_module, class_name in GENERATORS:
+        if job_module != module_name:
+            continue
+        cls = getattr(module, class_name)
+        for name, member in vars(cls).items():
+            if name.startswith("create_") and callable(member):
+                source = source.replace(inspect.getsource(member), "")
+    return source
+
+
+def job_hash(module_name, class_name, method):
+    """Hash of the job's own code plus the module code it shares with other jobs.
+
+    Editing one create_* method only invalidates that job; editing anything
+    else in the module, including __init__ where the generator's parameters
+    live, invalidates all of its jobs.
+    """
+    cls = getattr(importlib.import_module(module_name), class_name)
+    digest = hashlib.sha256()
+    digest.update(inspect.getsource(getattr(cls, method)).encode())
+    digest.update(shared_source(module_name).encode())
+    return digest.hexdigest()
+
+
+def run_job(job):
+    """Worker entry point: run one generator method in a private directory"""
+    name, module_name, class_name, method = job
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+
+    workdir = tempfile.mkdtemp(prefix="asset_build_")
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        module = importlib.import_module(module_name)
+        module.create_directories()
+        generator = getattr(module, class_name)()
+
+        start = time.perf_counter()
+        getattr(generator, method)()
+        elapsed = time.perf_counter() - start
+    except Exception:
+        shutil.rmtree(workdir, ignore_errors=True)
+        raise
+    finally:
+        # Pool workers are reused; never leave one inside a directory that gets removed
+        os.chdir(previous_cwd)
+
+    outputs = []
+    for root, _, files in os.walk(workdir):
+        outputs.extend(os.path.relpath(os.path.join(root, file), workdir) for file in files)
+    return name, elapsed, sorted(outputs), workdir
+
+
+def load_cache():
+    if os.path.exists(CACHE_PATH):
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    return {}
+
+
+def save_cache(cache):
+    with open(CACHE_PATH, "w") as f:
+        json.dump(cache, f, indent=4, sort_keys=True)
+
+
+def is_up_to_date(entry, digest):
+    return (entry is not None and entry["hash"] == digest
+            and all(os.path.exists(os.path.join(ASSETS_DIR, path)) for path in entry["outputs"]))
+
+
+def build(selected=None, force=False, workers=None):
+    """Run every out-of-date job on a process pool and report timings"""
+    cache = load_cache()
+    jobs = [job for job in discover_jobs() if not selected or job[0] in selected]
+
+    pending = []
+    for job in jobs:
+        digest = job_hash(*job[1:])
+        if force or not is_up_to_date(cache.get(job[0]), digest):
+            pending.append((job, digest))
+        else:
+            print(f"⏭️  {job[0]:<45} up to date")
+
+    total_start = time.perf_counter()
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_job, job): (job[0], digest) for job, digest in pending}
+        for future in as_completed(futures):
+            try:
+                name, elapsed, outputs, workdir = future.result()
+            except Exception as e:
+                # Left out of the cache so the next build retries it
+                failed.append(futures[future][0])
+                print(f"❌ {futures[future][0]:<45} {type(e).__name__}: {e}")
+                continue
+            for path in outputs:
+                target = os.path.join(ASSETS_DIR, path)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.move(os.path.join(workdir, path), target)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+            cache[name] = {"hash": futures[future][1], "outputs": outputs, "seconds": round(elapsed, 3)}
+            save_cache(cache)
+            print(f"✅ {name:<45} {elapsed:7.2f}s  {len(outputs)} file(s)")
+
+    built = len(pending) - len(failed)
+    print(f"🔨 Built {built} of {len(jobs)} asset jobs in {time.perf_counter() - total_start:.2f}s")
+    if failed:
+        print(f"⚠️ {len(failed)} job(s) failed: {', '.join(sorted(failed))}")
+    build_manifest()
+    return cache
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel, incremental asset build")
+    parser.add_argument("jobs", nargs="*", help="job names such as AudioGenerator.create_footsteps")
+    parser.add_argument("--force", action="store_true", help="rebuild even if inputs are unchanged")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--list", action="store_true", help="list job names and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for job in discover_jobs():
+            print(job[0])
+    else:
+        build(args.jobs, args.force, args.workers)
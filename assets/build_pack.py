@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import wave
+
+import numpy as np
+import pygame
+
+from assets.asset_loader import PACK_ALIGNMENT, PACK_HEADER, PACK_MAGIC, PACK_VERSION, build_manifest
+
+
+def read_wav(path, frequency, channels):
+    """Read a PCM WAV as int16 samples converted to the mixer's format"""
+    with wave.open(path, "rb") as f:
+        if f.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM is supported")
+        source_channels = f.getnchannels()
+        source_frequency = f.getframerate()
+        samples = np.frombuffer(f.readframes(f.getnframes()), dtype="<i2")
+
+    samples = samples.reshape(-1, source_channels)
+    if source_frequency != frequency:
+        length = int(round(len(samples) * frequency / source_frequency))
+        source_time = np.arange(len(samples)) / source_frequency
+        target_time = np.arange(length) / frequency
+        samples = np.stack([np.interp(target_time, source_time, samples[:, c])
+                            for c in range(source_channels)], axis=1).astype("<i2")
+
+    if source_channels == 1 and channels == 2:
+        samples = np.repeat(samples, 2, axis=1)
+    elif source_channels == 2 and channels == 1:
+        samples = samples.mean(axis=1, keepdims=True).astype("<i2")
+    return np.ascontiguousarray(samples).tobytes()
+
+
+def collect(folders, extension):
+    """Map file name to path for every matching file; later folders win, as in AssetLoader"""
+    found = {}
+    for folder in folders:
+        if not os.path.exists(folder):
+            continue
+        for root, _, files in os.walk(folder):
+            for file in sorted(files):
+                if file.endswith(extension):
+                    found[file] = os.path.join(root, file)
+    return found
+
+
+def build_pack(output, sound_folders, image_folders, frequency=44100, channels=2):
+    """Write every WAV and PNG into one indexed, mmap-friendly archive.
+
+    Sounds are stored as raw 16-bit PCM already in the mixer's format so the
+    loader can hand slices straight to pygame.mixer.Sound(buffer=...).
+    Images are stored as raw RGBA for pygame.image.frombuffer.
+    """
+    pygame.init()
+    blobs = []
+    index = {"sounds": {}, "images": {}}
+
+    for name, path in sorted(collect(sound_folders, ".wav").items()):
+        data = read_wav(path, frequency, channels)
+        index["sounds"][name] = {"frequency": frequency, "channels": channels, "bits": 16,
+                                 "length": len(data)}
+        blobs.append(("sounds", name, data))
+
+    for name, path in sorted(collect(image_folders, ".png").items()):
+        image = pygame.image.load(path)
+        data = pygame.image.tobytes(image, "RGBA")
+        index["images"][name] = {"width": image.get_width(), "height": image.get_height(),
+                                 "format": "RGBA", "length": len(data)}
+        blobs.append(("images", name, data))
+
+    # Blob offsets are relative to the aligned start of the data section
+    def align(value):
+        return -(-value // PACK_ALIGNMENT) * PACK_ALIGNMENT
+
+    offset = 0
+    for kind, name, data in blobs:
+        index[kind][name]["offset"] = offset
+        offset = align(offset + len(data))
+
+    index_bytes = json.dumps(index, sort_keys=True).encode("utf-8")
+    data_start = align(PACK_HEADER.size + len(index_bytes))
+
+    with open(output, "wb") as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes), data_start))
+        f.write(index_bytes)
+        for kind, name, data in blobs:
+            f.seek(data_start + index[kind][name]["offset"])
+            f.write(data)
+        f.truncate(data_start + offset)
+
+    print(f"📦 Packed {len(index['sounds'])} sounds and {len(index['images'])} images into {output}")
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack sounds and images into one archive")
+    parser.add_argument("--output", default=os.path.join("assets", "assets.pack"))
+    parser.add_argument("--sounds", action="append",
+                        help="sound folder to pack; repeatable (default: assets/sounds and assets/generated)")
+    parser.add_argument("--images", action="append",
+                        help="image folder to pack; repeatable (default: assets/images)")
+    parser.add_argument("--frequency", type=int, default=44100)
+    parser.add_argument("--channels", type=int, default=2)
+    args = parser.parse_args()
+    if args.sounds is None:
+        args.sounds = [os.path.join("assets", "sounds"), os.path.join("assets", "generated")]
+    if args.images is None:
+        args.images = [os.path.join("assets", "images")]
+    build_pack(args.output, args.sounds, args.images, args.frequency, args.channels)
+    build_manifest()
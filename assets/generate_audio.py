@@ -3,55 +3,124 @@ import scipy.io.wavfile as wav
 import os
 from scipy import signal
 import random
+from collections import OrderedDict
 
-# Create directories
-os.makedirs('sounds/sfx', exist_ok=True)
-os.makedirs('sounds/ambient', exist_ok=True)
-os.makedirs('sounds/music', exist_ok=True)
+
+def create_directories():
+    """Create output directories relative to the working directory"""
+    os.makedirs('sounds/sfx', exist_ok=True)
+    os.makedirs('sounds/ambient', exist_ok=True)
+    os.makedirs('sounds/music', exist_ok=True)
 
 
 class AudioGenerator:
-    def __init__(self):
-        self.sample_rate = 44100
+    def __init__(self, sample_rate=44100, max_cache_bytes=64 * 1024 * 1024):
+        self.sample_rate = sample_rate
+        self.max_cache_bytes = max_cache_bytes  # per cache, evicted least recently used first
+        self.time_bases = OrderedDict()  # (duration, samples) -> read-only time axis
+        self.oscillators = OrderedDict()  # (frequency, duration, samples) -> read-only unit sine
+        self.envelopes = OrderedDict()  # (samples, attack, decay, sustain, release) -> envelope
+        self.cache_bytes = {}  # id(cache) -> bytes held
+
+    def samples(self, duration):
+        return int(self.sample_rate * duration)
+
+    def time_base(self, duration, samples=None):
+        """Shared time axis for a duration, same spacing as np.linspace(0, duration, n)"""
+        samples = samples or self.samples(duration)
+        return self._cached(self.time_bases, (duration, samples),
+                            lambda: np.linspace(0, duration, samples))
+
+    def _cached(self, cache, key, build):
+        table = cache.get(key)
+        if table is not None:
+            cache.move_to_end(key)
+            return table
+
+        table = build()
+        table.flags.writeable = False
+        if table.nbytes > self.max_cache_bytes:
+            return table
+
+        cache[key] = table
+        held = self.cache_bytes.get(id(cache), 0) + table.nbytes
+        while held > self.max_cache_bytes:
+            _, evicted = cache.popitem(last=False)
+            held -= evicted.nbytes
+        self.cache_bytes[id(cache)] = held
+        return table
+
+    def oscillator(self, frequency, duration, samples=None):
+        """Cached unit-amplitude sine table; treat as read-only"""
+        t = self.time_base(duration, samples)
+        return self._cached(self.oscillators, (frequency, duration, len(t)),
+                            lambda: np.sin(2 * np.pi * frequency * t))
 
     def generate_sine_wave(self, frequency, duration, amplitude=0.5):
         """Generate a sine wave"""
-        t = np.linspace(0, duration, int(self.sample_rate * duration))
-        wave = amplitude * np.sin(2 * np.pi * frequency * t)
-        return wave
-
-    def generate_noise(self, duration, color='white'):
-        """Generate colored noise"""
-        samples = int(self.sample_rate * duration)
+        return amplitude * self.oscillator(frequency, duration)
+
+    def add_sine(self, out, frequency, amplitude=0.5):
+        """Accumulate a sine wave into out in place; out's length sets the duration"""
+        wave = self.oscillator(frequency, len(out) / self.sample_rate, len(out))
+        out += amplitude * wave
+        return out
+
+    def generate_sine_batch(self, frequencies, duration, amplitude=0.5):
+        """One sine wave per frequency as rows of a (len(frequencies), samples) array"""
+        t = self.time_base(duration)
+        phase = np.multiply.outer(np.asarray(frequencies, dtype=float), 2 * np.pi * t)
+        np.sin(phase, out=phase)
+        phase *= amplitude
+        return phase
+
+    def generate_noise(self, duration, color='white', count=None):
+        """Generate colored noise, one row per variation when count is given"""
+        samples = self.samples(duration)
+        shape = samples if count is None else (count, samples)
 
         if color == 'white':
-            noise = np.random.normal(0, 1, samples)
+            noise = np.random.normal(0, 1, shape)
         elif color == 'pink':
             # Simple pink noise approximation
-            white_noise = np.random.normal(0, 1, samples)
-            noise = signal.lfilter([1], [1, 0.5], white_noise)
+            white_noise = np.random.normal(0, 1, shape)
+            noise = signal.lfilter([1], [1, 0.5], white_noise, axis=-1)
 
-        return noise * 0.1
+        noise *= 0.1
+        return noise
 
-    def apply_envelope(self, wave, attack=0.1, decay=0.1, sustain=0.7, release=0.2):
-        """Apply ADSR envelope to wave"""
-        length = len(wave)
-        envelope = np.ones(length)
+    def envelope(self, length, attack=0.1, decay=0.1, sustain=0.7, release=0.2):
+        """Cached ADSR envelope of length samples; treat as read-only"""
+        def build():
+            envelope = np.ones(length)
+
+            # Attack
+            attack_samples = int(attack * length)
+            envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
 
-        # Attack
-        attack_samples = int(attack * length)
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+            # Decay
+            decay_samples = int(decay * length)
+            decay_end = attack_samples + decay_samples
+            envelope[attack_samples:decay_end] = np.linspace(1, sustain, decay_samples)
 
-        # Decay
-        decay_samples = int(decay * length)
-        decay_end = attack_samples + decay_samples
-        envelope[attack_samples:decay_end] = np.linspace(1, sustain, decay_samples)
+            # Release
+            release_samples = int(release * length)
+            envelope[-release_samples:] = np.linspace(sustain, 0, release_samples)
+            return envelope
 
-        # Release
-        release_samples = int(release * length)
-        envelope[-release_samples:] = np.linspace(sustain, 0, release_samples)
+        return self._cached(self.envelopes, (length, attack, decay, sustain, release), build)
 
-        return wave * envelope
+    def apply_envelope(self, wave, attack=0.1, decay=0.1, sustain=0.7, release=0.2):
+        """Apply ADSR envelope to wave, or to every row of a batch"""
+        return wave * self.envelope(wave.shape[-1], attack, decay, sustain, release)
+
+    def normalize(self, wave):
+        """Scale to a peak of 1, per row for a batch, in place"""
+        wave /= np.max(np.abs(wave), axis=-1, keepdims=True)
+        return wave
+
+    def write_wav(self, path, wave):
+        wav.write(path, self.sample_rate, (wave * 32767).astype(np.int16))
 
     def create_jumpscare_sound(self):
         """Create jumpscare sound effect"""
@@ -71,29 +140,27 @@ class AudioGenerator:
         combined = self.apply_envelope(combined, 0.01, 0.1, 0.8, 0.3)
 
         # Normalize
-        combined = combined / np.max(np.abs(combined))
+        self.normalize(combined)
 
-        wav.write('sounds/sfx/jumpscare.wav', self.sample_rate,
-                  (combined * 32767).astype(np.int16))
+        self.write_wav('sounds/sfx/jumpscare.wav', combined)
         print("✅ Jumpscare sound created")
 
-    def create_footsteps(self):
-        """Create footstep sound effects"""
-        for i in range(5):  # Create 5 different footstep sounds
-            duration = 0.3
+    def create_footsteps(self, count=5):
+        """Create footstep sound effects, all variations in one batch"""
+        duration = 0.3
 
-            # Low frequency thump with noise
-            wave = self.generate_sine_wave(80 + random.randint(-10, 10), duration, 0.6)
-            noise = self.generate_noise(duration) * 0.3
+        # Low frequency thump with noise
+        frequencies = [80 + random.randint(-10, 10) for _ in range(count)]
+        combined = self.generate_sine_batch(frequencies, duration, 0.6)
+        combined += self.generate_noise(duration, count=count) * 0.3
 
-            combined = wave + noise
-            combined = self.apply_envelope(combined, 0.01, 0.05, 0.3, 0.1)
+        combined = self.apply_envelope(combined, 0.01, 0.05, 0.3, 0.1)
 
-            # Normalize
-            combined = combined / np.max(np.abs(combined))
+        # Normalize
+        self.normalize(combined)
 
-            wav.write(f'sounds/sfx/footstep_{i + 1}.wav', self.sample_rate,
-                      (combined * 32767).astype(np.int16))
+        for i, footstep in enumerate(combined):
+            self.write_wav(f'sounds/sfx/footstep_{i + 1}.wav', footstep)
 
         print("✅ Footstep sounds created")
 
@@ -102,7 +169,7 @@ class AudioGenerator:
         duration = 1.5
 
         # Mechanical door sound - descending frequency sweep
-        t = np.linspace(0, duration, int(self.sample_rate * duration))
+        t = self.time_base(duration)
         frequency = 200 * np.exp(-t * 2)  # Exponential decay
 
         wave = 0.3 * np.sin(2 * np.pi * frequency * t)
@@ -114,10 +181,9 @@ class AudioGenerator:
         combined = self.apply_envelope(combined, 0.1, 0.2, 0.8, 0.5)
 
         # Normalize
-        combined = combined / np.max(np.abs(combined))
+        self.normalize(combined)
 
-        wav.write('sounds/sfx/door_close.wav', self.sample_rate,
-                  (combined * 32767).astype(np.int16))
+        self.write_wav('sounds/sfx/door_close.wav', combined)
         print("✅ Door sound created")
 
     def create_electrical_sounds(self):
@@ -128,19 +194,17 @@ class AudioGenerator:
         noise = self.generate_noise(duration) * 0.6
         combined = (wave + noise) * 0.5
         combined = self.apply_envelope(combined, 0.01, 0.05, 0.5, 0.1)
-        combined = combined / np.max(np.abs(combined))
+        self.normalize(combined)
 
-        wav.write('sounds/sfx/light_switch.wav', self.sample_rate,
-                  (combined * 32767).astype(np.int16))
+        self.write_wav('sounds/sfx/light_switch.wav', combined)
 
         # Camera static
         duration = 2.0
         static = self.generate_noise(duration, 'pink') * 0.3
         static = self.apply_envelope(static, 0.1, 0, 1.0, 0.1)
-        static = static / np.max(np.abs(static))
+        self.normalize(static)
 
-        wav.write('sounds/sfx/camera_static.wav', self.sample_rate,
-                  (static * 32767).astype(np.int16))
+        self.write_wav('sounds/sfx/camera_static.wav', static)
 
         print("✅ Electrical sounds created")
 
@@ -154,28 +218,26 @@ class AudioGenerator:
         combined = hum1 + hum2
 
         # Add some variation
-        t = np.linspace(0, duration, int(self.sample_rate * duration))
+        t = self.time_base(duration)
         variation = 0.02 * np.sin(2 * np.pi * 0.1 * t)  # Slow variation
         combined = combined * (1 + variation)
 
-        combined = combined / np.max(np.abs(combined))
+        self.normalize(combined)
 
-        wav.write('sounds/ambient/electrical_hum.wav', self.sample_rate,
-                  (combined * 32767).astype(np.int16))
+        self.write_wav('sounds/ambient/electrical_hum.wav', combined)
 
         # Air conditioning
         duration = 8.0
         noise = self.generate_noise(duration, 'pink') * 0.15
 
         # Add periodic variations (compressor cycling)
-        t = np.linspace(0, duration, int(self.sample_rate * duration))
+        t = self.time_base(duration)
         cycle = 0.5 * (1 + 0.3 * np.sin(2 * np.pi * 0.2 * t))
 
         ac_sound = noise * cycle
-        ac_sound = ac_sound / np.max(np.abs(ac_sound))
+        self.normalize(ac_sound)
 
-        wav.write('sounds/ambient/air_conditioning.wav', self.sample_rate,
-                  (ac_sound * 32767).astype(np.int16))
+        self.write_wav('sounds/ambient/air_conditioning.wav', ac_sound)
 
         print("✅ Ambient sounds created")
 
@@ -192,18 +254,17 @@ class AudioGenerator:
             wave = self.generate_sine_wave(base_freq, duration, 0.3)
 
             # Add harmonics for more robotic sound
-            wave += self.generate_sine_wave(base_freq * 1.5, duration, 0.2)
-            wave += self.generate_sine_wave(base_freq * 2, duration, 0.1)
+            self.add_sine(wave, base_freq * 1.5, 0.2)
+            self.add_sine(wave, base_freq * 2, 0.1)
 
             # Add mechanical noise
             noise = self.generate_noise(duration) * 0.2
 
             combined = wave + noise
             combined = self.apply_envelope(combined, 0.2, 0.3, 0.6, 0.4)
-            combined = combined / np.max(np.abs(combined))
+            self.normalize(combined)
 
-            wav.write(f'sounds/sfx/{name}_movement.wav', self.sample_rate,
-                      (combined * 32767).astype(np.int16))
+            self.write_wav(f'sounds/sfx/{name}_movement.wav', combined)
 
         print("✅ Animatronic sounds created")
 
@@ -214,30 +275,32 @@ class AudioGenerator:
         melody = [0, 2, 4, 2, 0, 0, 2, 4, 2, 0]  # Simple pattern
 
         duration_per_note = 0.5
-        total_duration = len(melody) * duration_per_note
+        note_samples = self.samples(duration_per_note)
+        played = [note_index for note_index in melody if note_index < len(notes)]
 
-        music = np.array([])
+        # Each note is rendered in place into its slice of one buffer
+        music = np.zeros(note_samples * len(played))
+        envelope = self.envelope(note_samples, 0.01, 0.1, 0.7, 0.2)
 
-        for note_index in melody:
-            if note_index < len(notes):
-                freq = notes[note_index]
-                note_wave = self.generate_sine_wave(freq, duration_per_note, 0.3)
+        for position, note_index in enumerate(played):
+            freq = notes[note_index]
+            note_wave = music[position * note_samples:(position + 1) * note_samples]
+            self.add_sine(note_wave, freq, 0.3)
 
-                # Music box timbre - add harmonics
-                note_wave += 0.2 * self.generate_sine_wave(freq * 2, duration_per_note, 0.3)
-                note_wave += 0.1 * self.generate_sine_wave(freq * 3, duration_per_note, 0.3)
+            # Music box timbre - add harmonics
+            self.add_sine(note_wave, freq * 2, 0.2 * 0.3)
+            self.add_sine(note_wave, freq * 3, 0.1 * 0.3)
 
-                note_wave = self.apply_envelope(note_wave, 0.01, 0.1, 0.7, 0.2)
-                music = np.concatenate([music, note_wave])
+            note_wave *= envelope
 
-        music = music / np.max(np.abs(music))
+        self.normalize(music)
 
-        wav.write('sounds/music/music_box.wav', self.sample_rate,
-                  (music * 32767).astype(np.int16))
+        self.write_wav('sounds/music/music_box.wav', music)
         print("✅ Music box melody created")
 
 
 if __name__ == "__main__":
+    create_directories()
     generator = AudioGenerator()
     generator.create_jumpscare_sound()
     generator.create_footsteps()
@@ -3,42 +3,123 @@ import os
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import numpy as np
 
-# Create directories
-os.makedirs('images/backgrounds', exist_ok=True)
-os.makedirs('images/animatronics', exist_ok=True)
-os.makedirs('images/ui', exist_ok=True)
-os.makedirs('images/cameras', exist_ok=True)
+
+def create_directories():
+    """Create output directories relative to the working directory"""
+    os.makedirs('images/backgrounds', exist_ok=True)
+    os.makedirs('images/animatronics', exist_ok=True)
+    os.makedirs('images/ui', exist_ok=True)
+    os.makedirs('images/cameras', exist_ok=True)
+
+
+def square_cover(height, width, ys, xs, size):
+    """Pixels covered by size x size squares at (ys, xs), clipped to the image.
+
+    Returns (flat pixel indices, index of the square that paints each one).
+    Where squares overlap the last one wins, as if drawn one at a time.
+    NumPy does not define which write wins for repeated fancy indices, so
+    overlaps are resolved here instead.
+    """
+    offsets = np.arange(size)
+    rows = np.minimum(ys[:, None, None] + offsets[None, :, None], height - 1)
+    cols = np.minimum(xs[:, None, None] + offsets[None, None, :], width - 1)
+    flat = (rows * width + cols).reshape(len(ys), -1)
+    owners = np.broadcast_to(np.arange(len(ys))[:, None], flat.shape).ravel()
+
+    # First occurrence in reverse paint order is the last square drawn
+    flat = flat.ravel()[::-1]
+    pixels, first = np.unique(flat, return_index=True)
+    return pixels, owners[::-1][first]
+
+
+def add_grain(pixels, base_color, count, size, brightness, rng):
+    """Scatter size x size grain squares brightened from base_color, in place.
+
+    Squares are painted in order so later ones cover earlier ones, the same
+    as drawing them one at a time.
+    """
+    height, width = pixels.shape[:2]
+    ys, xs = rng.integers(0, height, count), rng.integers(0, width, count)
+    shades = rng.integers(brightness[0], brightness[1], count)
+
+    covered, owners = square_cover(height, width, ys, xs, size)
+    grained = np.clip(np.asarray(base_color, dtype=np.int16) + shades[owners][:, None], 0, 255)
+    pixels[covered // width, covered % width, :3] = grained
+
+
+def static_noise(size, count, alpha=(50, 200), dot_size=2, rng=None):
+    """RGBA array of black and white dots on transparency; later dots cover earlier ones"""
+    rng = rng or np.random.default_rng()
+    width, height = size
+    pixels = np.zeros((height, width, 4), dtype=np.uint8)
+    ys, xs = rng.integers(0, height, count), rng.integers(0, width, count)
+    colors = np.where(rng.random(count) < 0.5, 255, 0).astype(np.uint8)
+    alphas = rng.integers(alpha[0], alpha[1], count).astype(np.uint8)
+    dots = np.stack([colors, colors, colors, alphas], axis=1)
+
+    covered, owners = square_cover(height, width, ys, xs, dot_size)
+    pixels[covered // width, covered % width] = dots[owners]
+    return pixels
+
+
+def to_surface(image):
+    """Copy a PIL image into a pygame Surface"""
+    return pygame.image.frombytes(image.tobytes(), image.size, image.mode)
 
 
 class ImageGenerator:
-    def __init__(self):
+    def __init__(self, screen_size=(1280, 720), camera_size=(800, 450), seed=None):
         pygame.init()
-        self.screen = pygame.Surface((1280, 720))
-
-    def create_security_room_background(self):
+        self.screen_size = screen_size
+        self.camera_size = camera_size
+        self.screen = pygame.Surface(screen_size)
+        self.rng = np.random.default_rng(seed)
+
+    def save(self, images):
+        for path, img in images.items():
+            img.save(f'images/{path}')
+
+    def generate_surfaces(self):
+        """Every image as an in-memory Surface keyed by its path under images/"""
+        images = {}
+        images.update(self.create_security_room_background(save=False))
+        images.update(self.create_animatronic_sprites(save=False))
+        images.update(self.create_camera_feeds(save=False))
+        images.update(self.create_ui_elements(save=False))
+        return {path: to_surface(img) for path, img in images.items()}
+
+    def create_security_room_background(self, save=True):
         """Create security room background"""
-        img = Image.new('RGB', (1280, 720), (20, 20, 30))
+        width, height = self.screen_size
+        sx, sy = width / 1280, height / 720
+        img = Image.new('RGB', self.screen_size, (20, 20, 30))
         draw = ImageDraw.Draw(img)
 
+        def box(x0, y0, x1, y1):
+            return [x0 * sx, y0 * sy, x1 * sx, y1 * sy]
+
         # Draw desk
-        draw.rectangle([0, 500, 1280, 720], fill=(40, 30, 20))
+        draw.rectangle(box(0, 500, 1280, 720), fill=(40, 30, 20))
 
         # Draw monitor bezels
-        draw.rectangle([200, 100, 1000, 450], fill=(10, 10, 10))
-        draw.rectangle([210, 110, 990, 440], fill=(0, 0, 0))
+        draw.rectangle(box(200, 100, 1000, 450), fill=(10, 10, 10))
+        draw.rectangle(box(210, 110, 990, 440), fill=(0, 0, 0))
 
         # Control panel
-        draw.rectangle([50, 580, 1230, 680], fill=(60, 60, 70))
+        draw.rectangle(box(50, 580, 1230, 680), fill=(60, 60, 70))
 
         # Buttons
         buttons = [(100, 620), (200, 620), (580, 620), (960, 620), (1080, 620)]
         for x, y in buttons:
-            draw.rectangle([x - 40, y - 20, x + 40, y + 20], fill=(100, 100, 100))
+            draw.rectangle(box(x - 40, y - 20, x + 40, y + 20), fill=(100, 100, 100))
 
-        img.save('images/backgrounds/security_room.png')
-        print("✅ Security room background created")
+        images = {'backgrounds/security_room.png': img}
+        if save:
+            self.save(images)
+            print("✅ Security room background created")
+        return images
 
-    def create_animatronic_sprites(self):
+    def create_animatronic_sprites(self, save=True):
         """Create simple animatronic sprites"""
         animatronics = {
             'freddy': (139, 69, 19),  # Brown
@@ -47,6 +128,7 @@ class ImageGenerator:
             'foxy': (200, 50, 50)  # Red
         }
 
+        images = {}
         for name, color in animatronics.items():
             # Normal sprite
             img = Image.new('RGBA', (200, 300), (0, 0, 0, 0))
@@ -63,16 +145,18 @@ class ImageGenerator:
             draw.ellipse([80, 45, 85, 50], fill=(0, 0, 0))
             draw.ellipse([115, 45, 120, 50], fill=(0, 0, 0))
 
-            img.save(f'images/animatronics/{name}.png')
+            images[f'animatronics/{name}.png'] = img
 
             # Jumpscare sprite (larger, distorted)
             jumpscare_img = img.resize((400, 600))
-            jumpscare_img = jumpscare_img.filter(ImageFilter.BLUR)
-            jumpscare_img.save(f'images/animatronics/{name}_jumpscare.png')
+            images[f'animatronics/{name}_jumpscare.png'] = jumpscare_img.filter(ImageFilter.BLUR)
 
-        print("✅ Animatronic sprites created")
+        if save:
+            self.save(images)
+            print("✅ Animatronic sprites created")
+        return images
 
-    def create_camera_feeds(self):
+    def create_camera_feeds(self, save=True, grain_per_pixel=100 / (800 * 450)):
         """Create camera feed backgrounds"""
         locations = {
             'show_stage': (100, 50, 150),
@@ -85,46 +169,54 @@ class ImageGenerator:
             'east_hall': (50, 30, 30)
         }
 
+        width, height = self.camera_size
+        sx, sy = width / 800, height / 450
+        grain_count = max(1, round(grain_per_pixel * width * height))
+
+        def box(x0, y0, x1, y1):
+            return [x0 * sx, y0 * sy, x1 * sx, y1 * sy]
+
+        images = {}
         for location, color in locations.items():
-            img = Image.new('RGB', (800, 450), color)
+            img = Image.new('RGB', self.camera_size, color)
             draw = ImageDraw.Draw(img)
 
             # Add some basic shapes for atmosphere
             if location == 'show_stage':
                 # Stage curtains
-                draw.rectangle([100, 50, 200, 400], fill=(150, 0, 0))
-                draw.rectangle([600, 50, 700, 400], fill=(150, 0, 0))
+                draw.rectangle(box(100, 50, 200, 400), fill=(150, 0, 0))
+                draw.rectangle(box(600, 50, 700, 400), fill=(150, 0, 0))
                 # Stage
-                draw.rectangle([200, 350, 600, 400], fill=(139, 69, 19))
+                draw.rectangle(box(200, 350, 600, 400), fill=(139, 69, 19))
 
             elif location == 'dining_area':
                 # Tables
                 for i in range(3):
                     for j in range(2):
                         x, y = 150 + i * 200, 200 + j * 100
-                        draw.ellipse([x, y, x + 80, y + 80], fill=(100, 70, 40))
+                        draw.ellipse(box(x, y, x + 80, y + 80), fill=(100, 70, 40))
 
             elif location == 'pirate_cove':
                 # Curtain
-                draw.rectangle([300, 0, 500, 450], fill=(100, 0, 100))
+                draw.rectangle(box(300, 0, 500, 450), fill=(100, 0, 100))
 
             # Add static grain effect
-            for _ in range(100):
-                x, y = np.random.randint(0, 800), np.random.randint(0, 450)
-                brightness = np.random.randint(0, 50)
-                color_with_grain = tuple(max(0, min(255, c + brightness)) for c in color)
-                draw.rectangle([x, y, x + 2, y + 2], fill=color_with_grain)
-
-            img.save(f'images/cameras/{location}.png')
+            pixels = np.array(img)
+            add_grain(pixels, color, grain_count, 3, (0, 50), self.rng)
+            images[f'cameras/{location}.png'] = Image.fromarray(pixels)
 
-        print("✅ Camera feed backgrounds created")
+        if save:
+            self.save(images)
+            print("✅ Camera feed backgrounds created")
+        return images
 
-    def create_ui_elements(self):
+    def create_ui_elements(self, save=True):
         """Create UI elements"""
+        images = {}
+
         # Power bar segments
         for i in range(10):
-            img = Image.new('RGBA', (30, 20), (0, 255, 0, 255))
-            img.save(f'images/ui/power_segment_{i}.png')
+            images[f'ui/power_segment_{i}.png'] = Image.new('RGBA', (30, 20), (0, 255, 0, 255))
 
         # Button states
         button_states = {
@@ -138,24 +230,22 @@ class ImageGenerator:
             img = Image.new('RGB', (100, 50), color)
             draw = ImageDraw.Draw(img)
             draw.rectangle([5, 5, 95, 45], outline=(255, 255, 255), width=2)
-            img.save(f'images/ui/{state}.png')
+            images[f'ui/{state}.png'] = img
 
         # Static overlay
-        static_img = Image.new('RGBA', (800, 450), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(static_img)
-
-        for _ in range(1000):
-            x, y = np.random.randint(0, 800), np.random.randint(0, 450)
-            alpha = np.random.randint(50, 200)
-            color = np.random.choice([(255, 255, 255), (0, 0, 0)])
-            draw.rectangle([x, y, x + 1, y + 1], fill=color + (alpha,))
-
-        static_img.save('images/ui/static_overlay.png')
+        width, height = self.camera_size
+        dot_count = round(1000 * width * height / (800 * 450))
+        static = static_noise(self.camera_size, dot_count, rng=self.rng)
+        images['ui/static_overlay.png'] = Image.fromarray(static, 'RGBA')
 
-        print("✅ UI elements created")
+        if save:
+            self.save(images)
+            print("✅ UI elements created")
+        return images
 
 
 if __name__ == "__main__":
+    create_directories()
     generator = ImageGenerator()
     generator.create_security_room_background()
     generator.create_animatronic_sprites()
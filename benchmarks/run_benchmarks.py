@@ -0,0 +1,260 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+# Headless: no window and no audio device; must be set before pygame.init
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from config import *
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.2  # fail when 20% slower than baseline
+
+BENCHMARKS = {}
+
+
+def benchmark(name, number):
+    """Register a setup function returning the callable to time `number` times per run"""
+    def register(setup):
+        BENCHMARKS[name] = (setup, number)
+        return setup
+    return register
+
+
+def make_screen():
+    if not pygame.get_init():
+        pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+@benchmark("ui.render_control_buttons", 500)
+def bench_control_buttons():
+    from game.ui_manager import UIManager
+    ui = UIManager(make_screen())
+    return lambda: ui.render_control_buttons(True, False, True, False, True)
+
+
+@benchmark("ui.render_camera_selection", 500)
+def bench_camera_selection():
+    from game.camera_system import CameraSystem
+    from game.ui_manager import UIManager
+    ui = UIManager(make_screen())
+    camera = CameraSystem()
+    camera.open_camera("kitchen")
+    return lambda: ui.render_camera_selection(camera)
+
+
+@benchmark("ui.render_power_display", 500)
+def bench_power_display():
+    from game.power_system import PowerSystem
+    from game.ui_manager import UIManager
+    ui = UIManager(make_screen())
+    power = PowerSystem()
+
+    def run():
+        power.current_power = (power.current_power - 0.37) % TOTAL_POWER
+        ui.render_power_display(power)
+    return run
+
+
+def camera_feed(show_static):
+    from game.animatronics import AIDirector
+    from game.camera_system import CameraSystem
+    screen = make_screen()
+    director = AIDirector()
+    camera = CameraSystem()
+    camera.open_camera("show_stage")
+
+    def run():
+        if show_static:
+            camera.show_static = True
+            camera.static_timer = (camera.static_timer + 1 / FPS) % 2.0
+        camera.render_camera_feed(screen, director)
+    return run
+
+
+@benchmark("camera.render_camera_feed", 300)
+def bench_camera_feed():
+    return camera_feed(show_static=False)
+
+
+@benchmark("camera.render_camera_feed_static", 300)
+def bench_camera_feed_static():
+    return camera_feed(show_static=True)
+
+
+@benchmark("ai.update_1000_ticks", 5)
+def bench_ai_update():
+    from game.animatronics import AIDirector
+    from game.camera_system import CameraSystem
+    camera = CameraSystem()
+
+    def run():
+        random.seed(0)
+        director = AIDirector()
+        for _ in range(1000):
+            director.update(1 / FPS, 3, 80, camera)
+    return run
+
+
+@benchmark("power.drain_power", 20000)
+def bench_drain_power():
+    from game.power_system import PowerSystem
+    power = PowerSystem()
+
+    def run():
+        power.drain_power(1 / FPS, True, True, False, True, False)
+        if power.is_power_out:
+            power.current_power = TOTAL_POWER
+            power.is_power_out = False
+    return run
+
+
+@benchmark("game.frame", 200)
+def bench_game_frame():
+    from game.audio_manager import NullAudioManager
+    from game.game_manager import GameManager
+    screen = make_screen()
+    game = GameManager(screen, NullAudioManager(), seed=0)
+    game.camera_system.open_camera("dining_area")
+
+    def run():
+        if game.game_state != "playing":
+            game.restart_night()
+            game.camera_system.open_camera("dining_area")
+        game.update(1 / FPS)
+        screen.fill(BLACK)
+        game.render()
+    return run
+
+
+@benchmark("game.snapshot_restore", 2000)
+def bench_snapshot_restore():
+    from game.audio_manager import NullAudioManager
+    from game.game_manager import GameManager
+    game = GameManager(make_screen(), NullAudioManager(), seed=0)
+    for _ in range(600):
+        game.update(1 / FPS)
+
+    def run():
+        game.restore_snapshot(game.snapshot())
+    return run
+
+
+@benchmark("env.vector_step_1024", 200)
+def bench_vector_env():
+    import itertools
+    import numpy as np
+    from game.environment import ACTIONS, VectorNightEnv
+    env = VectorNightEnv(1024, seed=0)
+    env.reset()
+    rng = np.random.default_rng(0)
+    actions = [rng.integers(0, len(ACTIONS), 1024) * (rng.random(1024) < 0.05) for _ in range(64)]
+    step = itertools.count()
+
+    def run():
+        env.step(actions[next(step) % len(actions)])
+    return run
+
+
+def time_benchmark(setup, number, repeat):
+    """Seconds per call for each of `repeat` runs of `number` calls"""
+    run = setup()
+    run()  # warm caches and lazy imports
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        timings.append((time.perf_counter() - start) / number)
+    return timings
+
+
+def run_benchmarks(selected=None, repeat=7):
+    results = {}
+    for name, (setup, number) in BENCHMARKS.items():
+        if selected and name not in selected:
+            continue
+        timings = time_benchmark(setup, number, repeat)
+        results[name] = {"median": statistics.median(timings), "min": min(timings),
+                         "number": number, "repeat": repeat}
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Names of benchmarks whose median is more than threshold slower than baseline"""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        ratio = result["median"] / reference["median"]
+        result["ratio"] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def print_results(results, regressions):
+    print(f"{'benchmark':<36}{'median':>12}{'min':>12}{'vs base':>10}")
+    for name, result in results.items():
+        ratio = f"{result['ratio']:.2f}x" if "ratio" in result else "-"
+        flag = "  ❌" if name in regressions else ""
+        print(f"{name:<36}{result['median'] * 1e6:10.1f}us{result['min'] * 1e6:10.1f}us{ratio:>10}{flag}")
+
+
+def main():
+    """Run from the repository root: python -m benchmarks.run_benchmarks"""
+    parser = argparse.ArgumentParser(description="Time the game's hot paths headless")
+    parser.add_argument("benchmarks", nargs="*", help="only run these (see --list)")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction of the baseline median")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    results = run_benchmarks(args.benchmarks, args.repeat)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+        print_results(results, [])
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    else:
+        print(f"⚠️ No baseline at {args.baseline}; run with --save-baseline first")
+
+    regressions = compare(results, baseline, args.threshold)
+    print_results(results, regressions)
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,10 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 
+# Simulation runs at a fixed rate, independent of FPS
+SIMULATION_TICK_RATE = 60  # ticks per second
+MAX_CATCH_UP_TICKS = 5  # per rendered frame; older backlog is dropped
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -21,10 +25,17 @@ POWER_DRAIN_BASE = 0.1  # per second
 POWER_DRAIN_CAMERA = 0.2
 POWER_DRAIN_DOOR = 0.5
 POWER_DRAIN_LIGHT = 0.3
+# Opt-in: animatronics also turn bold, as under 20% power, once an outage
+# at the current load is less than LOW_POWER_ETA seconds away
+LOW_POWER_ETA_AGGRESSION = False
+LOW_POWER_ETA = 30
 
 HOUR_DURATION = 85  # seconds per in-game hour
 TOTAL_HOURS = 6  # 12 AM to 6 AM
 
+# Fraction of camera static cells drawn as speckles
+STATIC_DENSITY = 0.01
+
 # Camera locations
 CAMERA_LOCATIONS = {
     'show_stage': (100, 100),
@@ -1,85 +1,134 @@
 import random
+from .event_scheduler import EventScheduler
+from .location_graph import get_location_graph
 from config import *
 
 
+def seeded_rng(seed, name):
+    """Independent generator for one subsystem, derived from a night seed"""
+    return random.Random(f"{seed}:{name}")
+
+
+def is_low_power(power_level, outage_eta=None):
+    """Under 20% power, or with LOW_POWER_ETA_AGGRESSION an outage due within LOW_POWER_ETA seconds"""
+    if power_level < 20:
+        return True
+    return LOW_POWER_ETA_AGGRESSION and outage_eta is not None and outage_eta < LOW_POWER_ETA
+
+
 class Animatronic:
-    def __init__(self, name, start_location):
+    def __init__(self, name, start_location, rng=None):
         self.name = name
+        self.rng = rng if rng is not None else random  # Anything with random's API
+        self.on_location_changed = None  # Callback(animatronic, old, new)
+        self.start_location = start_location
         self.current_location = start_location
         self.aggression = 1
         self.move_timer = 0
-        self.move_interval = random.uniform(3, 8)
+        self.move_interval = self.rng.uniform(3, 8)
         self.is_active = False
 
-    def update(self, dt, night_number, power_level):
+    @property
+    def current_location(self):
+        return self._current_location
+
+    @current_location.setter
+    def current_location(self, location):
+        old_location = getattr(self, '_current_location', None)
+        self._current_location = location
+        if self.on_location_changed is not None and location != old_location:
+            self.on_location_changed(self, old_location, location)
+
+    def update(self, dt, night_number, power_level, outage_eta=None):
         """Update animatronic behavior"""
         self.move_timer += dt
 
-        # Increase aggression based on night and power level
+        threshold = self.move_interval / self.effective_aggression(night_number, power_level, outage_eta)
+        if self.move_timer >= threshold:
+            self.on_move_timer()
+
+    def effective_aggression(self, night_number, power_level, outage_eta=None):
+        """Increase aggression based on night and power level"""
         effective_aggression = self.aggression * (1 + night_number * 0.3)
-        if power_level < 20:
+        if is_low_power(power_level, outage_eta):
             effective_aggression *= 1.5
+        return effective_aggression
 
-        if self.move_timer >= self.move_interval / effective_aggression:
-            self.attempt_move()
-            self.move_timer = 0
-            self.move_interval = random.uniform(2, 6)
+    def on_move_timer(self):
+        """Move timer ran out: try to move and pick the next interval"""
+        self.attempt_move()
+        self.move_timer = 0
+        self.move_interval = self.rng.uniform(2, 6)
 
     def attempt_move(self):
         """Attempt to move to next location"""
-        if random.random() < 0.3:  # 30% chance to move
+        if self.rng.random() < 0.3:  # 30% chance to move
             self.move_to_next_location()
 
     def move_to_next_location(self):
         """Override in subclasses"""
         pass
 
+    def return_to_start(self):
+        """Send animatronic back to its starting location after a closed door"""
+        self.current_location = self.start_location
+
 
-class Freddy(Animatronic):
-    def __init__(self):
-        super().__init__("freddy", "show_stage")
-        self.path = ["show_stage", "dining_area", "east_hall", "right_door"]
+class PathAnimatronic(Animatronic):
+    """Animatronic that walks its compiled route from the location graph"""
+
+    def __init__(self, name, graph=None, rng=None):
+        self.graph = graph or get_location_graph()
+        self.route_id = self.graph.route_id(name)
+        self.node = int(self.graph.spawns[self.route_id])
+        super().__init__(name, self.graph.names[self.node], rng)
+        self.path = self.graph.paths[name]
         self.path_index = 0
 
     def move_to_next_location(self):
-        if self.path_index < len(self.path) - 1:
-            self.path_index += 1
-            self.current_location = self.path[self.path_index]
+        self.move_to_node(self.graph.next_node(self.route_id, self.node, self.rng.randrange))
+
+    def move_to_node(self, node):
+        if node != self.node:
+            self.node = node
+            self.path_index = int(self.graph.route_depth[self.route_id, node])
+            self.current_location = self.graph.names[node]
 
+    def distance_to_office(self):
+        """Moves left before reaching an office door"""
+        return int(self.graph.office_distance[self.node])
 
-class Bonnie(Animatronic):
-    def __init__(self):
-        super().__init__("bonnie", "show_stage")
-        self.path = ["show_stage", "dining_area", "backstage", "supply_closet", "west_hall", "left_door"]
+    def return_to_start(self):
+        self.node = int(self.graph.spawns[self.route_id])
         self.path_index = 0
+        super().return_to_start()
 
-    def move_to_next_location(self):
-        if self.path_index < len(self.path) - 1:
-            self.path_index += 1
-            self.current_location = self.path[self.path_index]
 
+class Freddy(PathAnimatronic):
+    def __init__(self, graph=None, rng=None):
+        super().__init__("freddy", graph, rng)
 
-class Chica(Animatronic):
-    def __init__(self):
-        super().__init__("chica", "show_stage")
-        self.path = ["show_stage", "dining_area", "kitchen", "east_hall", "right_door"]
-        self.path_index = 0
 
-    def move_to_next_location(self):
-        if self.path_index < len(self.path) - 1:
-            self.path_index += 1
-            self.current_location = self.path[self.path_index]
+class Bonnie(PathAnimatronic):
+    def __init__(self, graph=None, rng=None):
+        super().__init__("bonnie", graph, rng)
+
+
+class Chica(PathAnimatronic):
+    def __init__(self, graph=None, rng=None):
+        super().__init__("chica", graph, rng)
 
 
-class Foxy(Animatronic):
-    def __init__(self):
-        super().__init__("foxy", "pirate_cove")
+class Foxy(PathAnimatronic):
+    def __init__(self, graph=None, rng=None):
+        super().__init__("foxy", graph, rng)
         self.curtain_state = "closed"  # closed, peeking, gone
         self.camera_check_timer = 0
+        self.camera_check_threshold = 5
         self.run_phase = 0  # 0: in cove, 1: running, 2: at door
 
-    def update(self, dt, night_number, power_level, camera_on_foxy=False):
-        super().update(dt, night_number, power_level)
+    def update(self, dt, night_number, power_level, camera_on_foxy=False, outage_eta=None):
+        super().update(dt, night_number, power_level, outage_eta)
 
         if not camera_on_foxy:
             self.camera_check_timer += dt
@@ -87,47 +136,183 @@ class Foxy(Animatronic):
             self.camera_check_timer = 0
 
         # Foxy becomes more aggressive if not watched
-        if self.camera_check_timer > 5 and self.run_phase == 0:
+        if self.camera_check_timer > self.camera_check_threshold:
+            self.on_watch_timeout()
+
+    def on_watch_timeout(self):
+        """Left unwatched for too long"""
+        if self.run_phase == 0:
             self.start_running()
 
     def start_running(self):
         self.run_phase = 1
-        self.current_location = "west_hall"
+        super().move_to_next_location()
         # Will reach door in 2-3 seconds
 
     def move_to_next_location(self):
         if self.run_phase == 1:
             self.run_phase = 2
-            self.current_location = "left_door"
+            super().move_to_next_location()
+
+    def return_to_start(self):
+        super().return_to_start()
+        self.run_phase = 0
+        self.camera_check_timer = 0
 
 
 class AIDirector:
-    def __init__(self):
-        self.animatronics = {
-            'freddy': Freddy(),
-            'bonnie': Bonnie(),
-            'chica': Chica(),
-            'foxy': Foxy()
-        }
-
-    def update(self, dt, night_number, power_level, camera_system):
+    """Drives every animatronic from a queue of timed events.
+
+    Instead of polling each animatronic every frame, the director keeps one
+    pending move deadline per animatronic, plus a watch timeout for those
+    that react to the camera (camera_check_threshold), in an EventScheduler.
+    update() only touches animatronics whose deadline has passed, so a
+    large dt costs one step per event rather than one per frame.
+    """
+
+    def __init__(self, animatronics=None, seed=None):
+        if animatronics is None:
+            # With a seed each animatronic gets its own generator, see seeded_rng
+            def rng(name):
+                return None if seed is None else seeded_rng(seed, name)
+            animatronics = {
+                'freddy': Freddy(rng=rng('freddy')),
+                'bonnie': Bonnie(rng=rng('bonnie')),
+                'chica': Chica(rng=rng('chica')),
+                'foxy': Foxy(rng=rng('foxy'))
+            }
+        self.animatronics = animatronics
+        self.scheduler = EventScheduler()
+        self.aggression_state = None
+        self.move_started = {name: 0.0 for name in self.animatronics}
+
+        # Watchable animatronics have no watch timeout pending while their camera
+        # is up; the countdown starts again when the camera looks away
+        self.watchers = {name: a for name, a in self.animatronics.items()
+                         if hasattr(a, 'camera_check_threshold')}
+        self.watched = {name: False for name in self.watchers}
+        self.watch_started = {name: 0.0 for name in self.watchers}
+        for name in self.watchers:
+            self.schedule_watch_timeout(name)
+
+        # Location -> {name: animatronic}, kept current by location callbacks
+        self.occupancy = {}
+        self.location_versions = {}
+        self.occupancy_listeners = []
+        for animatronic in self.animatronics.values():
+            self.occupancy.setdefault(animatronic.current_location, {})[animatronic.name] = animatronic
+            animatronic.on_location_changed = self.on_location_changed
+
+    @property
+    def time(self):
+        return self.scheduler.time
+
+    def update(self, dt, night_number, power_level, camera_system, outage_eta=None):
         """Update all animatronics"""
-        foxy_being_watched = camera_system.current_camera == "pirate_cove"
+        self.advance(dt, night_number, power_level, camera_system.current_camera, outage_eta)
+
+    def advance(self, dt, night_number, power_level, current_camera=None, outage_eta=None):
+        """Run every move and watch timeout due in the next dt seconds.
+
+        Night, power level, outage ETA and camera are held constant over
+        the interval.
+        """
+        aggression_state = (night_number, is_low_power(power_level, outage_eta))
+        if aggression_state != self.aggression_state:
+            self.aggression_state = aggression_state
+            self.night_number = night_number
+            self.power_level = power_level
+            self.outage_eta = outage_eta
+            for name in self.animatronics:
+                self.schedule_move(name)
+
+        for name, animatronic in self.watchers.items():
+            watched = current_camera == animatronic.start_location
+            if watched:
+                self.scheduler.cancel((name, "watch_timeout"))
+            elif self.watched[name]:
+                # Countdown restarts from the end of the last watched frame
+                self.watch_started[name] = self.scheduler.time
+                self.schedule_watch_timeout(name)
+            self.watched[name] = watched
+
+        self.scheduler.advance(self.scheduler.time + dt)
+
+    def schedule_move(self, name):
+        """(Re)schedule the next move from when the move timer last reset"""
+        animatronic = self.animatronics[name]
+        effective_aggression = animatronic.effective_aggression(self.night_number, self.power_level,
+                                                                self.outage_eta)
+        deadline = self.move_started[name] + animatronic.move_interval / effective_aggression
+        self.schedule_event(name, "move", deadline)
+
+    def on_move(self, name, now):
+        self.animatronics[name].on_move_timer()
+        self.move_started[name] = now
+        self.schedule_move(name)
 
+    def schedule_watch_timeout(self, name):
+        animatronic = self.watchers[name]
+        deadline = self.watch_started[name] + animatronic.camera_check_threshold
+        self.schedule_event(name, "watch_timeout", deadline)
+
+    def schedule_event(self, name, kind, deadline):
+        """Put a "move" or "watch_timeout" event for name on the scheduler"""
+        if kind == "move":
+            callback = lambda now: self.on_move(name, now)
+        else:
+            callback = lambda now: self.watchers[name].on_watch_timeout()
+        self.scheduler.schedule((name, kind), deadline, callback)
+
+    def return_to_start(self, animatronic):
+        """Send an animatronic back to its start and restart its watch countdown"""
+        animatronic.return_to_start()
+        name = animatronic.name
+        if name in self.watchers and not self.watched[name]:
+            self.watch_started[name] = self.scheduler.time
+            self.schedule_watch_timeout(name)
+
+    def sync_timers(self):
+        """Write the scheduler's view back to move_timer and camera_check_timer"""
+        now = self.scheduler.time
         for name, animatronic in self.animatronics.items():
-            if name == "foxy":
-                animatronic.update(dt, night_number, power_level, foxy_being_watched)
-            else:
-                animatronic.update(dt, night_number, power_level)
+            animatronic.move_timer = now - self.move_started[name]
+        for name, animatronic in self.watchers.items():
+            animatronic.camera_check_timer = 0 if self.watched[name] else now - self.watch_started[name]
+
+    def on_location_changed(self, animatronic, old_location, new_location):
+        """Keep the occupancy index current and notify listeners"""
+        occupants = self.occupancy.get(old_location)
+        if occupants is not None:
+            occupants.pop(animatronic.name, None)
+            if not occupants:
+                del self.occupancy[old_location]
+        self.occupancy.setdefault(new_location, {})[animatronic.name] = animatronic
+
+        for location in (old_location, new_location):
+            self.location_versions[location] = self.location_versions.get(location, 0) + 1
+        for listener in self.occupancy_listeners:
+            listener(animatronic, old_location, new_location)
+
+    def add_occupancy_listener(self, listener):
+        """Call listener(animatronic, old_location, new_location) on every move"""
+        self.occupancy_listeners.append(listener)
+
+    def remove_occupancy_listener(self, listener):
+        self.occupancy_listeners.remove(listener)
+
+    def location_version(self, location):
+        """Counter that changes whenever occupancy of location changes"""
+        return self.location_versions.get(location, 0)
 
     def get_animatronic_at_door(self, side):
         """Check if any animatronic is at specified door"""
-        door_location = f"{side}_door"
-        for animatronic in self.animatronics.values():
-            if animatronic.current_location == door_location:
-                return animatronic
+        occupants = self.occupancy.get(f"{side}_door")
+        if occupants:
+            return next(iter(occupants.values()))
         return None
 
     def get_animatronics_at_location(self, location):
         """Get all animatronics at a specific location"""
-        return [a for a in self.animatronics.values() if a.current_location == location]
+        occupants = self.occupancy.get(location)
+        return list(occupants.values()) if occupants else []
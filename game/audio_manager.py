@@ -1,32 +1,216 @@
+import json
+import os
 import pygame
+from .procedural_audio import AudioStream, PROCEDURAL_SOUNDS
+
+# Mixer channels held back for procedural streams, then the voice pool
+STREAM_CHANNELS = 2
+VOICE_COUNT = 12
+
+AUDIO_SETTINGS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   "assets", "data", "game_config.json")
+DEFAULT_AUDIO_SETTINGS = {
+    "master_volume": 1.0,
+    "sfx_volume": 1.0,
+    "music_volume": 1.0,
+    "ambient_volume": 1.0
+}
+
+# Voice stealing: a new sound may only replace voices of equal or lower priority
+BUS_PRIORITIES = {"sfx": 10, "music": 40, "ambient": 50}
+JUMPSCARE_PRIORITY = 100
+
+
+def load_audio_settings(path=AUDIO_SETTINGS_PATH):
+    """Bus volumes from the audio_settings block of game_config.json"""
+    settings = dict(DEFAULT_AUDIO_SETTINGS)
+    if os.path.exists(path):
+        with open(path) as f:
+            settings.update(json.load(f).get("audio_settings", {}))
+    return settings
+
+
+class Voice:
+    """One pooled mixer channel and what is playing on it"""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.filename = None
+        self.bus = None
+        self.volume = 1.0
+        self.priority = 0
+        self.started = 0
+
+    def is_idle(self):
+        return not self.channel.get_busy()
+
 
 class AudioManager:
-    def __init__(self, asset_loader):
+    def __init__(self, asset_loader, stream_procedural=True, audio_settings=None,
+                 voice_count=VOICE_COUNT):
+        self.asset_loader = asset_loader
         self.sounds = asset_loader.sounds
-        self.ambient_channel = None
+        self.ambient_voice = None
+        self.ambient_started = None
+        self.ambient_stream = None
 
-    def play_sound(self, filename, volume=1.0):
-        sound = self.sounds.get(filename)
-        if sound:
-            sound.set_volume(volume)
-            sound.play()
+        settings = audio_settings or load_audio_settings()
+        self.master_volume = settings["master_volume"]
+        self.bus_volumes = {bus: settings[f"{bus}_volume"] for bus in BUS_PRIORITIES}
+
+        # Fixed channel budget: streams first, then the voices one-shots share
+        mixer_ready = pygame.mixer.get_init() is not None
+        self.voices = []
+        self.stream_channels = []
+        self.play_count = 0
+        if mixer_ready:
+            pygame.mixer.set_num_channels(STREAM_CHANNELS + voice_count)
+            pygame.mixer.set_reserved(STREAM_CHANNELS + voice_count)
+            self.stream_channels = [pygame.mixer.Channel(i) for i in range(STREAM_CHANNELS)]
+            self.voices = [Voice(pygame.mixer.Channel(i))
+                           for i in range(STREAM_CHANNELS, STREAM_CHANNELS + voice_count)]
+
+        # Streams get their own reserved channels so one-shots never steal them
+        self.stream_procedural = stream_procedural and mixer_ready
+        self.streams = {}
+        self.stream_levels = {}  # name -> (bus, volume)
+
+    def bus_gain(self, bus):
+        return self.master_volume * self.bus_volumes[bus]
+
+    def set_bus_volume(self, bus, volume):
+        """Change a bus volume ("master", "sfx", "music" or "ambient") live"""
+        if bus == "master":
+            self.master_volume = volume
         else:
+            self.bus_volumes[bus] = volume
+
+        for voice in self.voices:
+            if voice.bus is not None and not voice.is_idle():
+                voice.channel.set_volume(voice.volume * self.bus_gain(voice.bus))
+        for name, stream in self.streams.items():
+            stream_bus, stream_volume = self.stream_levels[name]
+            stream.set_volume(stream_volume * self.bus_gain(stream_bus))
+
+    def allocate_voice(self, priority):
+        """An idle voice, else the oldest lowest-priority voice it may steal"""
+        idle = next((voice for voice in self.voices if voice.is_idle()), None)
+        if idle is not None:
+            return idle
+
+        candidates = [voice for voice in self.voices if voice.priority <= priority]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda voice: (voice.priority, voice.started))
+
+    def play_sound(self, filename, volume=1.0, bus="sfx", priority=None, loops=0):
+        """Play on a pooled voice with its own volume; returns the Voice or None"""
+        sound = self.sounds.get(filename)
+        if not sound:
             print(f"⚠️ Sound not found: {filename}")
+            return None
+
+        priority = BUS_PRIORITIES[bus] if priority is None else priority
+        voice = self.allocate_voice(priority)
+        if voice is None:
+            return None
+
+        self.play_count += 1
+        voice.filename = filename
+        voice.bus = bus
+        voice.volume = volume
+        voice.priority = priority
+        voice.started = self.play_count
+        voice.channel.play(sound, loops)
+        voice.channel.set_volume(volume * self.bus_gain(bus))
+        return voice
 
     def play_generated(self, filename, volume=1.0):
         self.play_sound(filename, volume)
 
     def play_ambient(self, filename, volume=0.3):
-        sound = self.sounds.get(filename)
-        if sound:
-            if self.ambient_channel:
-                self.ambient_channel.stop()
-            self.ambient_channel = sound.play(-1)
-            self.ambient_channel.set_volume(volume)
+        """Loop an ambient sound, streamed from its recipe when there is one"""
+        self.stop_ambient()
+        if self.stream_procedural and filename in PROCEDURAL_SOUNDS:
+            try:
+                self.ambient_stream = self.play_procedural(filename, volume)
+                return
+            except ValueError as e:
+                # Mixer format AudioStream cannot produce; loop the WAVs from now on
+                print(f"⚠️ Cannot stream {filename}, looping the WAV instead: {e}")
+                self.stream_procedural = False
+
+        self.ambient_voice = self.play_sound(filename, volume, bus="ambient", loops=-1)
+        if self.ambient_voice:
+            self.ambient_started = self.ambient_voice.started
 
     def stop_ambient(self):
-        if self.ambient_channel:
-            self.ambient_channel.stop()
+        if self.ambient_voice:
+            # The voice may have been stolen since; leave its new sound alone
+            if self.ambient_voice.started == self.ambient_started:
+                self.ambient_voice.channel.stop()
+            self.ambient_voice = None
+        if self.ambient_stream:
+            self.stop_procedural(self.ambient_stream)
+            self.ambient_stream = None
+
+    def play_procedural(self, name, volume=1.0, bus="ambient"):
+        """Start streaming a recipe from PROCEDURAL_SOUNDS; returns the stream key"""
+        self.stop_procedural(name)
+        busy = {stream.channel for stream in self.streams.values()}
+        channel = next((c for c in self.stream_channels if c not in busy), None)
+        if channel is None:
+            print(f"⚠️ No free stream channel for {name}")
+            return None
+
+        stream = AudioStream(PROCEDURAL_SOUNDS[name](), channel, volume * self.bus_gain(bus))
+        self.stream_levels[name] = (bus, volume)
+        self.streams[name] = stream.start()
+        return name
+
+    def stop_procedural(self, name=None):
+        """Stop one stream, or every stream when name is None"""
+        names = list(self.streams) if name is None else [name]
+        for key in names:
+            stream = self.streams.pop(key, None)
+            self.stream_levels.pop(key, None)
+            if stream is not None:
+                stream.stop()
 
     def play_jumpscare(self):
-        self.play_sound("generated_jumpscare.wav", 1.0)
+        self.play_sound("generated_jumpscare.wav", 1.0, priority=JUMPSCARE_PRIORITY)
+
+    def hint(self, hint):
+        """Let the asset loader decode sounds that are about to be needed"""
+        self.asset_loader.prefetch_hint(hint)
+
+
+class NullAudioManager:
+    """Silent stand-in used when running without an audio device"""
+
+    def play_sound(self, filename, volume=1.0, bus="sfx", priority=None, loops=0):
+        return None
+
+    def play_generated(self, filename, volume=1.0):
+        pass
+
+    def play_ambient(self, filename, volume=0.3):
+        pass
+
+    def stop_ambient(self):
+        pass
+
+    def play_procedural(self, name, volume=1.0, bus="ambient"):
+        return None
+
+    def stop_procedural(self, name=None):
+        pass
+
+    def set_bus_volume(self, bus, volume):
+        pass
+
+    def play_jumpscare(self):
+        pass
+
+    def hint(self, hint):
+        pass
@@ -0,0 +1,369 @@
+import numpy as np
+from .animatronics import Freddy, Bonnie, Chica, Foxy
+from .location_graph import get_location_graph
+from config import *
+
+
+# Integer codes for every place an animatronic can stand
+LOCATIONS = get_location_graph().names
+LOCATION_INDEX = get_location_graph().index
+
+# Night outcome codes
+PLAYING = 0
+SURVIVED = 1
+DIED = 2
+
+POWER_OUT_DURATION = 5.0  # Matches GameManager.power_out_duration
+
+
+def default_roster():
+    """Roster matching the animatronic classes and their compiled routes"""
+    roster = {}
+    for cls in (Freddy, Bonnie, Chica, Foxy):
+        animatronic = cls()
+        roster[animatronic.name] = {
+            "base_aggression": animatronic.aggression,
+            "initial_interval": (3, 8),
+            "move_interval": (2, 6),
+            "movement_path": list(animatronic.path),
+        }
+        if hasattr(animatronic, "camera_check_threshold"):
+            roster[animatronic.name]["camera_check_threshold"] = animatronic.camera_check_threshold
+    return roster
+
+
+def roster_from_config(animatronic_configs):
+    """Build a roster from the animatronic_configs block of game_config.json"""
+    roster = default_roster()
+    for name, settings in animatronic_configs.items():
+        entry = roster.setdefault(name, {
+            "base_aggression": 1,
+            "initial_interval": (3, 8),
+            "move_interval": (2, 6),
+        })
+        entry["base_aggression"] = settings.get("base_aggression", entry["base_aggression"])
+        if "move_interval_min" in settings and "move_interval_max" in settings:
+            interval = (settings["move_interval_min"], settings["move_interval_max"])
+            entry["initial_interval"] = interval
+            entry["move_interval"] = interval
+        if "movement_path" in settings:
+            entry["movement_path"] = list(settings["movement_path"])
+        if "camera_check_threshold" in settings:
+            entry["camera_check_threshold"] = settings["camera_check_threshold"]
+    return roster
+
+
+class BatchNightSimulator:
+    """Headless simulation of many independent nights at once.
+
+    State is stored as arrays indexed by night (and by animatronic where
+    needed) instead of one Animatronic object per night. Each step
+    reproduces Animatronic.update/attempt_move, Foxy's camera_check_timer
+    and run_phase, and PowerSystem.drain_power for every night.
+
+    Outcome rules follow GameManager.update: an animatronic reaching an
+    open door kills the player, a closed door sends it back to its start,
+    and running out of power kills the player after POWER_OUT_DURATION
+    unless 6 AM arrives first.
+    """
+
+    def __init__(self, n_nights, night_number=1, seed=None, roster=None,
+                 ai_aggression_multiplier=1.0, power_drain_multiplier=1.0,
+                 hour_duration=HOUR_DURATION):
+        self.n_nights = n_nights
+        self.night_number = night_number
+        self.rng = np.random.default_rng(seed)
+        self.ai_aggression_multiplier = ai_aggression_multiplier
+        self.power_drain_multiplier = power_drain_multiplier
+        self.hour_duration = hour_duration
+        self.night_duration = hour_duration * TOTAL_HOURS
+
+        roster = roster or default_roster()
+        self.names = list(roster.keys())
+        count = len(self.names)
+
+        # Per-animatronic constants
+        max_len = max(len(spec["movement_path"]) for spec in roster.values())
+        self.paths = np.zeros((count, max_len), dtype=np.int16)
+        self.path_len = np.zeros(count, dtype=np.int16)
+        self.door_side = np.zeros(count, dtype=np.int8)  # 0 left, 1 right
+        self.aggression = np.zeros(count)
+        self.initial_interval = np.zeros((count, 2))
+        self.move_interval_range = np.zeros((count, 2))
+        self.camera_threshold = np.full(count, np.inf)
+
+        for i, name in enumerate(self.names):
+            spec = roster[name]
+            path = [LOCATION_INDEX[location] for location in spec["movement_path"]]
+            self.paths[i, :len(path)] = path
+            self.paths[i, len(path):] = path[-1]
+            self.path_len[i] = len(path)
+            self.door_side[i] = 0 if spec["movement_path"][-1] == "left_door" else 1
+            self.aggression[i] = spec["base_aggression"]
+            self.initial_interval[i] = spec["initial_interval"]
+            self.move_interval_range[i] = spec["move_interval"]
+            if "camera_check_threshold" in spec:
+                self.camera_threshold[i] = spec["camera_check_threshold"]
+
+        # Animatronics with a camera threshold behave like Foxy: they only
+        # leave the cove when unwatched and only advance while running
+        self.is_runner = np.isfinite(self.camera_threshold)
+
+        self.reset()
+
+    def reset(self, nights=None):
+        """Start every night, or only those in a boolean mask, from 12 AM"""
+        n, count = self.n_nights, len(self.names)
+        low, high = self.initial_interval[:, 0], self.initial_interval[:, 1]
+        if nights is not None:
+            nights = np.asarray(nights, dtype=bool)
+            self.elapsed[nights] = 0
+            self.current_power[nights] = TOTAL_POWER
+            self.drain_rate[nights] = POWER_DRAIN_BASE * self.power_drain_multiplier
+            self.is_power_out[nights] = False
+            self.power_out_timer[nights] = 0
+            self.status[nights] = PLAYING
+            self.cause[nights] = -1
+            self.power_at_6am[nights] = np.nan
+            self.path_index[:, nights] = 0
+            self.move_timer[:, nights] = 0
+            self.move_interval[:, nights] = self.rng.uniform(low[:, None], high[:, None],
+                                                             size=(count, int(nights.sum())))
+            self.camera_check_timer[:, nights] = 0
+            return
+
+        self.elapsed = np.zeros(n)
+        self.current_power = np.full(n, float(TOTAL_POWER))
+        self.drain_rate = np.full(n, POWER_DRAIN_BASE * self.power_drain_multiplier)
+        self.is_power_out = np.zeros(n, dtype=bool)
+        self.power_out_timer = np.zeros(n)
+        self.status = np.full(n, PLAYING, dtype=np.int8)
+        self.cause = np.full(n, -1, dtype=np.int16)
+        self.power_at_6am = np.full(n, np.nan)
+
+        # Animatronic state is laid out as (animatronic, night)
+        self.path_index = np.zeros((count, n), dtype=np.int16)
+        self.move_timer = np.zeros((count, n))
+        self.move_interval = self.rng.uniform(low[:, None], high[:, None], size=(count, n))
+        self.camera_check_timer = np.zeros((count, n))
+
+    @property
+    def power_out_cause(self):
+        """Cause code used when the player dies in the dark"""
+        return len(self.names)
+
+    @property
+    def active(self):
+        return self.status == PLAYING
+
+    @property
+    def current_hour(self):
+        return np.minimum(self.elapsed // self.hour_duration, TOTAL_HOURS).astype(np.int8)
+
+    def locations(self):
+        """Location code of every animatronic in every night, shaped (animatronic, night)"""
+        return self.paths[np.arange(len(self.names))[:, None], self.path_index]
+
+    def threats(self, warning=None):
+        """Per-night flags for animatronics in a hall or at a door, by side.
+
+        With a warning in seconds, hall occupants only count while their
+        next move is due within that time.
+        """
+        left = np.zeros(self.n_nights, dtype=bool)
+        right = np.zeros(self.n_nights, dtype=bool)
+        near_office = get_location_graph().office_distance[self.locations()] <= 1
+        if warning is not None:
+            near_office &= self.move_timer + warning >= self.move_thresholds()
+        for i in range(len(self.names)):
+            near = near_office[i]
+            if self.door_side[i] == 0:
+                left |= near
+            else:
+                right |= near
+        return left, right
+
+    def move_thresholds(self):
+        """Move timer value at which each animatronic next tries to move, shaped (animatronic, night)"""
+        effective = self.aggression * (1 + self.night_number * 0.3) * self.ai_aggression_multiplier
+        # Same rule as animatronics.is_low_power, with the ETA at the last tick's load
+        low_power = self.current_power < 20
+        if LOW_POWER_ETA_AGGRESSION:
+            low_power = low_power | (self.current_power / self.drain_rate < LOW_POWER_ETA)
+        low_power = np.where(low_power, 1.5, 1.0)
+        return self.move_interval / (effective[:, None] * low_power)
+
+    def step(self, dt, camera_active=False, camera_on_runner=False,
+             left_door_closed=False, right_door_closed=False,
+             left_light_on=False, right_light_on=False):
+        """Advance every unfinished night by dt seconds.
+
+        Controls are booleans or per-night boolean arrays.
+        """
+        active = self.active
+        if not active.any():
+            return
+
+        camera_active = np.broadcast_to(camera_active, active.shape)
+        camera_on_runner = np.broadcast_to(camera_on_runner, active.shape)
+        left_door_closed = np.broadcast_to(left_door_closed, active.shape)
+        right_door_closed = np.broadcast_to(right_door_closed, active.shape)
+
+        self.elapsed[active] += dt
+        self._drain_power(dt, active, camera_active, left_door_closed, right_door_closed,
+                          np.broadcast_to(left_light_on, active.shape),
+                          np.broadcast_to(right_light_on, active.shape))
+
+        playing = active & ~self.is_power_out
+        self._update_animatronics(dt, playing, camera_on_runner)
+        self._resolve_doors(playing, left_door_closed, right_door_closed)
+
+        # Power outage ends the night once the grace period runs out
+        dark = active & self.is_power_out
+        self.power_out_timer[dark] += dt
+        killed = dark & (self.power_out_timer >= POWER_OUT_DURATION) & (self.status == PLAYING)
+        self.status[killed] = DIED
+        self.cause[killed] = self.power_out_cause
+
+        # Survivors reach 6 AM
+        survived = (self.status == PLAYING) & (self.elapsed >= self.night_duration)
+        self.status[survived] = SURVIVED
+        self.power_at_6am[survived] = self.current_power[survived]
+
+    def _drain_power(self, dt, active, camera_active, left_door_closed, right_door_closed,
+                     left_light_on, right_light_on):
+        """Vectorised PowerSystem.drain_power"""
+        drain_rate = (POWER_DRAIN_BASE
+                      + POWER_DRAIN_CAMERA * camera_active
+                      + POWER_DRAIN_DOOR * left_door_closed
+                      + POWER_DRAIN_DOOR * right_door_closed
+                      + POWER_DRAIN_LIGHT * left_light_on
+                      + POWER_DRAIN_LIGHT * right_light_on)
+        draining = active & ~self.is_power_out
+        self.drain_rate = np.where(draining, drain_rate * self.power_drain_multiplier, self.drain_rate)
+        self.current_power -= np.where(draining, self.drain_rate * dt, 0)
+
+        out = draining & (self.current_power <= 0)
+        self.current_power[out] = 0
+        self.is_power_out[out] = True
+
+    def _update_animatronics(self, dt, playing, camera_on_runner):
+        """Vectorised Animatronic.update and Foxy.update"""
+        self.move_timer += playing * dt
+
+        # Only animatronics whose timer ran out draw random numbers
+        rows, cols = np.nonzero((self.move_timer >= self.move_thresholds()) & playing)
+        if rows.size:
+            moves = self.rng.random(rows.size) < 0.3
+
+            # Walkers advance until the door; runners only advance mid-run
+            index = self.path_index[rows, cols]
+            can_advance = np.where(self.is_runner[rows], index == 1,
+                                   index < self.path_len[rows] - 1)
+            advance = moves & can_advance
+            self.path_index[rows[advance], cols[advance]] += 1
+
+            self.move_timer[rows, cols] = 0
+            low, high = self.move_interval_range[rows, 0], self.move_interval_range[rows, 1]
+            self.move_interval[rows, cols] = self.rng.uniform(low, high)
+
+        # Runners start running after being left unwatched
+        unwatched = playing & ~camera_on_runner
+        for i in np.flatnonzero(self.is_runner):
+            timer = self.camera_check_timer[i]
+            timer += unwatched * dt
+            timer *= ~(playing & camera_on_runner)
+            start = playing & (timer > self.camera_threshold[i]) & (self.path_index[i] == 0)
+            self.path_index[i, start] = 1
+
+    def _resolve_doors(self, playing, left_door_closed, right_door_closed):
+        """Kill on an open door, send back on a closed one"""
+        for i in range(len(self.names)):
+            at_door = playing & (self.path_index[i] == self.path_len[i] - 1)
+            if not at_door.any():
+                continue
+            closed = left_door_closed if self.door_side[i] == 0 else right_door_closed
+
+            blocked = at_door & closed
+            self.path_index[i, blocked] = 0
+            self.camera_check_timer[i, blocked] = 0
+
+            killed = at_door & ~closed & (self.status == PLAYING)
+            self.status[killed] = DIED
+            self.cause[killed] = i
+
+    def run(self, player=None, dt=1.0 / FPS):
+        """Simulate until every night is won or lost"""
+        player = player or ScriptedPlayer()
+        player.reset(self)
+        while self.active.any():
+            self.step(dt, **player.controls(self, dt))
+        return self.results()
+
+    def results(self):
+        """Summary of finished nights"""
+        causes = {name: int(np.sum(self.cause == i)) for i, name in enumerate(self.names)}
+        causes["power_out"] = int(np.sum(self.cause == self.power_out_cause))
+        survived = self.status == SURVIVED
+        return {
+            "nights": self.n_nights,
+            "survival_rate": float(np.mean(survived)),
+            "power_at_6am": self.power_at_6am[survived].copy(),
+            "causes_of_death": causes,
+        }
+
+
+class ScriptedPlayer:
+    """Vectorised stand-in player used for Monte Carlo runs.
+
+    Doors close at a rate of reaction_rate per second while something in
+    the matching hall may step into the doorway within `warning` seconds,
+    and reopen once that has passed; warning=None closes them for as long
+    as the hall is occupied, which runs the power out long before 6 AM. The
+    camera is up for camera_duty of the time and flicks to the runner's
+    camera roughly every foxy_check_interval seconds. Lights are on for
+    light_duty of the time.
+
+    The defaults survive most of night 1 in the game's own timing, so
+    sweeps show how difficulty moves rather than how a poor policy fails.
+    """
+
+    def __init__(self, reaction_rate=12.0, camera_duty=0.0, foxy_check_interval=3.0,
+                 light_duty=0.0, warning=0.5):
+        self.reaction_rate = reaction_rate
+        self.warning = warning
+        self.camera_duty = camera_duty
+        self.foxy_check_interval = foxy_check_interval
+        self.light_duty = light_duty
+
+    def reset(self, sim):
+        n = sim.n_nights
+        self.left_door_closed = np.zeros(n, dtype=bool)
+        self.right_door_closed = np.zeros(n, dtype=bool)
+        self.next_check = sim.rng.uniform(0.5, 1.5, n) * self.foxy_check_interval
+
+    def controls(self, sim, dt):
+        """Per-night control arrays for the next step"""
+        rng = sim.rng
+        n = sim.n_nights
+        powered = ~sim.is_power_out
+        react = 1 - np.exp(-self.reaction_rate * dt)
+
+        left_threat, right_threat = sim.threats(self.warning)
+        for threat, doors in ((left_threat, self.left_door_closed),
+                              (right_threat, self.right_door_closed)):
+            doors |= threat & (rng.random(n) < react)
+            doors &= threat & powered
+
+        self.next_check -= dt
+        check = self.next_check <= 0
+        self.next_check[check] = rng.uniform(0.5, 1.5, int(check.sum())) * self.foxy_check_interval
+
+        return {
+            "camera_active": powered & ((rng.random(n) < self.camera_duty) | check),
+            "camera_on_runner": powered & check,
+            "left_door_closed": self.left_door_closed.copy(),
+            "right_door_closed": self.right_door_closed.copy(),
+            "left_light_on": powered & (rng.random(n) < self.light_duty),
+            "right_light_on": powered & (rng.random(n) < self.light_duty),
+        }
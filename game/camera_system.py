@@ -1,10 +1,14 @@
 import pygame
 import random
+from .static_frames import get_static_frames
+from .text_cache import get_text_cache
 from config import *
 
 
 class CameraSystem:
-    def __init__(self):
+    def __init__(self, rng=None, static_density=STATIC_DENSITY):
+        self.rng = rng if rng is not None else random  # Anything with random's API
+        self.static_density = static_density
         self.current_camera = None
         self.is_camera_up = False
         self.static_timer = 0
@@ -32,9 +36,9 @@ class CameraSystem:
 
     def trigger_static(self):
         """Add static interference when switching cameras"""
-        if random.random() < 0.3:  # 30% chance of static
+        if self.rng.random() < 0.3:  # 30% chance of static
             self.show_static = True
-            self.static_duration = random.uniform(0.5, 2.0)
+            self.static_duration = self.rng.uniform(0.5, 2.0)
             self.static_timer = 0
 
     def update(self, dt):
@@ -45,19 +49,30 @@ class CameraSystem:
                 self.show_static = False
                 self.static_timer = 0
 
-    def render_camera_feed(self, screen, ai_director):
+    def render_camera_feed(self, screen, ai_director, dirty_regions=None):
         """Render the current camera view"""
+        camera_rect = pygame.Rect(200, 100, 800, 450)
+        static_frames = get_static_frames(camera_rect.size, self.static_density)
+
+        if dirty_regions is not None:
+            # Static only changes when its frame index advances
+            state = (self.is_camera_up, self.current_camera,
+                     ai_director, ai_director.location_version(self.current_camera),
+                     static_frames.frame_index(self.static_timer) if self.show_static else None)
+            if not dirty_regions.changed("camera_feed", camera_rect, state):
+                return
+            pygame.draw.rect(screen, BLACK, camera_rect)
+
         if not self.is_camera_up or not self.current_camera:
             return
 
         # Camera background
-        camera_rect = pygame.Rect(200, 100, 800, 450)
         pygame.draw.rect(screen, DARK_GRAY, camera_rect)
         pygame.draw.rect(screen, WHITE, camera_rect, 3)
 
         # Camera label
-        font = pygame.font.Font(None, 36)
-        label_text = font.render(f"CAM: {self.current_camera.upper()}", True, WHITE)
+        text_cache = get_text_cache()
+        label_text = text_cache.render(f"CAM: {self.current_camera.upper()}", 36, WHITE)
         screen.blit(label_text, (camera_rect.x + 10, camera_rect.y + 10))
 
         # Show animatronics at current location
@@ -65,20 +80,10 @@ class CameraSystem:
 
         y_offset = 60
         for animatronic in animatronics:
-            animatronic_text = font.render(f"{animatronic.name.upper()} DETECTED", True, RED)
+            animatronic_text = text_cache.render(f"{animatronic.name.upper()} DETECTED", 36, RED)
             screen.blit(animatronic_text, (camera_rect.x + 10, camera_rect.y + y_offset))
             y_offset += 40
 
         # Static overlay
         if self.show_static:
-            static_surface = pygame.Surface((camera_rect.width, camera_rect.height))
-            static_surface.fill(WHITE)
-            static_surface.set_alpha(100)
-            screen.blit(static_surface, (camera_rect.x, camera_rect.y))
-
-            # Static noise pattern
-            for _ in range(50):
-                x = random.randint(camera_rect.x, camera_rect.x + camera_rect.width)
-                y = random.randint(camera_rect.y, camera_rect.y + camera_rect.height)
-                color = random.choice([BLACK, WHITE, LIGHT_GRAY])
-                pygame.draw.circle(screen, color, (x, y), random.randint(1, 3))
+            screen.blit(static_frames.frame_at(self.static_timer), camera_rect.topleft)
@@ -0,0 +1,63 @@
+import pygame
+
+
+_UNSET = object()
+
+
+class DirtyRegionTracker:
+    """Collects the screen regions that changed during a frame.
+
+    Renderers call changed() with a region id, its rect and a value that
+    captures everything drawn there. The region is redrawn only when that
+    value differs from last frame, when a full redraw was requested, or
+    when something drawn earlier this frame overlapped it. When disabled
+    every region is always redrawn and the frame is flipped.
+    """
+
+    def __init__(self, screen_rect, enabled=True, full_flip_ratio=0.5):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.enabled = enabled
+        self.full_flip_ratio = full_flip_ratio
+        self.states = {}
+        self.rects = []
+        self.full_redraw = True
+
+    def changed(self, region_id, rect, state):
+        """Return True if the region must be redrawn this frame"""
+        if not self.enabled:
+            return True
+
+        rect = pygame.Rect(rect)
+        stale = self.states.get(region_id, _UNSET) != state
+        self.states[region_id] = state
+
+        if self.full_redraw:
+            return True
+        if stale or rect.collidelist(self.rects) != -1:
+            self.rects.append(rect)
+            return True
+        return False
+
+    def invalidate(self, rect):
+        """Mark a region as changed regardless of its state"""
+        if self.enabled and not self.full_redraw:
+            self.rects.append(pygame.Rect(rect))
+
+    def invalidate_all(self):
+        """Redraw and present the whole screen this frame"""
+        self.full_redraw = True
+        self.rects = []
+
+    def take_updates(self):
+        """Rects to pass to pygame.display.update, or None for a full flip"""
+        full = self.full_redraw or not self.enabled
+        rects = self.rects
+        self.rects = []
+        self.full_redraw = False
+
+        if full:
+            return None
+        area = sum(rect.width * rect.height for rect in rects)
+        if area > self.full_flip_ratio * self.screen_rect.width * self.screen_rect.height:
+            return None
+        return rects
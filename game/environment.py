@@ -0,0 +1,259 @@
+import numpy as np
+import pygame
+from .batch_simulator import BatchNightSimulator, LOCATION_INDEX, PLAYING, SURVIVED
+from .location_graph import get_location_graph
+from config import *
+
+# Discrete actions: the controls GameManager.handle_control_input accepts,
+# doing nothing, and picking a camera (what clicking a camera button does)
+CAMERA_NAMES = tuple(CAMERA_LOCATIONS)
+CONTROL_ACTIONS = ("left_door", "right_door", "left_light", "right_light", "camera")
+ACTIONS = ("wait",) + CONTROL_ACTIONS + tuple(f"view_{name}" for name in CAMERA_NAMES)
+WAIT = 0
+FIRST_VIEW = 1 + len(CONTROL_ACTIONS)
+
+# Fixed-shape float32 observation; every field is scaled to [0, 1]
+ANIMATRONIC_NAMES = tuple(ANIMATRONIC_SPAWNS)
+OBSERVATION_FIELDS = (("power", "hour", "hour_progress", "camera_up",
+                       "left_door", "right_door", "left_light", "right_light")
+                      + tuple(f"camera_{name}" for name in CAMERA_NAMES)
+                      + tuple(f"sees_{name}" for name in ANIMATRONIC_NAMES))
+OBSERVATION_SIZE = len(OBSERVATION_FIELDS)
+CAMERA_OFFSET = OBSERVATION_FIELDS.index(f"camera_{CAMERA_NAMES[0]}")
+SEES_OFFSET = OBSERVATION_FIELDS.index(f"sees_{ANIMATRONIC_NAMES[0]}")
+
+# Rewards when a night ends; every other step pays nothing
+WIN_REWARD = 1.0
+LOSS_REWARD = -1.0
+
+
+class NightEnv:
+    """Gym-style environment around a headless GameManager.
+
+    reset() returns (observation, info) and step(action) returns
+    (observation, reward, terminated, truncated, info). Each step applies
+    one action from ACTIONS, then runs ticks_per_step simulation ticks. An
+    animatronic counts as seen when it is on the open camera or in the
+    hall or doorway a lit light shines into, which is all a player could
+    see. Doorways alone would never show anything: whoever steps into one
+    is let in or turned away in the same tick.
+    """
+
+    def __init__(self, night=1, seed=None, ticks_per_step=1, dt=1.0 / SIMULATION_TICK_RATE):
+        self.night = night
+        self.seed = seed
+        self.ticks_per_step = ticks_per_step
+        self.dt = dt
+        self.game_manager = None
+
+    def make_game_manager(self, seed):
+        # Imported here so callers can pick SDL drivers before pygame starts
+        from .audio_manager import NullAudioManager
+        from .game_manager import GameManager
+
+        if not pygame.get_init():
+            pygame.init()
+        game_manager = GameManager(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)),
+                                   NullAudioManager(), seed=seed)
+        game_manager.current_night = self.night
+        return game_manager
+
+    def reset(self, seed=None):
+        """Start a night; the same seed always gives the same night"""
+        if self.game_manager is None or seed is not None:
+            self.game_manager = self.make_game_manager(seed if seed is not None else self.seed)
+        else:
+            self.game_manager.current_night = self.night
+            self.game_manager.restart_night()
+        return self.observation(), {"night_seed": self.game_manager.night_seed}
+
+    def step(self, action):
+        game_manager = self.game_manager
+        self.apply_action(action)
+        for _ in range(self.ticks_per_step):
+            game_manager.update(self.dt)
+            if game_manager.game_state in ("victory", "game_over"):
+                break
+
+        state = game_manager.game_state
+        terminated = state in ("victory", "game_over")
+        reward = WIN_REWARD if state == "victory" else LOSS_REWARD if state == "game_over" else 0.0
+        info = {"game_state": state}
+        if state == "game_over":
+            info["killed_by"] = game_manager.jumpscare_animatronic.name
+        return self.observation(), reward, terminated, False, info
+
+    def apply_action(self, action):
+        game_manager = self.game_manager
+        if action == WAIT or game_manager.game_state != "playing":
+            return
+        if action < FIRST_VIEW:
+            game_manager.handle_control_input(ACTIONS[action])
+        else:
+            game_manager.camera_system.switch_camera(CAMERA_NAMES[action - FIRST_VIEW])
+
+    def observation(self):
+        game_manager = self.game_manager
+        camera = game_manager.camera_system
+        obs = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+        obs[:8] = (game_manager.power_system.get_power_percentage() / 100,
+                   game_manager.current_hour / TOTAL_HOURS,
+                   game_manager.hour_timer / HOUR_DURATION,
+                   camera.is_camera_up,
+                   game_manager.left_door_closed, game_manager.right_door_closed,
+                   game_manager.left_light_on, game_manager.right_light_on)
+
+        on_camera = None
+        if camera.is_camera_up and camera.current_camera in CAMERA_LOCATIONS:
+            obs[CAMERA_OFFSET + CAMERA_NAMES.index(camera.current_camera)] = 1
+            on_camera = camera.current_camera
+
+        # Door sides (0 left, 1 right) whose hall and doorway are lit
+        graph = get_location_graph()
+        lit = [side for side, on in enumerate((game_manager.left_light_on, game_manager.right_light_on))
+               if on]
+        for animatronic in game_manager.ai_director.animatronics.values():
+            if animatronic.name not in ANIMATRONIC_NAMES:
+                continue
+            location = animatronic.current_location
+            door_distance = graph.door_distance[graph.index[location]]
+            if location == on_camera or any(door_distance[side] <= 1 for side in lit):
+                obs[SEES_OFFSET + ANIMATRONIC_NAMES.index(animatronic.name)] = 1
+        return obs
+
+
+class VectorNightEnv:
+    """N independent nights stepped together on a BatchNightSimulator.
+
+    Takes an array of N actions and returns stacked observations, rewards
+    and flags with the same layout as NightEnv. Nights that end are reset
+    straight away; the step that ended them reports the outcome,
+    info["final_status"] / info["cause"] say how, and
+    info["final_observation"] holds the observations from before the
+    reset (present only when some night ended). Control state lives in
+    arrays here and is fed to the simulator each tick, following
+    GameManager's rules: toggles are ignored once the power is out, lights
+    switch off after max_light_duration, and an outage opens the doors and
+    drops the camera.
+    """
+
+    def __init__(self, num_envs, night=1, seed=None, ticks_per_step=1,
+                 dt=1.0 / SIMULATION_TICK_RATE, max_light_duration=3.0, **simulator_options):
+        self.num_envs = num_envs
+        self.ticks_per_step = ticks_per_step
+        self.dt = dt
+        self.max_light_duration = max_light_duration
+        self.sim = BatchNightSimulator(num_envs, night_number=night, seed=seed, **simulator_options)
+
+        sim = self.sim
+        self.sees_columns = np.array([ANIMATRONIC_NAMES.index(name) if name in ANIMATRONIC_NAMES else -1
+                                      for name in sim.names])
+        self.runner_starts = sim.paths[sim.is_runner, 0]
+        self.camera_nodes = np.array([LOCATION_INDEX[name] for name in CAMERA_NAMES])
+        self.door_distance = get_location_graph().door_distance
+
+        self.left_door_closed = np.zeros(num_envs, dtype=bool)
+        self.right_door_closed = np.zeros(num_envs, dtype=bool)
+        self.left_light_on = np.zeros(num_envs, dtype=bool)
+        self.right_light_on = np.zeros(num_envs, dtype=bool)
+        self.camera_up = np.zeros(num_envs, dtype=bool)
+        self.camera = np.zeros(num_envs, dtype=np.int8)  # index into CAMERA_NAMES while up
+        self.light_timer = np.zeros(num_envs)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.sim.rng = np.random.default_rng(seed)
+        self.sim.reset()
+        self.reset_controls(np.ones(self.num_envs, dtype=bool))
+        return self.observation(), {}
+
+    def reset_controls(self, envs):
+        for controls in (self.left_door_closed, self.right_door_closed, self.left_light_on,
+                         self.right_light_on, self.camera_up):
+            controls[envs] = False
+        self.camera[envs] = 0
+        self.light_timer[envs] = 0
+
+    def step(self, actions):
+        sim = self.sim
+        actions = np.asarray(actions)
+        self.apply_actions(actions)
+
+        for _ in range(self.ticks_per_step):
+            self.update_lights()
+            camera_nodes = self.camera_nodes[self.camera]
+            sim.step(self.dt, camera_active=self.camera_up,
+                     camera_on_runner=self.camera_up & np.isin(camera_nodes, self.runner_starts),
+                     left_door_closed=self.left_door_closed, right_door_closed=self.right_door_closed,
+                     left_light_on=self.left_light_on, right_light_on=self.right_light_on)
+            self.reset_controls(sim.is_power_out)
+            if not sim.active.any():
+                break
+
+        status = sim.status.copy()
+        terminated = status != PLAYING
+        rewards = np.where(status == SURVIVED, WIN_REWARD, np.where(terminated, LOSS_REWARD, 0.0))
+        info = {"final_status": status, "cause": sim.cause.copy()}
+
+        if terminated.any():
+            info["final_observation"] = self.observation()
+            sim.reset(terminated)
+            self.reset_controls(terminated)
+        return (self.observation(), rewards.astype(np.float32), terminated,
+                np.zeros(self.num_envs, dtype=bool), info)
+
+    def apply_actions(self, actions):
+        """Vectorised NightEnv.apply_action"""
+        playing = self.sim.active & ~self.sim.is_power_out
+        self.left_door_closed ^= playing & (actions == 1)
+        self.right_door_closed ^= playing & (actions == 2)
+
+        left_light = playing & (actions == 3)
+        right_light = playing & (actions == 4)
+        self.left_light_on ^= left_light
+        self.right_light_on ^= right_light
+        self.light_timer[left_light | right_light] = 0
+
+        # Opening the camera always starts on the show stage
+        toggle_camera = playing & (actions == 5)
+        self.camera_up ^= toggle_camera
+        self.camera[toggle_camera] = CAMERA_NAMES.index("show_stage")
+
+        view = playing & self.camera_up & (actions >= FIRST_VIEW)
+        self.camera[view] = actions[view] - FIRST_VIEW
+
+    def update_lights(self):
+        lit = self.left_light_on | self.right_light_on
+        self.light_timer[lit] += self.dt
+        expired = lit & (self.light_timer >= self.max_light_duration)
+        self.left_light_on[expired] = False
+        self.right_light_on[expired] = False
+        self.light_timer[expired] = 0
+
+    def observation(self):
+        sim = self.sim
+        n = self.num_envs
+        obs = np.zeros((n, OBSERVATION_SIZE), dtype=np.float32)
+        hour = sim.current_hour
+        obs[:, 0] = sim.current_power / TOTAL_POWER
+        obs[:, 1] = hour / TOTAL_HOURS
+        obs[:, 2] = np.minimum(sim.elapsed - hour * sim.hour_duration, sim.hour_duration) / sim.hour_duration
+        obs[:, 3] = self.camera_up
+        obs[:, 4] = self.left_door_closed
+        obs[:, 5] = self.right_door_closed
+        obs[:, 6] = self.left_light_on
+        obs[:, 7] = self.right_light_on
+
+        up = np.flatnonzero(self.camera_up)
+        obs[up, CAMERA_OFFSET + self.camera[up]] = 1
+
+        # Seen on the open camera or in a lit hall or doorway, shaped (animatronic, night)
+        locations = sim.locations()
+        lit_reach = self.door_distance[locations] <= 1
+        seen = self.camera_up & (locations == self.camera_nodes[self.camera])
+        seen |= self.left_light_on & lit_reach[..., 0]
+        seen |= self.right_light_on & lit_reach[..., 1]
+        for i, column in enumerate(self.sees_columns):
+            if column >= 0:
+                obs[:, SEES_OFFSET + column] = seen[i]
+        return obs
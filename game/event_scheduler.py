@@ -0,0 +1,67 @@
+import heapq
+import itertools
+
+
+class EventScheduler:
+    """Min-heap of timed events on a simulation clock.
+
+    Each event has a hashable key; scheduling a key again replaces its
+    pending event and cancel() drops it. Replaced entries stay in the heap
+    and are skipped when popped, so both operations are O(log n).
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self.heap = []
+        self.pending = {}  # key -> (deadline, sequence, callback)
+        self.sequence = itertools.count()
+
+    def schedule(self, key, deadline, callback):
+        """Run callback(time) once the clock reaches deadline"""
+        sequence = next(self.sequence)
+        self.pending[key] = (deadline, sequence, callback)
+        heapq.heappush(self.heap, (deadline, sequence, key))
+
+        # Drop replaced entries once they dominate the heap
+        if len(self.heap) > 2 * len(self.pending) + 64:
+            self.heap = [(d, s, k) for k, (d, s, _) in self.pending.items()]
+            heapq.heapify(self.heap)
+
+    def schedule_in(self, key, delay, callback):
+        self.schedule(key, self.time + delay, callback)
+
+    def cancel(self, key):
+        self.pending.pop(key, None)
+
+    def clear(self):
+        """Drop every pending event; the clock is left as is"""
+        self.heap = []
+        self.pending = {}
+
+    def events(self):
+        """Pending (key, deadline) pairs in the order they were scheduled"""
+        entries = sorted(self.pending.items(), key=lambda item: item[1][1])
+        return [(key, deadline) for key, (deadline, _, _) in entries]
+
+    def deadline(self, key):
+        """Pending deadline for key, or None"""
+        entry = self.pending.get(key)
+        return entry[0] if entry else None
+
+    def advance(self, until):
+        """Run every event due up to `until` in deadline order.
+
+        The clock is set to each event's deadline before its callback runs,
+        so callbacks may schedule follow-up events that also fall inside
+        this interval.
+        """
+        while self.heap and self.heap[0][0] <= until:
+            deadline, sequence, key = heapq.heappop(self.heap)
+            entry = self.pending.get(key)
+            if entry is None or entry[1] != sequence:
+                continue
+            del self.pending[key]
+            # Overdue events (e.g. after a reschedule) fire now
+            self.time = max(self.time, deadline)
+            entry[2](self.time)
+        self.time = max(self.time, until)
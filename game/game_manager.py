@@ -1,23 +1,41 @@
 import pygame
 import random
 from .power_system import PowerSystem
-from .animatronics import AIDirector
+from .animatronics import AIDirector, seeded_rng
 from .camera_system import CameraSystem
 from .audio_manager import AudioManager
 from .ui_manager import UIManager
+from .dirty_rects import DirtyRegionTracker
+from .location_graph import get_location_graph
+from .profiler import FrameProfiler
+from .snapshot import capture, restore
+from assets.asset_loader import AssetLoader
 from config import *
 
 
 class GameManager:
-    def __init__(self, screen):
+    def __init__(self, screen, audio_manager=None, dirty_rects=False, profiler=None, seed=None):
         self.screen = screen
+        self.profiler = profiler or FrameProfiler(enabled=False)
+        self.dirty_regions = DirtyRegionTracker(screen.get_rect(), enabled=dirty_rects)
+
+        # Every random draw comes from generators derived from one seed per night
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        self.seed_source = random.Random(self.seed)
+        self.night_seed = self.seed_source.getrandbits(32)
+        self.tick_count = 0
+        self.recorder = None
 
         # Game systems
         self.power_system = PowerSystem()
-        self.ai_director = AIDirector()
-        self.camera_system = CameraSystem()
-        self.audio_manager = AudioManager()
-        self.ui_manager = UIManager(screen)
+        self.ai_director = AIDirector(seed=self.night_seed)
+        self.camera_system = CameraSystem(seeded_rng(self.night_seed, "camera"))
+        if audio_manager is None:
+            asset_loader = AssetLoader()
+            asset_loader.load_all_assets()
+            audio_manager = AudioManager(asset_loader)
+        self.audio_manager = audio_manager
+        self.ui_manager = UIManager(screen, self.dirty_regions)
 
         # Game state
         self.current_night = 1
@@ -43,6 +61,13 @@ class GameManager:
         self.power_out_timer = 0
         self.power_out_duration = 5.0
 
+        # Power at the previous tick, for interpolating between ticks when rendering
+        self.previous_power = self.power_system.get_power_percentage()
+
+        self.ai_director.add_occupancy_listener(self.on_animatronic_moved)
+        self.audio_manager.hint("night_start")
+        self.audio_manager.play_ambient("electrical_hum.wav")
+
     def handle_event(self, event):
         """Handle pygame events"""
         if event.type == pygame.KEYDOWN:
@@ -51,21 +76,230 @@ class GameManager:
             elif event.key == pygame.K_r and self.game_state == "game_over":
                 self.restart_night()
             elif event.key == pygame.K_ESCAPE:
+                if self.recorder:
+                    self.recorder.record_quit()
                 self.should_quit = True
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
+                if self.recorder:
+                    self.recorder.record_click(event.button, event.pos)
                 clicked = self.ui_manager.handle_click(event.pos, self.camera_system)
-                self.handle_control_input(clicked)
+                self.apply_control_input(clicked)
+
+    def attach_recorder(self, recorder):
+        """Log the seed and every input from now on, see game.replay"""
+        self.recorder = recorder
+        recorder.start(self)
+
+    def snapshot(self):
+        """Capture the night's full state, see game.snapshot"""
+        return capture(self)
+
+    def restore_snapshot(self, snapshot):
+        restore(self, snapshot)
 
     def handle_control_input(self, control):
         """Handle control inputs"""
+        if self.recorder:
+            self.recorder.record_control(control)
+        self.apply_control_input(control)
+
+    def apply_control_input(self, control):
+        """Apply a control press; clicks are recorded as clicks, not controls"""
         if self.game_state != "playing":
             return
 
         if control == "left_door":
             self.left_door_closed = not self.left_door_closed
-            self.audio_manager.play_sound('door_close', 0.5)
+            self.audio_manager.play_sound('door_close.wav', 0.5)
 
         elif control == "right_door":
-            self.right_door_closed = not self.right_door_
+            self.right_door_closed = not self.right_door_closed
+            self.audio_manager.play_sound('door_close.wav', 0.5)
+
+        elif control == "left_light":
+            self.left_light_on = not self.left_light_on
+            self.light_timer = 0
+            self.audio_manager.play_sound('light_switch.wav', 0.3)
+
+        elif control == "right_light":
+            self.right_light_on = not self.right_light_on
+            self.light_timer = 0
+            self.audio_manager.play_sound('light_switch.wav', 0.3)
+
+        elif control == "camera":
+            if self.camera_system.is_camera_up:
+                self.camera_system.close_camera()
+            else:
+                self.camera_system.open_camera()
+                self.audio_manager.hint("camera_opened")
+
+    def on_animatronic_moved(self, animatronic, old_location, new_location):
+        """Warm up the jumpscare once something is next to the office"""
+        if get_location_graph().distance_to_office(new_location) <= 1:
+            self.audio_manager.hint("animatronic_near")
+
+    def update(self, dt):
+        """Update game state"""
+        profiler = self.profiler
+        if self.recorder:
+            self.recorder.record_tick(dt)
+        self.previous_power = self.power_system.get_power_percentage()
+        if self.game_state == "playing":
+            self.update_lights(dt)
+            with profiler.section("power.drain_power"):
+                self.power_system.drain_power(dt, self.camera_system.is_camera_up,
+                                              self.left_door_closed, self.right_door_closed,
+                                              self.left_light_on, self.right_light_on)
+
+            if self.power_system.is_power_out:
+                self.trigger_power_out()
+            else:
+                with profiler.section("camera.update"):
+                    self.camera_system.update(dt)
+                with profiler.section("ai.update"):
+                    self.ai_director.update(dt, self.current_night,
+                                            self.power_system.get_power_percentage(),
+                                            self.camera_system,
+                                            self.power_system.time_until_outage())
+                self.check_doors()
+
+        elif self.game_state == "power_out":
+            self.power_out_timer += dt
+            if self.power_out_timer >= self.power_out_duration:
+                self.trigger_jumpscare(self.ai_director.animatronics['freddy'])
+
+        elif self.game_state == "game_over":
+            self.jumpscare_timer += dt
+
+        if self.game_state in ("playing", "power_out"):
+            self.update_time(dt)
+
+        self.tick_count += 1
+
+    def update_time(self, dt):
+        """Advance the night clock"""
+        self.hour_timer += dt
+        if self.hour_timer >= HOUR_DURATION:
+            self.hour_timer -= HOUR_DURATION
+            self.current_hour += 1
+
+            if self.current_hour >= TOTAL_HOURS:
+                self.game_state = "victory"
+                self.audio_manager.stop_ambient()
+
+    def update_lights(self, dt):
+        """Turn lights off after they have been on too long"""
+        if self.left_light_on or self.right_light_on:
+            self.light_timer += dt
+            if self.light_timer >= self.max_light_duration:
+                self.left_light_on = False
+                self.right_light_on = False
+                self.light_timer = 0
+
+    def check_doors(self):
+        """Resolve animatronics that reached the office doors"""
+        for side, door_closed in (("left", self.left_door_closed),
+                                  ("right", self.right_door_closed)):
+            for animatronic in self.ai_director.get_animatronics_at_location(f"{side}_door"):
+                if door_closed:
+                    self.ai_director.return_to_start(animatronic)
+                else:
+                    self.trigger_jumpscare(animatronic)
+                    return
+
+    def trigger_power_out(self):
+        """Everything shuts down when power runs out"""
+        self.game_state = "power_out"
+        self.power_out_timer = 0
+        self.left_door_closed = False
+        self.right_door_closed = False
+        self.left_light_on = False
+        self.right_light_on = False
+        self.camera_system.close_camera()
+        self.audio_manager.stop_ambient()
+
+    def trigger_jumpscare(self, animatronic):
+        """End the night with a jumpscare"""
+        self.game_state = "game_over"
+        self.jumpscare_timer = 0
+        self.jumpscare_animatronic = animatronic
+        self.audio_manager.play_jumpscare()
+
+    def start_next_night(self):
+        """Advance to the next night"""
+        self.current_night += 1
+        self.reset_night()
+        if self.recorder:
+            self.recorder.record_night("start_next_night")
+
+    def restart_night(self):
+        """Replay the current night"""
+        self.reset_night()
+        if self.recorder:
+            self.recorder.record_night("restart_night")
+
+    def reset_night(self):
+        """Reset all systems for a fresh night"""
+        self.night_seed = self.seed_source.getrandbits(32)
+        self.power_system = PowerSystem()
+        self.previous_power = self.power_system.get_power_percentage()
+        self.ai_director = AIDirector(seed=self.night_seed)
+        self.ai_director.add_occupancy_listener(self.on_animatronic_moved)
+        self.camera_system = CameraSystem(seeded_rng(self.night_seed, "camera"))
+        self.audio_manager.hint("night_start")
+        self.audio_manager.play_ambient("electrical_hum.wav")
+
+        self.current_hour = 0
+        self.hour_timer = 0
+        self.game_state = "playing"
+
+        self.left_door_closed = False
+        self.right_door_closed = False
+        self.left_light_on = False
+        self.right_light_on = False
+        self.light_timer = 0
+
+        self.jumpscare_timer = 0
+        self.jumpscare_animatronic = None
+        self.power_out_timer = 0
+
+    def render(self, alpha=1.0):
+        """Render game, alpha of the way from the previous tick to the current one"""
+        regions = self.dirty_regions
+        if regions.enabled:
+            # Switching screens redraws everything
+            if regions.changed("game_state", self.screen.get_rect(), self.game_state):
+                regions.invalidate_all()
+            if regions.full_redraw:
+                self.screen.fill(BLACK)
+
+        profiler = self.profiler
+        if self.game_state == "power_out":
+            with profiler.section("ui.render_time_display"):
+                self.ui_manager.render_time_display(self.current_hour)
+            return
+
+        with profiler.section("camera.render_camera_feed"):
+            self.camera_system.render_camera_feed(self.screen, self.ai_director, regions)
+        with profiler.section("ui.render_power_display"):
+            power = self.previous_power + (self.power_system.get_power_percentage()
+                                           - self.previous_power) * alpha
+            self.ui_manager.render_power_display(self.power_system, power,
+                                                 self.power_system.time_until_outage())
+        with profiler.section("ui.render_time_display"):
+            self.ui_manager.render_time_display(self.current_hour)
+        with profiler.section("ui.render_camera_selection"):
+            self.ui_manager.render_camera_selection(self.camera_system)
+        with profiler.section("ui.render_control_buttons"):
+            self.ui_manager.render_control_buttons(self.left_door_closed, self.right_door_closed,
+                                                   self.left_light_on, self.right_light_on,
+                                                   self.camera_system.is_camera_up)
+
+        if self.game_state == "game_over":
+            with profiler.section("ui.render_jumpscare"):
+                self.ui_manager.render_jumpscare(self.jumpscare_animatronic.name)
+        elif self.game_state == "victory":
+            with profiler.section("ui.render_victory_screen"):
+                self.ui_manager.render_victory_screen(self.current_night)
@@ -0,0 +1,156 @@
+import json
+import os
+import numpy as np
+from config import *
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "data")
+DOORS = ("left_door", "right_door")
+UNREACHABLE = np.iinfo(np.int16).max
+
+
+class LocationGraph:
+    """Integer-indexed graph of every place an animatronic can stand.
+
+    Nodes come from CAMERA_LOCATIONS, camera_locations.json and the two
+    office doors. Each animatronic's route is compiled from its
+    movement_path (or several movement_paths, which may branch) into a
+    successor table, so moving is an array lookup. All-pairs shortest path
+    distances and per-door distance tables are precomputed at load.
+    """
+
+    def __init__(self, locations, routes, spawns=None):
+        spawns = spawns or {}
+        names = list(dict.fromkeys(list(locations) + list(DOORS)))
+        for paths in routes.values():
+            for path in paths:
+                names.extend(node for node in path if node not in names)
+
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.door_nodes = np.array([self.index[door] for door in DOORS])
+        count = len(names)
+
+        # Routes: per-route successor table padded to the widest branch
+        self.route_names = list(routes)
+        self.route_ids = {name: i for i, name in enumerate(self.route_names)}
+        successor_sets = [[[] for _ in range(count)] for _ in self.route_names]
+        self.spawns = np.zeros(len(self.route_names), dtype=np.int16)
+        self.paths = {}
+
+        for route_id, name in enumerate(self.route_names):
+            paths = routes[name]
+            spawn = spawns.get(name, paths[0][0])
+            if any(path[0] != spawn for path in paths):
+                raise ValueError(f"Every movement path for {name} must start at {spawn}")
+            self.spawns[route_id] = self.index[spawn]
+            self.paths[name] = list(paths[0])
+            for path in paths:
+                for a, b in zip(path, path[1:]):
+                    successors = successor_sets[route_id][self.index[a]]
+                    if self.index[b] not in successors:
+                        successors.append(self.index[b])
+
+        width = max(1, max(len(s) for route in successor_sets for s in route))
+        self.successors = np.full((len(self.route_names), count, width), -1, dtype=np.int16)
+        self.successor_counts = np.zeros((len(self.route_names), count), dtype=np.int8)
+        for route_id, route in enumerate(successor_sets):
+            for node, successors in enumerate(route):
+                self.successors[route_id, node, :len(successors)] = successors
+                self.successor_counts[route_id, node] = len(successors)
+
+        # Adjacency over every route, then all-pairs distances
+        adjacency = np.zeros((count, count), dtype=bool)
+        route_nodes, nodes, slots = np.nonzero(self.successors >= 0)
+        adjacency[nodes, self.successors[route_nodes, nodes, slots]] = True
+        self.adjacency = adjacency
+        self.distance = self._all_pairs_distance(adjacency)
+        self.door_distance = self.distance[:, self.door_nodes]
+        self.office_distance = self.door_distance.min(axis=1)
+
+        # Steps from spawn along each route, used as path_index
+        self.route_depth = np.stack([self._depth_from(route_id) for route_id in range(len(self.route_names))])
+
+    @staticmethod
+    def _all_pairs_distance(adjacency):
+        count = len(adjacency)
+        distance = np.full((count, count), UNREACHABLE, dtype=np.int32)
+        distance[adjacency] = 1
+        np.fill_diagonal(distance, 0)
+        for k in range(count):
+            distance = np.minimum(distance, distance[:, k, None] + distance[None, k, :])
+        return np.minimum(distance, UNREACHABLE).astype(np.int16)
+
+    def _depth_from(self, route_id):
+        depth = np.full(len(self.names), -1, dtype=np.int16)
+        frontier = [int(self.spawns[route_id])]
+        depth[frontier[0]] = 0
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for successor in self.successors[route_id, node, :self.successor_counts[route_id, node]]:
+                    if depth[successor] < 0:
+                        depth[successor] = depth[node] + 1
+                        next_frontier.append(int(successor))
+            frontier = next_frontier
+        return depth
+
+    def route_id(self, name):
+        return self.route_ids[name]
+
+    def spawn(self, name):
+        return self.names[self.spawns[self.route_ids[name]]]
+
+    def next_node(self, route_id, node, choose=None):
+        """Next node along a route, or the same node at the end of it.
+
+        choose(n) picks one of n branches and is only called when a node
+        has more than one successor.
+        """
+        count = self.successor_counts[route_id, node]
+        if count == 0:
+            return node
+        if count == 1 or choose is None:
+            return int(self.successors[route_id, node, 0])
+        return int(self.successors[route_id, node, choose(count)])
+
+    def distance_to_office(self, location):
+        """Moves from location to the nearest office door"""
+        return int(self.office_distance[self.index[location]])
+
+    def door_side(self, name):
+        """0 for routes ending at the left door, 1 for the right door"""
+        return DOORS.index(self.paths[name][-1])
+
+
+def load_location_graph(config_path=None, cameras_path=None):
+    """Compile the graph from config.py and the JSON data files"""
+    config_path = config_path or os.path.join(DATA_DIR, "game_config.json")
+    cameras_path = cameras_path or os.path.join(DATA_DIR, "camera_locations.json")
+
+    locations = list(CAMERA_LOCATIONS)
+    if os.path.exists(cameras_path):
+        with open(cameras_path) as f:
+            locations.extend(name for name in json.load(f)["cameras"] if name not in locations)
+
+    with open(config_path) as f:
+        animatronic_configs = json.load(f)["animatronic_configs"]
+
+    routes = {}
+    for name, settings in animatronic_configs.items():
+        if "movement_paths" in settings:
+            routes[name] = [list(path) for path in settings["movement_paths"]]
+        else:
+            routes[name] = [list(settings["movement_path"])]
+
+    return LocationGraph(locations, routes, ANIMATRONIC_SPAWNS)
+
+
+_shared_graph = None
+
+
+def get_location_graph():
+    """Graph shared by every animatronic and simulator"""
+    global _shared_graph
+    if _shared_graph is None:
+        _shared_graph = load_location_graph()
+    return _shared_graph
@@ -2,17 +2,31 @@ from config import *
 
 
 class PowerSystem:
+    """Piecewise-linear power model.
+
+    Power falls at a constant rate between load changes, so each segment is
+    stored as (start time, power at start, drain rate) and power at any time
+    is computed from it directly. Advancing over an interval is one step no
+    matter how long it is, and nothing accumulates per frame: the clock is
+    kept as a tick count times the tick length since the last change of
+    tick length.
+    """
+
     def __init__(self):
-        self.current_power = TOTAL_POWER
         self.max_power = TOTAL_POWER
         self.is_power_out = False
 
-    def drain_power(self, dt, camera_active=False, left_door_closed=False,
-                    right_door_closed=False, left_light_on=False, right_light_on=False):
-        """Drain power based on active systems"""
-        if self.is_power_out:
-            return
+        self.clock_epoch = 0.0  # time when the current tick length started
+        self.clock_ticks = 0
+        self.tick_dt = 0.0
+        self.segment_start = 0.0
+        self.segment_power = TOTAL_POWER
+        self.drain_rate = POWER_DRAIN_BASE
 
+    @staticmethod
+    def load_drain_rate(camera_active=False, left_door_closed=False, right_door_closed=False,
+                        left_light_on=False, right_light_on=False):
+        """Drain per second with the given systems running"""
         drain_rate = POWER_DRAIN_BASE
 
         if camera_active:
@@ -25,12 +39,73 @@ class PowerSystem:
             drain_rate += POWER_DRAIN_LIGHT
         if right_light_on:
             drain_rate += POWER_DRAIN_LIGHT
+        return drain_rate
 
-        self.current_power -= drain_rate * dt
+    @property
+    def time(self):
+        return self.clock_epoch + self.clock_ticks * self.tick_dt
 
-        if self.current_power <= 0:
-            self.current_power = 0
+    @property
+    def current_power(self):
+        return self.power_at(self.time)
+
+    @current_power.setter
+    def current_power(self, power):
+        self.segment_start = self.time
+        self.segment_power = power
+
+    def power_at(self, time):
+        """Power at a time on the current segment, 0 once it runs out"""
+        return max(0.0, self.segment_power - self.drain_rate * (time - self.segment_start))
+
+    def outage_time(self):
+        """Time power reaches 0 if the load stays as it is"""
+        return self.segment_start + self.segment_power / self.drain_rate
+
+    def time_until(self, power):
+        """Seconds until power falls to `power` at the current load"""
+        return max(0.0, (self.current_power - power) / self.drain_rate)
+
+    def time_until_outage(self):
+        if self.is_power_out:
+            return 0.0
+        return max(0.0, self.outage_time() - self.time)
+
+    def set_load(self, camera_active=False, left_door_closed=False, right_door_closed=False,
+                 left_light_on=False, right_light_on=False):
+        """Start a new segment if the running systems changed the drain rate"""
+        drain_rate = self.load_drain_rate(camera_active, left_door_closed, right_door_closed,
+                                          left_light_on, right_light_on)
+        if drain_rate != self.drain_rate:
+            self.segment_power = self.current_power
+            self.segment_start = self.time
+            self.drain_rate = drain_rate
+
+    def advance(self, dt):
+        """Move the clock on by dt in one step; returns True if power ran out"""
+        if self.is_power_out:
+            return False
+
+        if dt != self.tick_dt:
+            self.clock_epoch = self.time
+            self.clock_ticks = 0
+            self.tick_dt = dt
+        self.clock_ticks += 1
+
+        if self.time >= self.outage_time():
+            self.segment_start = self.time
+            self.segment_power = 0.0
             self.is_power_out = True
+        return self.is_power_out
+
+    def drain_power(self, dt, camera_active=False, left_door_closed=False,
+                    right_door_closed=False, left_light_on=False, right_light_on=False):
+        """Drain power based on active systems"""
+        if self.is_power_out:
+            return
+
+        self.set_load(camera_active, left_door_closed, right_door_closed, left_light_on, right_light_on)
+        self.advance(dt)
 
     def get_power_percentage(self):
         return (self.current_power / self.max_power) * 100
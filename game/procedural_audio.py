@@ -0,0 +1,155 @@
+import threading
+import numpy as np
+import pygame
+
+# Sample formats pygame.mixer can be fed directly, by mixer size
+SAMPLE_FORMATS = {-16: ("<i2", 32767), 32: ("<f4", 1.0)}
+
+# Pink noise filter used by AudioGenerator.generate_noise: y[n] = x[n] - 0.5 y[n-1]
+PINK_POLE = 0.5
+FILTER_BLOCK = 64
+
+
+def one_pole_filter(x, pole, state):
+    """Same result as scipy's lfilter([1], [1, pole], x, zi=state), in NumPy.
+
+    Samples are filtered in blocks: a small Toeplitz matrix of decay powers
+    gives each block's response from zero state, then the state carried in
+    from the previous block is added. Returns (y, new state).
+    """
+    frames = len(x)
+    blocks = -(-frames // FILTER_BLOCK)
+    padded = np.zeros(blocks * FILTER_BLOCK)
+    padded[:frames] = x
+
+    decay = (-pole) ** np.arange(FILTER_BLOCK)
+    lags = np.subtract.outer(np.arange(FILTER_BLOCK), np.arange(FILTER_BLOCK))
+    toeplitz = np.where(lags >= 0, decay[np.clip(lags, 0, None)], 0.0)
+    y = padded.reshape(blocks, FILTER_BLOCK) @ toeplitz.T
+
+    carry = float(state[0])
+    for block in y:
+        block += carry * decay
+        carry = -pole * block[-1]
+    # Zero padding past the end must not leak into the returned state
+    last = y.reshape(-1)[frames - 1] if frames else 0.0
+    return y.reshape(-1)[:frames], np.array([-pole * last if frames else carry])
+
+
+class HumRecipe:
+    """Electrical hum: mains tone plus harmonic with a slow wobble.
+
+    Same recipe as AudioGenerator.create_ambient_sounds, but computed from
+    an absolute sample position so chunks join without a seam and the
+    stream never loops.
+    """
+
+    def __init__(self, tones=((60, 0.1), (120, 0.05)), wobble_rate=0.1, wobble_depth=0.02):
+        self.tones = tones
+        self.wobble_rate = wobble_rate
+        self.wobble_depth = wobble_depth
+        self.peak = sum(amplitude for _, amplitude in tones) * (1 + wobble_depth)
+
+    def render(self, start, frames, sample_rate):
+        t = (start + np.arange(frames)) / sample_rate
+        wave = np.zeros(frames)
+        for frequency, amplitude in self.tones:
+            wave += amplitude * np.sin(2 * np.pi * frequency * t)
+        wave *= 1 + self.wobble_depth * np.sin(2 * np.pi * self.wobble_rate * t)
+        wave /= self.peak
+        return wave
+
+
+class NoiseRecipe:
+    """Pink noise with an optional slow level cycle (air conditioning, static).
+
+    The filter state is carried between chunks so the noise colour is
+    continuous across chunk boundaries.
+    """
+
+    def __init__(self, level=0.9, cycle_rate=0.0, cycle_depth=0.0, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.cycle_rate = cycle_rate
+        self.cycle_depth = cycle_depth
+        self.state = np.zeros(1)
+        # Pink noise here has a standard deviation of about 1.15; ~4.5 sigma
+        # matches the peak the pre-rendered files were normalised to
+        self.gain = level / (4.5 * 1.15 * (1 + cycle_depth))
+
+    def render(self, start, frames, sample_rate):
+        white = self.rng.normal(0, 1, frames)
+        wave, self.state = one_pole_filter(white, PINK_POLE, self.state)
+        if self.cycle_depth:
+            t = (start + np.arange(frames)) / sample_rate
+            wave *= 1 + self.cycle_depth * np.sin(2 * np.pi * self.cycle_rate * t)
+        wave *= self.gain
+        np.clip(wave, -1, 1, out=wave)
+        return wave
+
+
+# Streamable replacements for pre-rendered loops, keyed by their WAV name
+PROCEDURAL_SOUNDS = {
+    "electrical_hum.wav": HumRecipe,
+    "air_conditioning.wav": lambda: NoiseRecipe(cycle_rate=0.2, cycle_depth=0.3),
+    "camera_static.wav": NoiseRecipe,
+}
+
+
+class AudioStream:
+    """Plays a recipe on one mixer channel, synthesised a chunk at a time.
+
+    A background thread keeps exactly one chunk queued behind the one
+    playing, so memory stays at two chunks however long the stream runs.
+    """
+
+    def __init__(self, recipe, channel, volume=1.0, chunk_duration=0.25):
+        self.recipe = recipe
+        self.channel = channel
+        self.volume = volume
+        self.chunk_duration = chunk_duration
+        self.position = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        frequency, size, channels = pygame.mixer.get_init()
+        if size not in SAMPLE_FORMATS:
+            raise ValueError(f"Cannot stream to a mixer with sample size {size}")
+        self.sample_rate = frequency
+        self.channels = channels
+        self.dtype, self.scale = SAMPLE_FORMATS[size]
+        self.chunk_frames = max(1, int(frequency * chunk_duration))
+
+    def next_chunk(self):
+        """Synthesise the next chunk as a Sound in the mixer's format"""
+        wave = self.recipe.render(self.position, self.chunk_frames, self.sample_rate)
+        self.position += self.chunk_frames
+        samples = np.repeat((wave * self.scale).astype(self.dtype)[:, None], self.channels, axis=1)
+        return pygame.mixer.Sound(buffer=samples.tobytes())
+
+    def start(self):
+        self.channel.set_volume(self.volume)
+        self.channel.play(self.next_chunk())
+        self.channel.queue(self.next_chunk())
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def _run(self):
+        while not self.stop_event.wait(self.chunk_duration / 4):
+            if self.channel.get_queue() is None:
+                self.channel.queue(self.next_chunk())
+
+    def set_volume(self, volume):
+        self.volume = volume
+        self.channel.set_volume(volume)
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.channel.stop()
+
+    @property
+    def is_playing(self):
+        return self.thread is not None
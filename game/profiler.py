@@ -0,0 +1,151 @@
+import csv
+import json
+import time
+import numpy as np
+
+PERCENTILES = (50, 95, 99)
+
+
+class RingBuffer:
+    """Last `capacity` samples in a fixed preallocated array"""
+
+    def __init__(self, capacity):
+        self.samples = np.zeros(capacity)
+        self.index = 0
+        self.count = 0
+        self.total = 0
+
+    def append(self, value):
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % len(self.samples)
+        self.count = min(self.count + 1, len(self.samples))
+        self.total += 1
+
+    def values(self):
+        """Samples held, oldest first"""
+        if self.count < len(self.samples):
+            return self.samples[:self.count].copy()
+        return np.roll(self.samples, -self.index)
+
+
+class Section:
+    """Context manager timing one named section into its ring buffer"""
+
+    __slots__ = ("buffer", "start")
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.buffer.append(time.perf_counter() - self.start)
+        return False
+
+
+class NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SECTION = NullSection()
+
+
+class FrameProfiler:
+    """Per-frame timings for named subsystems.
+
+    Wrap work in `with profiler.section("name"):`. Each name keeps its last
+    `capacity` timings in a ring buffer, so memory is fixed however long
+    the game runs. When disabled, section() returns a shared no-op context
+    and nothing is recorded.
+    """
+
+    def __init__(self, capacity=600, enabled=True):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.buffers = {}
+        self.sections = {}
+
+    def section(self, name):
+        if not self.enabled:
+            return NULL_SECTION
+        section = self.sections.get(name)
+        if section is None:
+            section = Section(self.buffer(name))
+            self.sections[name] = section
+        return section
+
+    def buffer(self, name):
+        buffer = self.buffers.get(name)
+        if buffer is None:
+            buffer = RingBuffer(self.capacity)
+            self.buffers[name] = buffer
+        return buffer
+
+    def record(self, name, seconds):
+        """Add a timing measured elsewhere"""
+        if self.enabled:
+            self.buffer(name).append(seconds)
+
+    def clear(self):
+        self.buffers.clear()
+        self.sections.clear()
+
+    def stats(self, name):
+        """count, mean, p50, p95, p99 and max in milliseconds over the window"""
+        buffer = self.buffers[name]
+        samples = buffer.values() * 1000.0
+        if not len(samples):
+            return {"count": 0, "total": buffer.total}
+        result = {"count": len(samples), "total": buffer.total,
+                  "mean": float(samples.mean()), "max": float(samples.max())}
+        for percentile, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES)):
+            result[f"p{percentile}"] = float(value)
+        return result
+
+    def summary(self):
+        return {name: self.stats(name) for name in self.buffers}
+
+    def overlay_rows(self):
+        """Cells for the on-screen overlay, slowest p95 first"""
+        summary = self.summary()
+        names = sorted((n for n in summary if summary[n]["count"]),
+                       key=lambda n: summary[n]["p95"], reverse=True)
+        rows = [("ms", "p50", "p95", "p99")]
+        for name in names:
+            s = summary[name]
+            rows.append((name, f"{s['p50']:.2f}", f"{s['p95']:.2f}", f"{s['p99']:.2f}"))
+        return rows
+
+    def export_csv(self, path):
+        """One row of statistics per section"""
+        columns = ["section", "count", "total", "mean", "p50", "p95", "p99", "max"]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            for name, stats in sorted(self.summary().items()):
+                writer.writerow({"section": name, **stats})
+
+    def export_json(self, path, include_samples=False):
+        """Statistics per section, optionally with the raw window in ms"""
+        data = {"units": "ms", "capacity": self.capacity, "sections": self.summary()}
+        if include_samples:
+            data["samples"] = {name: (buffer.values() * 1000.0).round(4).tolist()
+                               for name, buffer in self.buffers.items()}
+        with open(path, "w") as f:
+            json.dump(data, f, indent=4, sort_keys=True)
+
+    def export(self, path):
+        """Write CSV or JSON depending on the file extension"""
+        if path.endswith(".csv"):
+            self.export_csv(path)
+        else:
+            self.export_json(path)
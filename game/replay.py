@@ -0,0 +1,186 @@
+import json
+import struct
+import pygame
+from config import *
+
+# Log layout: header, then tick-stamped records until an END record
+REPLAY_MAGIC = b"PNRP"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sHQHI")  # magic, version, game seed, first night, its seed
+MAX_SEED = 2 ** 64 - 1  # seeds must fit the header's unsigned 64-bit field
+RECORD = struct.Struct("<IB")  # tick, kind
+
+CLICK, CONTROL, NIGHT, QUIT, DT, END = range(6)
+PAYLOADS = {
+    CLICK: struct.Struct("<BHH"),  # mouse button, x, y
+    CONTROL: struct.Struct("<B"),  # index into CONTROLS
+    NIGHT: struct.Struct("<BHI"),  # NIGHT_ACTIONS index, night, night seed
+    QUIT: struct.Struct("<"),
+    DT: struct.Struct("<d"),  # update dt from this tick on
+    END: struct.Struct("<I"),  # length of the JSON final state that follows
+}
+
+CONTROLS = ("left_door", "right_door", "left_light", "right_light", "camera")
+NIGHT_ACTIONS = ("restart_night", "start_next_night")
+
+
+def state_summary(game_manager):
+    """Everything a replay must reproduce exactly, as plain JSON types"""
+    return {
+        "tick": game_manager.tick_count,
+        "game_state": game_manager.game_state,
+        "night": game_manager.current_night,
+        "night_seed": game_manager.night_seed,
+        "hour": game_manager.current_hour,
+        "hour_timer": game_manager.hour_timer,
+        "power": game_manager.power_system.current_power,
+        "doors": [game_manager.left_door_closed, game_manager.right_door_closed],
+        "lights": [game_manager.left_light_on, game_manager.right_light_on],
+        "camera": game_manager.camera_system.current_camera,
+        "animatronics": {name: animatronic.current_location
+                         for name, animatronic in game_manager.ai_director.animatronics.items()},
+        "killed_by": (game_manager.jumpscare_animatronic.name
+                      if game_manager.jumpscare_animatronic else None),
+    }
+
+
+class ReplayRecorder:
+    """Writes a game's seed and inputs to a compact binary log.
+
+    Attach with GameManager.attach_recorder(). Every record is stamped with
+    the number of simulation ticks run before it, so a replay applies it
+    between the same two updates.
+    """
+
+    def __init__(self, path_or_file):
+        if isinstance(path_or_file, (str, bytes)):
+            self.file = open(path_or_file, "wb")
+            self.owns_file = True
+        else:
+            self.file = path_or_file
+            self.owns_file = False
+        self.game_manager = None
+        self.dt = None
+
+    def start(self, game_manager):
+        if not 0 <= game_manager.seed <= MAX_SEED:
+            raise ValueError(f"Cannot record seed {game_manager.seed}; it must be between 0 and {MAX_SEED}")
+        self.game_manager = game_manager
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, game_manager.seed,
+                                    game_manager.current_night, game_manager.night_seed))
+
+    def record(self, kind, *values):
+        self.file.write(RECORD.pack(self.game_manager.tick_count, kind))
+        self.file.write(PAYLOADS[kind].pack(*values))
+
+    def record_tick(self, dt):
+        if dt != self.dt:
+            self.dt = dt
+            self.record(DT, dt)
+
+    def record_click(self, button, pos):
+        self.record(CLICK, button, pos[0], pos[1])
+
+    def record_control(self, control):
+        if control in CONTROLS:
+            self.record(CONTROL, CONTROLS.index(control))
+
+    def record_night(self, action):
+        game_manager = self.game_manager
+        self.record(NIGHT, NIGHT_ACTIONS.index(action), game_manager.current_night,
+                    game_manager.night_seed)
+
+    def record_quit(self):
+        self.record(QUIT)
+
+    def close(self):
+        """Write the final state, which replays are checked against"""
+        state = json.dumps(state_summary(self.game_manager), sort_keys=True).encode("utf-8")
+        self.record(END, len(state))
+        self.file.write(state)
+        if self.owns_file:
+            self.file.close()
+
+
+def read_replay(path_or_file):
+    """Return (header, records) with records as (tick, kind, values) tuples"""
+    if isinstance(path_or_file, (str, bytes)):
+        with open(path_or_file, "rb") as f:
+            data = f.read()
+    else:
+        data = path_or_file.read()
+
+    if len(data) < HEADER.size:
+        raise ValueError("truncated replay log")
+    magic, version, seed, night, night_seed = HEADER.unpack_from(data)
+    if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+        raise ValueError(f"Not a version {REPLAY_VERSION} replay log")
+    header = {"seed": seed, "night": night, "night_seed": night_seed}
+
+    records = []
+    offset = HEADER.size
+    while offset < len(data):
+        if offset + RECORD.size > len(data):
+            raise ValueError("truncated replay log")
+        tick, kind = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        if kind not in PAYLOADS:
+            raise ValueError(f"Unknown replay record kind {kind} at byte {offset - RECORD.size}")
+        if offset + PAYLOADS[kind].size > len(data):
+            raise ValueError("truncated replay log")
+        values = PAYLOADS[kind].unpack_from(data, offset)
+        offset += PAYLOADS[kind].size
+        if kind == END:
+            length = values[0]
+            if offset + length > len(data):
+                raise ValueError("truncated replay log")
+            values = json.loads(data[offset:offset + length])
+            offset += length
+        records.append((tick, kind, values))
+    return header, records
+
+
+def replay(path_or_file, screen=None):
+    """Re-run a log headless as fast as possible.
+
+    Returns (expected, actual) final state summaries; they are equal when
+    the replay reproduced the recorded game.
+    """
+    # Imported here so the SDL drivers can be chosen before pygame starts
+    from .audio_manager import NullAudioManager
+    from .game_manager import GameManager
+
+    header, records = read_replay(path_or_file)
+    if not pygame.get_init():
+        pygame.init()
+    screen = screen or pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game_manager = GameManager(screen, NullAudioManager(), seed=header["seed"])
+    game_manager.current_night = header["night"]
+    if game_manager.night_seed != header["night_seed"]:
+        raise ValueError("Replay log was recorded with a different seed derivation")
+
+    dt = 1.0 / SIMULATION_TICK_RATE
+    expected = None
+    for tick, kind, values in records:
+        while game_manager.tick_count < tick:
+            game_manager.update(dt)
+
+        if kind == DT:
+            dt = values[0]
+        elif kind == CLICK:
+            button, x, y = values
+            game_manager.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=(x, y)))
+        elif kind == CONTROL:
+            game_manager.handle_control_input(CONTROLS[values[0]])
+        elif kind == NIGHT:
+            action, night, night_seed = values
+            getattr(game_manager, NIGHT_ACTIONS[action])()
+            if (game_manager.current_night, game_manager.night_seed) != (night, night_seed):
+                raise ValueError(f"Replay diverged at tick {tick}: night {game_manager.current_night} "
+                                 f"seed {game_manager.night_seed}, log has night {night} seed {night_seed}")
+        elif kind == QUIT:
+            game_manager.should_quit = True
+        elif kind == END:
+            expected = values
+
+    return expected, state_summary(game_manager)
@@ -0,0 +1,201 @@
+import struct
+
+# Snapshot layout: header, fixed-size sections, then variable-length lists
+SNAPSHOT_MAGIC = b"PNSS"
+SNAPSHOT_VERSION = 3
+HEADER = struct.Struct("<4sHBB")  # magic, version, animatronic count, event count
+
+# night, hour, hour timer, state, doors, lights, light timer, jumpscare timer,
+# jumpscare animatronic, power out timer, tick count, night seed, previous power
+GAME = struct.Struct("<HBdB????ddBdQId")
+# clock epoch, clock ticks, tick length, segment start, segment power, drain rate, power out
+POWER = struct.Struct("<dQdddd?")
+CAMERA = struct.Struct("<H?dd?")  # camera node, up, static timer, static duration, static shown
+# clock, aggression state set, its night, low power, director night, director power,
+# director outage ETA set, director outage ETA
+DIRECTOR = struct.Struct("<d?H?Hd?d")
+# node, path index, move timer, move interval, aggression, active, move started,
+# watched, watch started, run phase, camera check timer
+ANIMATRONIC = struct.Struct("<Hhddd?d?dbd")
+EVENT = struct.Struct("<BBd")  # animatronic index, event kind, deadline
+RNG = struct.Struct("<B625I?d")  # Mersenne Twister version, state, has gauss, gauss
+
+GAME_STATES = ("playing", "power_out", "game_over", "victory")
+EVENT_KINDS = ("move", "watch_timeout")
+NONE_INDEX = 0xFF
+NO_NODE = 0xFFFF
+
+
+def pack_rng(state):
+    version, internal, gauss = state
+    return RNG.pack(version, *internal, gauss is not None, gauss or 0.0)
+
+
+def unpack_rng(data, offset):
+    values = RNG.unpack_from(data, offset)
+    return (values[0], values[1:626], values[627] if values[626] else None)
+
+
+class GameSnapshot:
+    """Everything that drives a night, held as flat tuples.
+
+    capture() and restore() only read and write attributes, so they run in
+    microseconds; to_bytes() packs the same tuples into a versioned binary
+    form for saving or sending elsewhere.
+    """
+
+    __slots__ = ("game", "power", "camera", "director", "animatronics", "events", "rng_states")
+
+    def __init__(self, game, power, camera, director, animatronics, events, rng_states):
+        self.game = game
+        self.power = power
+        self.camera = camera
+        self.director = director
+        self.animatronics = animatronics
+        self.events = events
+        self.rng_states = rng_states  # one per animatronic, the camera's, then the night seed source
+
+    def to_bytes(self):
+        parts = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(self.animatronics), len(self.events)),
+                 GAME.pack(*self.game), POWER.pack(*self.power), CAMERA.pack(*self.camera),
+                 DIRECTOR.pack(*self.director)]
+        parts.extend(ANIMATRONIC.pack(*values) for values in self.animatronics)
+        parts.extend(EVENT.pack(*values) for values in self.events)
+        parts.extend(pack_rng(state) for state in self.rng_states)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, animatronic_count, event_count = HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"Not a version {SNAPSHOT_VERSION} game snapshot")
+
+        offset = HEADER.size
+        sections = []
+        for layout in (GAME, POWER, CAMERA, DIRECTOR):
+            sections.append(layout.unpack_from(data, offset))
+            offset += layout.size
+
+        animatronics = []
+        for _ in range(animatronic_count):
+            animatronics.append(ANIMATRONIC.unpack_from(data, offset))
+            offset += ANIMATRONIC.size
+        events = []
+        for _ in range(event_count):
+            events.append(EVENT.unpack_from(data, offset))
+            offset += EVENT.size
+        rng_states = []
+        for _ in range(animatronic_count + 2):
+            rng_states.append(unpack_rng(data, offset))
+            offset += RNG.size
+
+        return cls(*sections, animatronics, events, rng_states)
+
+
+def capture(game_manager):
+    """Snapshot a GameManager and every system it drives"""
+    director = game_manager.ai_director
+    camera = game_manager.camera_system
+    graph_index = director.animatronics[next(iter(director.animatronics))].graph.index
+    names = list(director.animatronics)
+
+    jumpscare = game_manager.jumpscare_animatronic
+    game = (game_manager.current_night, game_manager.current_hour, game_manager.hour_timer,
+            GAME_STATES.index(game_manager.game_state),
+            game_manager.left_door_closed, game_manager.right_door_closed,
+            game_manager.left_light_on, game_manager.right_light_on,
+            game_manager.light_timer, game_manager.jumpscare_timer,
+            names.index(jumpscare.name) if jumpscare else NONE_INDEX,
+            game_manager.power_out_timer, game_manager.tick_count, game_manager.night_seed,
+            game_manager.previous_power)
+    power_system = game_manager.power_system
+    power = (power_system.clock_epoch, power_system.clock_ticks, power_system.tick_dt,
+             power_system.segment_start, power_system.segment_power,
+             power_system.drain_rate, power_system.is_power_out)
+    camera_state = (graph_index.get(camera.current_camera, NO_NODE), camera.is_camera_up,
+                    camera.static_timer, camera.static_duration, camera.show_static)
+
+    aggression_state = director.aggression_state
+    director_state = (director.scheduler.time, aggression_state is not None,
+                      aggression_state[0] if aggression_state else 0,
+                      aggression_state[1] if aggression_state else False,
+                      getattr(director, "night_number", 0), getattr(director, "power_level", 0.0),
+                      getattr(director, "outage_eta", None) is not None,
+                      getattr(director, "outage_eta", None) or 0.0)
+
+    animatronics = []
+    for name, animatronic in director.animatronics.items():
+        animatronics.append((animatronic.node, animatronic.path_index, animatronic.move_timer,
+                             animatronic.move_interval, animatronic.aggression, animatronic.is_active,
+                             director.move_started[name], director.watched.get(name, False),
+                             director.watch_started.get(name, 0.0),
+                             getattr(animatronic, "run_phase", 0),
+                             getattr(animatronic, "camera_check_timer", 0.0)))
+
+    events = [(names.index(name), EVENT_KINDS.index(kind), deadline)
+              for (name, kind), deadline in director.scheduler.events()]
+    rng_states = [a.rng.getstate() for a in director.animatronics.values()]
+    rng_states.append(camera.rng.getstate())
+    rng_states.append(game_manager.seed_source.getstate())
+
+    return GameSnapshot(game, power, camera_state, director_state, animatronics, events, rng_states)
+
+
+def restore(game_manager, snapshot):
+    """Put a GameManager back into the state a snapshot was captured in.
+
+    The roster must match the one captured. Systems are updated in place,
+    so listeners and references to them stay valid.
+    """
+    director = game_manager.ai_director
+    camera = game_manager.camera_system
+    animatronics = list(director.animatronics.values())
+    if len(animatronics) != len(snapshot.animatronics):
+        raise ValueError("Snapshot was taken with a different animatronic roster")
+    graph = animatronics[0].graph
+
+    (game_manager.current_night, game_manager.current_hour, game_manager.hour_timer, state,
+     game_manager.left_door_closed, game_manager.right_door_closed,
+     game_manager.left_light_on, game_manager.right_light_on,
+     game_manager.light_timer, game_manager.jumpscare_timer, jumpscare,
+     game_manager.power_out_timer, game_manager.tick_count, game_manager.night_seed,
+     game_manager.previous_power) = snapshot.game
+    game_manager.game_state = GAME_STATES[state]
+    game_manager.jumpscare_animatronic = animatronics[jumpscare] if jumpscare != NONE_INDEX else None
+
+    power_system = game_manager.power_system
+    (power_system.clock_epoch, power_system.clock_ticks, power_system.tick_dt,
+     power_system.segment_start, power_system.segment_power,
+     power_system.drain_rate, power_system.is_power_out) = snapshot.power
+
+    node, camera.is_camera_up, camera.static_timer, camera.static_duration, camera.show_static = \
+        snapshot.camera
+    camera.current_camera = graph.names[node] if node != NO_NODE else None
+    camera.rng.setstate(snapshot.rng_states[-2])
+    game_manager.seed_source.setstate(snapshot.rng_states[-1])
+
+    (clock, has_aggression, night, low_power, director.night_number, director.power_level,
+     has_eta, outage_eta) = snapshot.director
+    director.outage_eta = outage_eta if has_eta else None
+    director.aggression_state = (night, low_power) if has_aggression else None
+
+    for animatronic, values, rng_state in zip(animatronics, snapshot.animatronics, snapshot.rng_states):
+        (node, path_index, animatronic.move_timer, animatronic.move_interval, animatronic.aggression,
+         animatronic.is_active, move_started, watched, watch_started, run_phase, check_timer) = values
+        name = animatronic.name
+        # Through the location setter so the director's occupancy index follows
+        animatronic.node = node
+        animatronic.current_location = graph.names[node]
+        animatronic.path_index = path_index
+        director.move_started[name] = move_started
+        if name in director.watchers:
+            director.watched[name] = watched
+            director.watch_started[name] = watch_started
+            animatronic.run_phase = run_phase
+            animatronic.camera_check_timer = check_timer
+        animatronic.rng.setstate(rng_state)
+
+    director.scheduler.clear()
+    director.scheduler.time = clock
+    for index, kind, deadline in snapshot.events:
+        director.schedule_event(animatronics[index].name, EVENT_KINDS[kind], deadline)
@@ -0,0 +1,71 @@
+import numpy as np
+import pygame
+from config import *
+
+
+class StaticFramePool:
+    """Camera static frames generated once and cycled while static shows.
+
+    Each frame is a per-pixel alpha surface: a translucent white wash with
+    blocky black, white and grey speckles. density is the fraction of
+    speckle cells, and frame_at() maps elapsed static time to a frame at
+    frames_per_second.
+    """
+
+    def __init__(self, size, frame_count=8, density=STATIC_DENSITY, wash_alpha=100,
+                 cell_size=3, frames_per_second=24, seed=None):
+        self.size = size
+        self.frame_count = frame_count
+        self.density = density
+        self.wash_alpha = wash_alpha
+        self.cell_size = cell_size
+        self.frames_per_second = frames_per_second
+        self.rng = np.random.default_rng(seed)
+        self.frames = [self._build_frame() for _ in range(frame_count)]
+
+    def _build_frame(self):
+        width, height = self.size
+        cells_x = -(-width // self.cell_size)
+        cells_y = -(-height // self.cell_size)
+
+        # Pick speckle cells and their shade on a coarse grid, then upscale
+        speckle = self.rng.random((cells_x, cells_y)) < self.density
+        palette = np.array([BLACK, WHITE, LIGHT_GRAY], dtype=np.uint8)
+        shade = palette[self.rng.integers(0, len(palette), (cells_x, cells_y))]
+
+        speckle = speckle.repeat(self.cell_size, 0).repeat(self.cell_size, 1)[:width, :height]
+        shade = shade.repeat(self.cell_size, 0).repeat(self.cell_size, 1)[:width, :height]
+
+        rgb = np.where(speckle[..., None], shade, np.array(WHITE, dtype=np.uint8))
+        alpha = np.where(speckle, 255, self.wash_alpha).astype(np.uint8)
+
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        pygame.surfarray.blit_array(surface, rgb)
+        pixels_alpha = pygame.surfarray.pixels_alpha(surface)
+        pixels_alpha[...] = alpha
+        del pixels_alpha  # Unlock the surface
+
+        # Match the display format for fast blits when a display exists
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def frame_index(self, elapsed):
+        """Frame shown after elapsed seconds of static"""
+        return int(elapsed * self.frames_per_second) % self.frame_count
+
+    def frame_at(self, elapsed):
+        return self.frames[self.frame_index(elapsed)]
+
+
+_shared_pools = {}
+
+
+def get_static_frames(size, density=STATIC_DENSITY):
+    """Pool shared by every camera feed of this size and static density"""
+    key = (tuple(size), density)
+    pool = _shared_pools.get(key)
+    if pool is None:
+        pool = StaticFramePool(size, density=density)
+        _shared_pools[key] = pool
+    return pool
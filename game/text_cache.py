@@ -0,0 +1,66 @@
+import pygame
+from collections import OrderedDict
+
+
+class TextCache:
+    """Shared cache of fonts and rendered text surfaces.
+
+    Surfaces are keyed by (font, size, string, colour) and evicted least
+    recently used first once their pixel memory exceeds max_bytes. Fonts
+    are created once per (font, size) and never evicted.
+    """
+
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size, font_name=None):
+        """Return the shared font for this name and size"""
+        key = (font_name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(font_name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text, size, color, font_name=None):
+        """Return an antialiased surface for text, rendering it only once"""
+        key = (font_name, size, text, color)
+        entry = self.surfaces.get(key)
+        if entry is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surface = self.get_font(size, font_name).render(text, True, color)
+        cost = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self.surfaces[key] = (surface, cost)
+        self.used_bytes += cost
+
+        # Evict oldest entries, but always keep the one just rendered
+        while self.used_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, (_, old_cost) = self.surfaces.popitem(last=False)
+            self.used_bytes -= old_cost
+
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+        self.used_bytes = 0
+
+
+_shared_cache = None
+
+
+def get_text_cache():
+    """Cache shared by every renderer"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = TextCache()
+    return _shared_cache
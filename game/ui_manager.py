@@ -1,13 +1,19 @@
 import pygame
+from .dirty_rects import DirtyRegionTracker
+from .text_cache import get_text_cache
 from config import *
 
 
 class UIManager:
-    def __init__(self, screen):
+    def __init__(self, screen, dirty_regions=None):
         self.screen = screen
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
+        self.dirty_regions = dirty_regions or DirtyRegionTracker(screen.get_rect(), enabled=False)
+        self.text_cache = get_text_cache()
+
+        # Screen regions owned by the status displays
+        self.power_region = pygame.Rect(50, 50, 530, 36)
+        self.time_region = pygame.Rect(SCREEN_WIDTH - 200, 50, 200, 36)
+        self.eta_region = pygame.Rect(600, 50, 300, 36)
 
         # Button rectangles
         self.left_door_button = pygame.Rect(50, 600, 100, 50)
@@ -16,7 +22,8 @@ class UIManager:
         self.right_light_button = pygame.Rect(920, 600, 100, 50)
         self.right_door_button = pygame.Rect(1030, 600, 100, 50)
 
-        # Camera selection buttons
+        # Camera selection panel and buttons
+        self.camera_panel = pygame.Rect(30, 180, 500, 200)
         self.camera_buttons = {}
         x_start, y_start = 50, 200
         for i, location in enumerate(CAMERA_LOCATIONS.keys()):
@@ -24,9 +31,25 @@ class UIManager:
             y = y_start + (i // 4) * 40
             self.camera_buttons[location] = pygame.Rect(x, y, 110, 30)
 
-    def render_power_display(self, power_system):
-        """Render power indicator"""
-        power_percentage = power_system.get_power_percentage()
+        # Jumpscare and victory overlays, rebuilt when the screen size changes
+        self.overlays = {}
+        self.overlay_size = None
+
+    def render_power_display(self, power_system, power_percentage=None, outage_eta=None):
+        """Render power indicator, optionally at an interpolated percentage,
+        and the time left until an outage at the current load"""
+        if outage_eta is not None:
+            self.render_outage_eta(outage_eta)
+
+        if power_percentage is None:
+            power_percentage = power_system.get_power_percentage()
+        fill_width = int((power_percentage / 100) * 296)
+        color = power_system.get_power_bar_color()
+        label = f"POWER: {power_percentage:.1f}%"
+
+        if not self.dirty_regions.changed("power", self.power_region, (fill_width, color, label)):
+            return
+        pygame.draw.rect(self.screen, BLACK, self.power_region)
 
         # Power bar background
         power_bg = pygame.Rect(50, 50, 300, 30)
@@ -34,77 +57,72 @@ class UIManager:
         pygame.draw.rect(self.screen, WHITE, power_bg, 2)
 
         # Power bar fill
-        fill_width = int((power_percentage / 100) * 296)
         power_fill = pygame.Rect(52, 52, fill_width, 26)
-        color = power_system.get_power_bar_color()
         pygame.draw.rect(self.screen, color, power_fill)
 
         # Power text
-        power_text = self.font_medium.render(f"POWER: {power_percentage:.1f}%", True, WHITE)
+        power_text = self.text_cache.render(label, 36, WHITE)
         self.screen.blit(power_text, (360, 50))
 
+    def render_outage_eta(self, outage_eta):
+        minutes, seconds = divmod(int(outage_eta), 60)
+        label = f"OUT IN {minutes}:{seconds:02d}"
+
+        if not self.dirty_regions.changed("power_eta", self.eta_region, label):
+            return
+        pygame.draw.rect(self.screen, BLACK, self.eta_region)
+
+        eta_text = self.text_cache.render(label, 36, WHITE)
+        self.screen.blit(eta_text, self.eta_region.topleft)
+
     def render_time_display(self, current_hour):
         """Render current time"""
         hour_display = current_hour if current_hour > 0 else 12
         am_pm = "AM"
-        time_text = self.font_medium.render(f"TIME: {hour_display}:00 {am_pm}", True, WHITE)
-        self.screen.blit(time_text, (SCREEN_WIDTH - 200, 50))
-
-    def render_control_buttons(self, left_door_closed, right_door_closed,
-                               left_light_on, right_light_on, camera_active):
-        """Render control interface buttons"""
+        label = f"TIME: {hour_display}:00 {am_pm}"
 
-        # Left door button
-        color = RED if left_door_closed else GREEN
-        pygame.draw.rect(self.screen, color, self.left_door_button)
-        pygame.draw.rect(self.screen, WHITE, self.left_door_button, 2)
-        text = self.font_small.render("L DOOR", True, WHITE)
-        text_rect = text.get_rect(center=self.left_door_button.center)
-        self.screen.blit(text, text_rect)
-
-        # Left light button
-        color = YELLOW if left_light_on else DARK_GRAY
-        pygame.draw.rect(self.screen, color, self.left_light_button)
-        pygame.draw.rect(self.screen, WHITE, self.left_light_button, 2)
-        text = self.font_small.render("L LIGHT", True, WHITE)
-        text_rect = text.get_rect(center=self.left_light_button.center)
-        self.screen.blit(text, text_rect)
+        if not self.dirty_regions.changed("time", self.time_region, label):
+            return
+        pygame.draw.rect(self.screen, BLACK, self.time_region)
 
-        # Camera button
-        color = BLUE if camera_active else DARK_GRAY
-        pygame.draw.rect(self.screen, color, self.camera_button)
-        pygame.draw.rect(self.screen, WHITE, self.camera_button, 2)
-        text = self.font_small.render("CAMERA", True, WHITE)
-        text_rect = text.get_rect(center=self.camera_button.center)
-        self.screen.blit(text, text_rect)
+        time_text = self.text_cache.render(label, 36, WHITE)
+        self.screen.blit(time_text, (SCREEN_WIDTH - 200, 50))
 
-        # Right light button
-        color = YELLOW if right_light_on else DARK_GRAY
-        pygame.draw.rect(self.screen, color, self.right_light_button)
-        pygame.draw.rect(self.screen, WHITE, self.right_light_button, 2)
-        text = self.font_small.render("R LIGHT", True, WHITE)
-        text_rect = text.get_rect(center=self.right_light_button.center)
+    def render_button(self, rect, color, label):
+        """Render a single control button"""
+        if not self.dirty_regions.changed(("button", label), rect, color):
+            return
+        pygame.draw.rect(self.screen, color, rect)
+        pygame.draw.rect(self.screen, WHITE, rect, 2)
+        text = self.text_cache.render(label, 24, WHITE)
+        text_rect = text.get_rect(center=rect.center)
         self.screen.blit(text, text_rect)
 
-        # Right door button
-        color = RED if right_door_closed else GREEN
-        pygame.draw.rect(self.screen, color, self.right_door_button)
-        pygame.draw.rect(self.screen, WHITE, self.right_door_button, 2)
-        text = self.font_small.render("R DOOR", True, WHITE)
-        text_rect = text.get_rect(center=self.right_door_button.center)
-        self.screen.blit(text, text_rect)
+    def render_control_buttons(self, left_door_closed, right_door_closed,
+                               left_light_on, right_light_on, camera_active):
+        """Render control interface buttons"""
+        self.render_button(self.left_door_button, RED if left_door_closed else GREEN, "L DOOR")
+        self.render_button(self.left_light_button, YELLOW if left_light_on else DARK_GRAY, "L LIGHT")
+        self.render_button(self.camera_button, BLUE if camera_active else DARK_GRAY, "CAMERA")
+        self.render_button(self.right_light_button, YELLOW if right_light_on else DARK_GRAY, "R LIGHT")
+        self.render_button(self.right_door_button, RED if right_door_closed else GREEN, "R DOOR")
 
     def render_camera_selection(self, camera_system):
         """Render camera selection interface"""
+        panel_rect = self.camera_panel
+        state = (camera_system.is_camera_up, camera_system.current_camera)
+        if not self.dirty_regions.changed("camera_selection", panel_rect, state):
+            return
+
         if not camera_system.is_camera_up:
+            pygame.draw.rect(self.screen, BLACK, panel_rect)
             return
 
         # Camera selection panel
-        panel_rect = pygame.Rect(30, 180, 500, 200)
         pygame.draw.rect(self.screen, DARK_GRAY, panel_rect)
         pygame.draw.rect(self.screen, WHITE, panel_rect, 2)
 
-        title = self.font_medium.render("SELECT CAMERA", True, WHITE)
+        title = self.text_cache.render("SELECT CAMERA", 36, WHITE)
         self.screen.blit(title, (panel_rect.x + 10, panel_rect.y + 10))
 
         # Camera buttons
@@ -115,42 +133,70 @@ class UIManager:
                 pygame.draw.rect(self.screen, DARK_GRAY, button_rect)
             pygame.draw.rect(self.screen, WHITE, button_rect, 1)
 
-            text = self.font_small.render(location.upper(), True, WHITE)
+            text = self.text_cache.render(location.upper(), 24, WHITE)
             text_rect = text.get_rect(center=button_rect.center)
             self.screen.blit(text, text_rect)
 
+    def get_overlay(self, kind, value):
+        """Return the composed jumpscare or victory overlay, building it once"""
+        size = self.screen.get_size()
+        if size != self.overlay_size:
+            self.overlays.clear()
+            self.overlay_size = size
+
+        key = (kind, value)
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = self.build_overlay(kind, value, size)
+            self.overlays[key] = overlay
+        return overlay
+
+    def build_overlay(self, kind, value, size):
+        """Compose a translucent full-screen overlay with its text"""
+        if kind == "jumpscare":
+            color, alpha = RED, 200
+            title, subtitle = f"{value.upper()}", "GAME OVER"
+        else:
+            color, alpha = GREEN, 150
+            title, subtitle = f"NIGHT {value} COMPLETE!", "Press SPACE to continue"
+
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill(color + (alpha,))
+
+        center_x, center_y = size[0] // 2, size[1] // 2
+        title_text = self.text_cache.render(title, 48, WHITE)
+        overlay.blit(title_text, title_text.get_rect(center=(center_x, center_y)))
+        subtitle_text = self.text_cache.render(subtitle, 36, WHITE)
+        overlay.blit(subtitle_text, subtitle_text.get_rect(center=(center_x, center_y + 60)))
+        return overlay
+
     def render_jumpscare(self, animatronic_name):
         """Render jumpscare screen"""
-        # Fill screen with red
-        jumpscare_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        jumpscare_surface.fill(RED)
-        jumpscare_surface.set_alpha(200)
-        self.screen.blit(jumpscare_surface, (0, 0))
-
-        # Jumpscare text
-        jumpscare_text = self.font_large.render(f"{animatronic_name.upper()}", True, WHITE)
-        text_rect = jumpscare_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(jumpscare_text, text_rect)
-
-        # Game over text
-        game_over_text = self.font_medium.render("GAME OVER", True, WHITE)
-        text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-        self.screen.blit(game_over_text, text_rect)
+        screen_rect = self.screen.get_rect()
+        if not self.dirty_regions.changed("overlay", screen_rect, ("jumpscare", animatronic_name)):
+            return
+        self.screen.blit(self.get_overlay("jumpscare", animatronic_name), (0, 0))
 
     def render_victory_screen(self, night_number):
         """Render victory screen"""
-        victory_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        victory_surface.fill(GREEN)
-        victory_surface.set_alpha(150)
-        self.screen.blit(victory_surface, (0, 0))
-
-        victory_text = self.font_large.render(f"NIGHT {night_number} COMPLETE!", True, WHITE)
-        text_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(victory_text, text_rect)
-
-        continue_text = self.font_medium.render("Press SPACE to continue", True, WHITE)
-        text_rect = continue_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-        self.screen.blit(continue_text, text_rect)
+        screen_rect = self.screen.get_rect()
+        if not self.dirty_regions.changed("overlay", screen_rect, ("victory", night_number)):
+            return
+        self.screen.blit(self.get_overlay("victory", night_number), (0, 0))
+
+    def render_profiler_overlay(self, rows):
+        """Render profiler timing rows in a panel at the top right"""
+        line_height = 18
+        columns = (0, 190, 245, 300)
+        rect = pygame.Rect(SCREEN_WIDTH - 370, 100, 360, 10 + line_height * len(rows))
+        if not self.dirty_regions.changed("profiler", rect, tuple(rows)):
+            return
+        pygame.draw.rect(self.screen, BLACK, rect)
+        pygame.draw.rect(self.screen, LIGHT_GRAY, rect, 1)
+        for i, row in enumerate(rows):
+            for x, cell in zip(columns, row):
+                text = self.text_cache.render(cell, 20, GREEN)
+                self.screen.blit(text, (rect.x + 6 + x, rect.y + 5 + i * line_height))
 
     def handle_click(self, pos, camera_system):
         """Handle mouse clicks on UI elements"""
@@ -1,50 +1,261 @@
+import argparse
+import os
 import pygame
 import sys
-from game.game_manager import GameManager
+import time
 from config import *
 
 
 class PizzaNights:
-    def init(self):
+    def __init__(self, headless=False, headless_dt=1.0 / FPS, dirty_rects=False, profile=False,
+                 tick_rate=SIMULATION_TICK_RATE, max_catch_up=MAX_CATCH_UP_TICKS, seed=None,
+                 record=None):
+        self.headless = headless
+        self.headless_dt = headless_dt
+        self.dirty_rects = dirty_rects
+
+        # Fixed simulation tick fed from an accumulator of real frame time
+        self.tick = 1.0 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.accumulator = 0.0
+
+        if headless:
+            # No window and no audio device; must be set before pygame.init
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        # Imported after the SDL drivers are chosen
+        from game.game_manager import GameManager
+        from game.audio_manager import NullAudioManager
+        from game.profiler import FrameProfiler
+        from game.replay import ReplayRecorder
+
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Pizza Nights - Horror Survival")
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # Frame timings; F3 shows them and turns profiling on
+        self.profiler = FrameProfiler(enabled=profile)
+        self.show_profiler = False
+        self.profiler_rows = []
+        self.profiler_refresh_frames = FPS // 4
+        self.frame_count = 0
+
         # Initialize game manager
-        self.game_manager = GameManager(self.screen)
+        audio_manager = NullAudioManager() if headless else None
+        self.game_manager = GameManager(self.screen, audio_manager, dirty_rects, self.profiler, seed)
+        if record:
+            self.game_manager.attach_recorder(ReplayRecorder(record))
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.toggle_profiler_overlay()
             else:
                 self.game_manager.handle_event(event)
 
+    def toggle_profiler_overlay(self):
+        self.show_profiler = not self.show_profiler
+        if self.show_profiler:
+            self.profiler.enabled = True
+        else:
+            self.game_manager.dirty_regions.invalidate_all()
+
     def update(self, dt):
         self.game_manager.update(dt)
 
-    def render(self):
-        self.screen.fill(BLACK)
-        self.game_manager.render()
-        pygame.display.flip()
+    def advance(self, frame_time):
+        """Run as many fixed ticks as frame_time covers; returns the tick count"""
+        self.accumulator += frame_time
+        ticks = 0
+        while self.accumulator >= self.tick and ticks < self.max_catch_up:
+            self.update(self.tick)
+            self.accumulator -= self.tick
+            ticks += 1
+
+        if self.accumulator >= self.tick:
+            # Too far behind to catch up; drop the backlog instead of spiralling
+            self.accumulator %= self.tick
+        return ticks
+
+    def render(self, alpha=1.0):
+        """Draw the game; alpha is how far we are between the last two ticks"""
+        if not self.dirty_rects:
+            self.screen.fill(BLACK)
+            self.game_manager.render(alpha)
+            self.render_profiler_overlay()
+            pygame.display.flip()
+            return
+
+        # Only push the regions that changed, unless most of the screen did
+        self.game_manager.render(alpha)
+        self.render_profiler_overlay()
+        rects = self.game_manager.dirty_regions.take_updates()
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    def render_profiler_overlay(self):
+        if not self.show_profiler:
+            return
+        # Statistics are recomputed a few times a second, not every frame
+        if self.frame_count % self.profiler_refresh_frames == 0 or not self.profiler_rows:
+            self.profiler_rows = self.profiler.overlay_rows()
+        self.game_manager.ui_manager.render_profiler_overlay(self.profiler_rows)
+
+    def run_frame(self, frame_time, render=True, fixed_step=True):
+        """Handle events, update and optionally render one frame, timing each.
+
+        With fixed_step the frame time goes through the tick accumulator;
+        otherwise it is passed to update() as is.
+        """
+        profiler = self.profiler
+        frame_start = time.perf_counter()
+        with profiler.section("frame.handle_events"):
+            self.handle_events()
+        with profiler.section("frame.update"):
+            if fixed_step:
+                self.advance(frame_time)
+            else:
+                self.update(frame_time)
+        if render:
+            with profiler.section("frame.render"):
+                self.render(self.accumulator / self.tick if fixed_step else 1.0)
+        profiler.record("frame", time.perf_counter() - frame_start)
+        self.frame_count += 1
 
     def run(self):
+        if self.headless:
+            return self.run_headless()
+
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            frame_time = self.clock.tick(FPS) / 1000.0  # Real time since last frame
 
-            self.handle_events()
-            self.update(dt)
-            self.render()
+            self.run_frame(frame_time)
 
             if self.game_manager.should_quit:
                 self.running = False
 
+        self.quit()
+
+    def quit(self):
+        if self.game_manager.recorder:
+            self.game_manager.recorder.close()
         pygame.quit()
-        sys.exit()
+
+    def run_headless(self, nights=1, render_every=0):
+        """Play nights with a synthetic dt as fast as possible.
+
+        Nothing waits on the clock. Lost nights are retried and won nights
+        advance, until `nights` nights have finished. Pass render_every=N to
+        also render every Nth frame to the dummy display.
+        """
+        results = []
+        frame = 0
+        while self.running and len(results) < nights:
+            frame += 1
+            self.run_frame(self.headless_dt, render_every and frame % render_every == 0,
+                           fixed_step=False)
+
+            game_manager = self.game_manager
+            if game_manager.game_state in ("victory", "game_over"):
+                results.append({
+                    "night": game_manager.current_night,
+                    "result": game_manager.game_state,
+                    "hour": game_manager.current_hour,
+                    "power": game_manager.power_system.current_power,
+                    "killed_by": (game_manager.jumpscare_animatronic.name
+                                  if game_manager.jumpscare_animatronic else None),
+                    "frames": frame,
+                })
+                frame = 0
+                if game_manager.game_state == "victory":
+                    game_manager.start_next_night()
+                else:
+                    game_manager.restart_night()
+
+            if self.game_manager.should_quit:
+                self.running = False
+
+        self.quit()
+        return results
+
+
+def seed_argument(value):
+    """argparse type for --seed: an integer that fits a replay log header"""
+    from game.replay import MAX_SEED
+    seed = int(value)
+    if not 0 <= seed <= MAX_SEED:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and {MAX_SEED}")
+    return seed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pizza Nights - Horror Survival")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without display or audio, faster than real time")
+    parser.add_argument("--nights", type=int, default=1,
+                        help="number of nights to play in headless mode")
+    parser.add_argument("--dt", type=float, default=1.0 / FPS,
+                        help="synthetic frame time in seconds for headless mode")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="update only changed screen regions instead of flipping every frame")
+    parser.add_argument("--render-every", type=int, default=0,
+                        help="render every Nth frame in headless mode (0 disables)")
+    parser.add_argument("--tick-rate", type=float, default=SIMULATION_TICK_RATE,
+                        help="fixed simulation ticks per second, independent of FPS")
+    parser.add_argument("--max-catch-up", type=int, default=MAX_CATCH_UP_TICKS,
+                        help="most simulation ticks run per rendered frame after a hitch")
+    parser.add_argument("--seed", type=seed_argument, help="seed for every random draw in the game (0 to 2**64-1)")
+    parser.add_argument("--record", help="log the seed and all inputs to this replay file")
+    parser.add_argument("--replay", help="re-run a replay file headless and check its final state")
+    parser.add_argument("--profile", action="store_true",
+                        help="record per-frame subsystem timings from the start (F3 shows them)")
+    parser.add_argument("--profile-output",
+                        help="write timing statistics here on exit (.csv or .json)")
+    return parser.parse_args()
+
+
+def run_replay(path):
+    """Headless replay; returns a process exit code"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    from game.replay import replay
+
+    try:
+        expected, actual = replay(path)
+    except ValueError as e:
+        print(f"❌ Cannot replay {path}: {e}")
+        return 1
+    if expected == actual:
+        print(f"✅ Replay matches: {actual}")
+        return 0
+
+    print("❌ Replay diverged")
+    for key in sorted(set(expected or {}) | set(actual)):
+        if (expected or {}).get(key) != actual.get(key):
+            print(f"  {key}: recorded {(expected or {}).get(key)!r}, replayed {actual.get(key)!r}")
+    return 1
 
 
-if __name__ == "main":
-    game = PizzaNights()
-    game.run()
+if __name__ == "__main__":
+    args = parse_args()
+    if args.replay:
+        sys.exit(run_replay(args.replay))
+    game = PizzaNights(headless=args.headless, headless_dt=args.dt, dirty_rects=args.dirty_rects,
+                       profile=args.profile or bool(args.profile_output),
+                       tick_rate=args.tick_rate, max_catch_up=args.max_catch_up,
+                       seed=args.seed, record=args.record)
+    if args.headless:
+        for result in game.run_headless(args.nights, args.render_every):
+            print(result)
+    else:
+        game.run()
+    if args.profile_output:
+        game.profiler.export(args.profile_output)
+    sys.exit()
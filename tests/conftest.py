@@ -0,0 +1,50 @@
+import os
+import sys
+
+# Headless: no window and no audio device; must be set before pygame.init
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Run from the repository root like the game and tools do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+
+from config import *
+
+
+@pytest.fixture
+def make_game():
+    """Build headless GameManagers with a given seed"""
+    from game.audio_manager import NullAudioManager
+    from game.game_manager import GameManager
+
+    pygame.init()
+
+    def make(seed):
+        return GameManager(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), NullAudioManager(), seed=seed)
+
+    yield make
+    pygame.quit()
+
+
+def click(game_manager, pos):
+    """Left click through handle_event, the path main.py --record logs"""
+    game_manager.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+
+
+def play(game_manager, ticks, rng):
+    """Drive a game with random control presses and camera button clicks"""
+    for _ in range(ticks):
+        if rng.random() < 0.01:
+            game_manager.handle_control_input(rng.choice(["left_door", "right_door", "left_light",
+                                                          "right_light", "camera"]))
+        if game_manager.camera_system.is_camera_up and rng.random() < 0.02:
+            location = rng.choice(list(CAMERA_LOCATIONS))
+            click(game_manager, game_manager.ui_manager.camera_buttons[location].center)
+        game_manager.update(1.0 / SIMULATION_TICK_RATE)
+        if game_manager.game_state == "game_over":
+            game_manager.restart_night()
+        elif game_manager.game_state == "victory":
+            game_manager.start_next_night()
@@ -0,0 +1,67 @@
+import os
+import wave
+
+import pygame
+import pytest
+
+from assets.asset_loader import AssetLoader, build_manifest
+from assets.build_pack import build_pack
+
+
+def write_wav(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(22050)
+        f.writeframes(b"\0\0" * 100)
+
+
+@pytest.fixture
+def sound_folders(tmp_path, monkeypatch):
+    """Loose sounds in a scratch copy of the asset layout; hum.wav is in both folders"""
+    monkeypatch.chdir(tmp_path)
+    for path in ("assets/sounds/hum.wav", "assets/sounds/door.wav", "assets/generated/hum.wav"):
+        write_wav(path)
+    return {"hum.wav": os.path.join("assets/generated", "hum.wav"),
+            "door.wav": os.path.join("assets/sounds", "door.wav")}
+
+
+def test_generated_sounds_override_base_sounds(sound_folders):
+    loader = AssetLoader()
+    loader.load_all_assets()
+    assert loader.manifest == sound_folders
+
+
+def test_startup_reads_the_built_manifest(sound_folders, monkeypatch):
+    build_manifest()
+
+    def no_walk(folder):
+        raise AssertionError(f"walked {folder} despite the manifest")
+
+    monkeypatch.setattr(os, "walk", no_walk)
+    loader = AssetLoader()
+    loader.load_all_assets()
+    assert loader.manifest == sound_folders
+    assert loader.sounds.get("hum.wav") is not None
+
+
+def test_images_share_one_key_with_and_without_the_pack(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("assets/images")
+    pygame.init()
+    surface = pygame.Surface((4, 3))
+    surface.fill((200, 10, 10))
+    pygame.image.save(surface, "assets/images/door.png")
+
+    loose = AssetLoader()
+    assert loose.get_image("door.png") is loose.get_image("assets/images/door.png")
+
+    build_pack("assets.pack", [], ["assets/images"])
+    packed = AssetLoader()
+    packed.load_pack("assets.pack")
+    image = packed.get_image("assets/images/door.png")
+    assert image is packed.get_image("door.png")
+    assert image.get_at((0, 0))[:3] == (200, 10, 10)
+    del image
+    packed.close()
@@ -0,0 +1,24 @@
+import pygame
+
+from assets.asset_loader import AssetLoader
+from config import *
+from game.audio_manager import AudioManager
+from game.game_manager import GameManager
+
+
+def test_unstreamable_mixer_falls_back_to_looped_wavs():
+    pygame.init()
+    pygame.mixer.quit()
+    pygame.mixer.init(frequency=22050, size=16, channels=2)  # unsigned 16-bit
+    try:
+        assert pygame.mixer.get_init()[1] == 16
+        audio_manager = AudioManager(AssetLoader())
+        game = GameManager(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), audio_manager, seed=1)
+
+        assert game.game_state == "playing"
+        assert not audio_manager.stream_procedural
+        assert audio_manager.ambient_stream is None
+        assert not audio_manager.streams
+    finally:
+        pygame.mixer.quit()
+        pygame.quit()
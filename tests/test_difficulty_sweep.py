@@ -0,0 +1,11 @@
+from config import SIMULATION_TICK_RATE
+from tools.difficulty_sweep import DEFAULT_CONFIG, build_tasks, load_config, run_chunk, summarise
+
+
+def test_default_player_survives_night_one():
+    tasks = build_tasks(load_config(DEFAULT_CONFIG), {}, nights_per_point=200, chunk_size=200,
+                        seed=0, dt=1.0 / SIMULATION_TICK_RATE, nights=[1])
+    report = summarise(tasks, [run_chunk(task) for task in tasks])
+
+    assert report[0]["model"] == "game"
+    assert report[0]["survival_rate"] > 0
@@ -0,0 +1,33 @@
+import numpy as np
+
+from game.environment import ANIMATRONIC_NAMES, SEES_OFFSET, WAIT, NightEnv, VectorNightEnv
+
+
+def test_light_shows_the_hall(make_game):
+    env = NightEnv(seed=3)
+    env.reset()
+    game = env.game_manager
+    bonnie = game.ai_director.animatronics["bonnie"]
+    bonnie.move_to_node(bonnie.graph.index["west_hall"])
+    column = SEES_OFFSET + ANIMATRONIC_NAMES.index("bonnie")
+
+    assert env.observation()[column] == 0
+    game.right_light_on = True
+    assert env.observation()[column] == 0
+    game.left_light_on = True
+    assert env.observation()[column] == 1
+
+
+def test_final_observation_is_from_before_the_reset():
+    env = VectorNightEnv(32, seed=0, ticks_per_step=60)
+    env.reset()
+    left_door = np.full(32, 1)
+    obs, _, terminated, _, info = env.step(left_door)
+    while not terminated.any():
+        obs, _, terminated, _, info = env.step(np.full(32, WAIT))
+
+    final = info["final_observation"]
+    assert final.shape == obs.shape
+    # Power is never back at full by the time a night ends, but resets to it
+    assert (final[terminated, 0] < 1).all()
+    assert (obs[terminated, 0] == 1).all()
@@ -0,0 +1,37 @@
+import io
+import random
+
+import pytest
+
+from conftest import play
+from game.replay import ReplayRecorder, read_replay, replay
+
+
+def record(make_game, seed, ticks):
+    game = make_game(seed=seed)
+    log = io.BytesIO()
+    game.attach_recorder(ReplayRecorder(log))
+    play(game, ticks, random.Random(seed))
+    game.recorder.close()
+    return log.getvalue()
+
+
+@pytest.mark.parametrize("seed", [7, 11, 24, 3, 19, 28])
+def test_replay_matches_recording(make_game, seed):
+    data = record(make_game, seed=seed, ticks=8000)
+    expected, actual = replay(io.BytesIO(data))
+    assert expected is not None
+    assert actual == expected
+
+
+def test_truncated_log_is_rejected(make_game):
+    data = record(make_game, seed=5, ticks=600)
+    for cut in (1, 10, len(data) // 2, len(data) - 10):
+        with pytest.raises(ValueError, match="truncated replay log"):
+            read_replay(io.BytesIO(data[:cut]))
+
+
+def test_out_of_range_seed_is_rejected(make_game):
+    game = make_game(seed=2 ** 64)
+    with pytest.raises(ValueError):
+        game.attach_recorder(ReplayRecorder(io.BytesIO()))
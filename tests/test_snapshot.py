@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from conftest import play
+from game.replay import state_summary
+from game.snapshot import GameSnapshot
+
+
+@pytest.mark.parametrize("warmup", [300, 2500, 6000])
+def test_restore_replays_identically(make_game, warmup):
+    game = make_game(seed=7)
+    play(game, warmup, random.Random(warmup))
+
+    snapshot = game.snapshot()
+    play(game, 2000, random.Random(1))
+    expected = state_summary(game)
+
+    game.restore_snapshot(snapshot)
+    play(game, 2000, random.Random(1))
+    assert state_summary(game) == expected
+
+
+def test_bytes_round_trip(make_game):
+    game = make_game(seed=3)
+    play(game, 1500, random.Random(0))
+
+    data = game.snapshot().to_bytes()
+    play(game, 1000, random.Random(2))
+    expected = state_summary(game)
+
+    game.restore_snapshot(GameSnapshot.from_bytes(data))
+    play(game, 1000, random.Random(2))
+    assert state_summary(game) == expected
+    assert GameSnapshot.from_bytes(data).to_bytes() == data
+
+
+def test_rejects_other_formats():
+    with pytest.raises(ValueError):
+        GameSnapshot.from_bytes(b"XXXX" + bytes(64))
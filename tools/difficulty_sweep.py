@@ -0,0 +1,209 @@
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from config import *
+from game.batch_simulator import BatchNightSimulator, ScriptedPlayer, default_roster, roster_from_config
+
+DEFAULT_CONFIG = os.path.join("assets", "data", "game_config.json")
+
+# Settings that come from difficulty_settings and feed BatchNightSimulator
+DIFFICULTY_KEYS = ("ai_aggression_multiplier", "power_drain_multiplier", "hour_duration")
+
+# Which game the nights are simulated as. "game" is what GameManager runs:
+# the animatronic classes' aggression and move intervals, HOUR_DURATION
+# hours and no multipliers. "config" applies difficulty_settings and
+# animatronic_configs from game_config.json, which the game does not read yet.
+MODELS = ("game", "config")
+GAME_DIFFICULTY = {"ai_aggression_multiplier": 1.0, "power_drain_multiplier": 1.0,
+                   "hour_duration": HOUR_DURATION}
+
+# Settings that feed the ScriptedPlayer
+PLAYER_KEYS = ("reaction_rate", "camera_duty", "foxy_check_interval", "light_duty", "warning")
+
+POWER_BINS = np.linspace(0, 100, 11)
+
+
+def load_config(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def model_roster(config, model):
+    """Animatronic roster the given model simulates"""
+    if model == "config":
+        return roster_from_config(config["animatronic_configs"])
+    return default_roster()
+
+
+def night_settings(config, night, model):
+    """Difficulty settings the given model uses for a night"""
+    if model == "config":
+        settings = config["difficulty_settings"][f"night_{night}"]
+        return {key: settings[key] for key in DIFFICULTY_KEYS if key in settings}
+    return dict(GAME_DIFFICULTY)
+
+
+def parse_grid(entries):
+    """Turn ["key=a,b,c", ...] into {key: [a, b, c]}"""
+    grid = {}
+    for entry in entries:
+        key, _, values = entry.partition("=")
+        if key not in DIFFICULTY_KEYS + PLAYER_KEYS:
+            raise ValueError(f"Unknown grid parameter: {key}")
+        grid[key] = [float(value) for value in values.split(",")]
+    return grid
+
+
+def grid_points(grid):
+    """Every combination of grid values, or a single empty point"""
+    keys = sorted(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def run_chunk(task):
+    """Worker entry point: simulate one seeded batch of nights"""
+    settings = task["settings"]
+    seed = np.random.SeedSequence(task["seed"], spawn_key=task["spawn_key"])
+
+    sim = BatchNightSimulator(
+        task["count"], night_number=task["night"], seed=seed, roster=task["roster"],
+        ai_aggression_multiplier=settings["ai_aggression_multiplier"],
+        power_drain_multiplier=settings["power_drain_multiplier"],
+        hour_duration=settings["hour_duration"])
+    player = ScriptedPlayer(**{k: settings[k] for k in PLAYER_KEYS if k in settings})
+    results = sim.run(player, dt=task["dt"])
+
+    survived = len(results["power_at_6am"])
+    return task["key"], survived, results["power_at_6am"], results["causes_of_death"]
+
+
+def build_tasks(config, grid, nights_per_point, chunk_size, seed, dt, nights=None, model="game"):
+    """Split every (night, grid point) into deterministic seeded chunks"""
+    tasks = []
+    points = grid_points(grid)
+    roster = model_roster(config, model)
+    for night in sorted(int(key.split("_")[-1]) for key in config["difficulty_settings"]):
+        if nights and night not in nights:
+            continue
+        for point_index, point in enumerate(points):
+            settings = night_settings(config, night, model)
+            settings.update(point)
+            remaining = nights_per_point
+            chunk = 0
+            while remaining > 0:
+                count = min(chunk_size, remaining)
+                tasks.append({
+                    "key": (night, point_index),
+                    "night": night,
+                    "point": point,
+                    "settings": settings,
+                    "model": model,
+                    "roster": roster,
+                    "count": count,
+                    "seed": seed,
+                    # Seeds depend only on the task, never on worker scheduling
+                    "spawn_key": (night, point_index, chunk),
+                    "dt": dt,
+                })
+                remaining -= count
+                chunk += 1
+    return tasks
+
+
+def summarise(tasks, chunk_results):
+    """Merge chunk results into one report entry per night and grid point"""
+    merged = {}
+    for task in tasks:
+        entry = merged.setdefault(task["key"], {
+            "night": task["night"],
+            "model": task["model"],
+            "parameters": task["settings"],
+            "nights": 0,
+            "survived": 0,
+            "power": [],
+            "causes_of_death": {},
+        })
+        entry["nights"] += task["count"]
+
+    for key, survived, power, causes in chunk_results:
+        entry = merged[key]
+        entry["survived"] += survived
+        entry["power"].append(power)
+        for cause, count in causes.items():
+            entry["causes_of_death"][cause] = entry["causes_of_death"].get(cause, 0) + count
+
+    report = []
+    for key in sorted(merged):
+        entry = merged.pop(key)
+        power = np.concatenate(entry.pop("power"))
+        histogram, _ = np.histogram(power, bins=POWER_BINS)
+        entry["survival_rate"] = entry["survived"] / entry["nights"]
+        entry["power_at_6am"] = {
+            "mean": float(power.mean()) if power.size else None,
+            "percentiles": ({str(p): float(np.percentile(power, p)) for p in (10, 50, 90)}
+                            if power.size else {}),
+            "histogram": {"bins": POWER_BINS.tolist(), "counts": histogram.tolist()},
+        }
+        report.append(entry)
+    return report
+
+
+def print_report(report):
+    if report:
+        print(f"Model: {report[0]['model']}")
+    print(f"{'night':>5} {'survival':>9} {'power p50':>9}  parameters / causes of death")
+    for entry in report:
+        median = entry["power_at_6am"]["percentiles"].get("50")
+        median = f"{median:9.1f}" if median is not None else f"{'-':>9}"
+        print(f"{entry['night']:>5} {entry['survival_rate']:>9.1%} {median}  {entry['parameters']}")
+        print(f"{'':>26}{entry['causes_of_death']}")
+
+
+def main():
+    """Run from the repository root: python -m tools.difficulty_sweep"""
+    parser = argparse.ArgumentParser(description="Monte Carlo difficulty sweep over game_config.json")
+    parser.add_argument("--config", default=DEFAULT_CONFIG)
+    parser.add_argument("--model", choices=MODELS, default="game",
+                        help="game: the roster and timing the game runs (default); "
+                             "config: game_config.json difficulty and animatronic settings")
+    parser.add_argument("--grid", action="append", default=[],
+                        help="parameter=v1,v2,... (difficulty or player setting); repeatable")
+    parser.add_argument("--night", type=int, action="append",
+                        help="only sweep this night; repeatable")
+    parser.add_argument("--samples", type=int, default=10000,
+                        help="simulated nights per night and grid point")
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dt", type=float, default=1.0 / SIMULATION_TICK_RATE,
+                        help="simulation step in seconds (default: one game tick)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    tasks = build_tasks(config, parse_grid(args.grid), args.samples, args.chunk_size,
+                        args.seed, args.dt, args.night, args.model)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        chunk_results = list(pool.map(run_chunk, tasks))
+    elapsed = time.perf_counter() - start
+
+    report = summarise(tasks, chunk_results)
+    print_report(report)
+    total = sum(task["count"] for task in tasks)
+    print(f"\n{total} nights in {elapsed:.1f}s on {args.workers} workers")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
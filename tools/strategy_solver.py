@@ -0,0 +1,286 @@
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from config import *
+from game.batch_simulator import BatchNightSimulator, SURVIVED
+from game.location_graph import get_location_graph
+from tools.difficulty_sweep import DEFAULT_CONFIG, MODELS, load_config, model_roster, night_settings
+
+# Policy table layout: one row per combination of these features...
+POWER_BUCKETS = 4
+COVE_ALERT = 3.0  # seconds the cove has gone unwatched before it counts as overdue
+# Threat levels per door: 0 clear, 1 something in the hall, 2 it may step into the doorway next tick
+THREAT_LEVELS = 3
+FEATURES = (("hour", TOTAL_HOURS), ("power", POWER_BUCKETS), ("left_threat", THREAT_LEVELS),
+            ("right_threat", THREAT_LEVELS), ("cove_overdue", 2))
+CELLS = math.prod(size for _, size in FEATURES)
+
+# ...and one on/off decision per control in each row
+DECISIONS = ("left_door", "right_door", "watch_cove", "lights")
+
+# score = survival rate + POWER_WEIGHT * mean power fraction at 6 AM
+#         + TIME_WEIGHT * mean fraction of the night survived
+# The last term only breaks ties between tables that all lose, early in the search
+POWER_WEIGHT = 0.1
+TIME_WEIGHT = 0.1
+
+# Written into every report entry: the features come from hidden simulator
+# state, so the tables cannot be played from what NightEnv observes
+ORACLE_NOTE = ("threat features read the hidden move timers and hall occupancy; "
+               "lights only cost power in BatchNightSimulator, so tables are oracle-only "
+               "and their survival rate is an upper bound")
+
+
+class TablePlayer:
+    """Vectorised player that looks its controls up in policy tables.
+
+    Nights are split into consecutive runs of nights_per_table, each
+    played by its own table, so many candidate tables share one
+    simulator. The features are read from the full simulator state, so
+    the player always knows what is in each hall and when it will next
+    try to move. That makes the survival rate of the best table a ceiling
+    for real players, who have to find out with lights and cameras.
+    """
+
+    def __init__(self, tables, nights_per_table):
+        self.tables = np.asarray(tables, dtype=bool).reshape(-1, CELLS, len(DECISIONS))
+        self.table_of_night = np.repeat(np.arange(len(self.tables)), nights_per_table)
+
+    def reset(self, sim):
+        pass
+
+    def threat_levels(self, sim, dt):
+        """Per-night threat level at the left and right doors"""
+        distance = get_location_graph().office_distance[sim.locations()]
+        # Steps add dt to the move timers before comparing them
+        due = (distance == 0) | ((distance == 1) & (sim.move_timer + dt >= sim.move_thresholds()))
+        level = np.where(due, 2, np.where(distance == 1, 1, 0))
+
+        left = np.zeros(sim.n_nights, dtype=int)
+        right = np.zeros(sim.n_nights, dtype=int)
+        for i in range(len(sim.names)):
+            side = left if sim.door_side[i] == 0 else right
+            np.maximum(side, level[i], out=side)
+        return left, right
+
+    def cells(self, sim, dt):
+        """Policy table row for every night"""
+        hour = np.minimum(sim.current_hour, TOTAL_HOURS - 1)
+        power = np.minimum((sim.current_power / TOTAL_POWER * POWER_BUCKETS).astype(int),
+                           POWER_BUCKETS - 1)
+        left_threat, right_threat = self.threat_levels(sim, dt)
+        cove_overdue = (sim.camera_check_timer[sim.is_runner] >= COVE_ALERT).any(axis=0)
+
+        cell = hour
+        for value, (_, size) in zip((power, left_threat, right_threat, cove_overdue), FEATURES[1:]):
+            cell = cell * size + value
+        return cell
+
+    def controls(self, sim, dt):
+        decisions = self.tables[self.table_of_night, self.cells(sim, dt)] & ~sim.is_power_out[:, None]
+        return {
+            "camera_active": decisions[:, 2],
+            "camera_on_runner": decisions[:, 2],
+            "left_door_closed": decisions[:, 0],
+            "right_door_closed": decisions[:, 1],
+            "left_light_on": decisions[:, 3],
+            "right_light_on": decisions[:, 3],
+        }
+
+
+def heuristic_table():
+    """Starting point for the search: close a door only when something may
+    step into it next tick, glance at the cove once it is overdue, and keep
+    the lights off"""
+    table = np.zeros((CELLS, len(DECISIONS)), dtype=bool)
+    for cell, row in enumerate(policy_rows(table)):
+        table[cell] = (row["left_threat"] == 2, row["right_threat"] == 2, row["cove_overdue"], False)
+    return table
+
+
+def evaluate(task):
+    """Worker entry point: play a few policy tables over seeded batches of nights"""
+    tables, count = task["tables"], task["count"]
+    sim = BatchNightSimulator(
+        len(tables) * count, night_number=task["night"],
+        seed=np.random.SeedSequence(task["seed"], spawn_key=task["spawn_key"]),
+        roster=task["roster"], **task["settings"])
+    sim.run(TablePlayer(tables, count), dt=task["dt"])
+
+    survived = (sim.status == SURVIVED).reshape(len(tables), count)
+    power = np.nan_to_num(sim.power_at_6am).reshape(len(tables), count)
+    lasted = np.minimum(sim.elapsed / sim.night_duration, 1).reshape(len(tables), count)
+    scores = (survived.mean(axis=1) + POWER_WEIGHT * power.mean(axis=1) / TOTAL_POWER
+              + TIME_WEIGHT * lasted.mean(axis=1))
+    return (task["night"], task["candidates"], scores, survived.sum(axis=1),
+            [power[i][survived[i]] for i in range(len(tables))])
+
+
+def wilson_interval(successes, trials, z=1.96):
+    """95% confidence interval for a survival rate"""
+    if trials == 0:
+        return 0.0, 1.0
+    rate = successes / trials
+    centre = (rate + z * z / (2 * trials)) / (1 + z * z / trials)
+    margin = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / (1 + z * z / trials)
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def solve(config, nights, pool, iterations=12, population=32, elite_fraction=0.2,
+          samples=256, final_samples=4096, smoothing=0.7, prior_confidence=0.95,
+          tables_per_task=8, seed=0, dt=1.0 / SIMULATION_TICK_RATE, model="game"):
+    """Cross-entropy search for each night's best policy table.
+
+    Each night keeps an independent on-probability for every table entry,
+    starting at prior_confidence towards heuristic_table() (0.5 searches
+    from scratch, which needs far more iterations). Every iteration
+    samples `population` tables per night, always including the most
+    likely one, scores each on `samples` simulated nights, and moves the
+    probabilities toward the elite. Tables go to the pool in groups of
+    tables_per_task, which share one simulator, with every night's groups
+    submitted together. The best table seen is finally scored on
+    final_samples nights the search never saw. dt defaults to the game's
+    own tick so the simulated nights step the way GameManager does, and
+    model picks the roster and difficulty settings (see difficulty_sweep.MODELS).
+    """
+    rng = np.random.default_rng(seed)
+    roster = model_roster(config, model)
+    settings = {night: night_settings(config, night, model) for night in nights}
+    prior = np.where(heuristic_table(), prior_confidence, 1 - prior_confidence)
+    probabilities = {night: prior.copy() for night in nights}
+    best = {night: (-np.inf, None) for night in nights}
+    elite_count = max(1, int(population * elite_fraction))
+    history = {night: [] for night in nights}
+
+    def task(night, candidates, tables, count, spawn_key):
+        return {"night": night, "candidates": candidates, "tables": tables, "count": count,
+                "settings": settings[night], "roster": roster,
+                "seed": seed, "spawn_key": spawn_key, "dt": dt}
+
+    for iteration in range(iterations):
+        tables, tasks = {}, []
+        for night in nights:
+            tables[night] = rng.random((population, CELLS, len(DECISIONS))) < probabilities[night]
+            tables[night][0] = probabilities[night] > 0.5
+            for chunk, first in enumerate(range(0, population, tables_per_task)):
+                candidates = list(range(first, min(first + tables_per_task, population)))
+                tasks.append(task(night, candidates, tables[night][candidates], samples,
+                                  (night, iteration, chunk)))
+
+        scores = {night: np.zeros(population) for night in nights}
+        for night, candidates, chunk_scores, _, _ in pool.map(evaluate, tasks):
+            scores[night][candidates] = chunk_scores
+
+        for night in nights:
+            top = int(np.argmax(scores[night]))
+            if scores[night][top] > best[night][0]:
+                best[night] = (scores[night][top], tables[night][top])
+            elite = np.argsort(scores[night])[-elite_count:]
+            target = tables[night][elite].mean(axis=0)
+            probabilities[night] = smoothing * target + (1 - smoothing) * probabilities[night]
+            history[night].append(float(scores[night][elite].mean()))
+        print(f"🔁 Iteration {iteration + 1}/{iterations}: elite score "
+              + ", ".join(f"night {night} {history[night][-1]:.3f}" for night in nights))
+
+    tasks = [task(night, [0], best[night][1][None], final_samples, (night, iterations))
+             for night in nights]
+    report = []
+    for night, _, scores, survived, power in pool.map(evaluate, tasks):
+        survived, power = int(survived[0]), power[0]
+        low, high = wilson_interval(survived, final_samples)
+        report.append({
+            "night": night,
+            "model": model,
+            "parameters": settings[night],
+            "dt": dt,
+            "oracle_only": True,
+            "note": ORACLE_NOTE,
+            "survival_ceiling": survived / final_samples,
+            "survival_interval": [low, high],
+            "power_at_6am_mean": float(power.mean()) if power.size else None,
+            "score": float(scores[0]),
+            "elite_score_history": history[night],
+            "policy": policy_rows(best[night][1]),
+        })
+    return report
+
+
+def policy_rows(table):
+    """Policy table as one readable row per feature combination"""
+    rows = []
+    for cell, decisions in enumerate(table):
+        row = {}
+        for name, size in reversed(FEATURES):
+            cell, row[name] = divmod(cell, size)
+        row = {name: row[name] for name, _ in FEATURES}
+        row.update({name: bool(value) for name, value in zip(DECISIONS, decisions)})
+        rows.append(row)
+    return rows
+
+
+def print_report(report):
+    if report:
+        print(f"Model: {report[0]['model']}, dt {report[0]['dt']:.4f}s; {report[0]['note']}")
+    print(f"{'night':>5} {'ceiling':>9} {'95% interval':>16} {'power':>8}  parameters")
+    for entry in report:
+        low, high = entry["survival_interval"]
+        power = entry["power_at_6am_mean"]
+        power = f"{power:8.1f}" if power is not None else f"{'-':>8}"
+        print(f"{entry['night']:>5} {entry['survival_ceiling']:>9.1%} {f'{low:.1%}-{high:.1%}':>16} "
+              f"{power}  {entry['parameters']}")
+
+
+def main():
+    """Run from the repository root: python -m tools.strategy_solver"""
+    parser = argparse.ArgumentParser(description="Search for each night's best door, light and camera policy")
+    parser.add_argument("--config", default=DEFAULT_CONFIG)
+    parser.add_argument("--model", choices=MODELS, default="game",
+                        help="game: the roster and timing the game runs (default); "
+                             "config: game_config.json difficulty and animatronic settings")
+    parser.add_argument("--night", type=int, action="append",
+                        help="only solve this night; repeatable")
+    parser.add_argument("--iterations", type=int, default=12)
+    parser.add_argument("--population", type=int, default=32, help="policy tables tried per iteration")
+    parser.add_argument("--elite-fraction", type=float, default=0.2)
+    parser.add_argument("--prior-confidence", type=float, default=0.95,
+                        help="initial probability of following the heuristic table (0.5 ignores it)")
+    parser.add_argument("--samples", type=int, default=256, help="simulated nights per policy table")
+    parser.add_argument("--tables-per-task", type=int, default=8,
+                        help="policy tables simulated together by one worker task")
+    parser.add_argument("--final-samples", type=int, default=4096,
+                        help="held-out nights used to score each night's final table")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dt", type=float, default=1.0 / SIMULATION_TICK_RATE,
+                        help="simulation step in seconds (default: one game tick)")
+    parser.add_argument("--output", help="write the JSON report and policy tables to this file")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    nights = args.night or sorted(int(key.split("_")[-1]) for key in config["difficulty_settings"])
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        report = solve(config, nights, pool, args.iterations, args.population, args.elite_fraction,
+                       args.samples, args.final_samples, prior_confidence=args.prior_confidence,
+                       tables_per_task=args.tables_per_task, seed=args.seed, dt=args.dt,
+                       model=args.model)
+    elapsed = time.perf_counter() - start
+
+    print()
+    print_report(report)
+    print(f"\n✅ Solved {len(nights)} night(s) in {elapsed:.1f}s on {args.workers} workers")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()